@@ -1,6 +1,6 @@
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+from parser_backends import make_soup
 import json
 import time
 import re
@@ -30,7 +30,7 @@ class AdvancedCompanyResearcher:
                 if response.status_code != 200:
                     continue
                     
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 
                 # Look for company cards/listings
                 company_cards = soup.find_all(['div', 'article'], class_=re.compile(r'company|card', re.I))
@@ -0,0 +1,305 @@
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+try:
+    import aiohttp
+except ImportError:  # Only needed for the async scan mode
+    aiohttp = None
+
+from career_probe import race_probe_async
+from failure_ledger import CooldownActive
+from http_pool import FetchResult, SessionPool
+from rate_limiter import THROTTLE_STATUSES, HostThrottled, parse_retry_after
+from scan_budget import BudgetExceeded, Deadline, budget_timeout, current_deadline, deadline_scope
+
+logger = logging.getLogger(__name__)
+
+# Mirrors the Retry strategy used by the pooled requests sessions;
+# 429/503 go through the rate limiter's per-host backoff instead
+RETRY_STATUSES = {500, 502, 504}
+MAX_RETRIES = 2
+BACKOFF_FACTOR = 0.5
+
+
+class AsyncScanEngine:
+    """asyncio alternative to the ThreadPoolExecutor path in run_scan.
+
+    Fetching runs on an aiohttp event loop with many requests in flight, while
+    parsing and extraction reuse the scraper's own synchronous helpers on a
+    small thread pool so the loop is never blocked by BeautifulSoup. ATS API
+    requests go through the scraper's synchronous sessions on a separate I/O
+    pool, so their network and rate-limit waits never hold up parsing.
+    """
+
+    def __init__(self, scraper, max_in_flight: int = 200, parse_workers: int = 4, max_companies: int = 50,
+                 io_workers: int = 8):
+        if aiohttp is None:
+            raise RuntimeError("Async scan mode needs aiohttp: pip install aiohttp")
+
+        self.scraper = scraper
+        self.max_in_flight = max_in_flight
+        self.parse_workers = parse_workers
+        self.max_companies = max_companies
+        self.io_workers = io_workers
+
+        self.session = None
+        self.parse_executor = None
+        self.io_executor = None
+
+    def run(self, companies) -> List:
+        """Scan all companies and return their jobs in company order"""
+        return asyncio.run(self.scan(companies))
+
+    async def scan(self, companies) -> List:
+        """Scan companies concurrently on one event loop.
+
+        At most max_companies are in progress at once, started in queue order,
+        so the scheduler's priorities hold and companies still waiting when the
+        scan deadline nears are never started.
+        """
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight, ssl=False, ttl_dns_cache=300)
+        self.parse_executor = ThreadPoolExecutor(max_workers=self.parse_workers, thread_name_prefix='parse')
+        self.io_executor = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='ats-io')
+        results: List = [[] for _ in companies]
+        queue = deque(enumerate(companies))
+        all_jobs = []
+
+        async def worker():
+            while queue:
+                index, company = queue.popleft()
+                try:
+                    results[index] = await self.scrape_company(company)
+                except Exception as e:
+                    results[index] = e
+
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                self.session = session
+                await asyncio.gather(*(worker() for _ in range(max(1, min(self.max_companies, len(companies))))))
+
+            for company, result in zip(companies, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing {company.name}: {result}")
+                else:
+                    all_jobs.extend(result)
+        finally:
+            self.parse_executor.shutdown(wait=True)
+            self.io_executor.shutdown(wait=True)
+            self.session = None
+
+        return all_jobs
+
+    async def fetch_page(self, url: str, timeout: int) -> FetchResult:
+        """GET a page politely, backing off per host on 429/503 and retrying 5xx like the sync sessions"""
+        host = SessionPool.host_key(url)
+        headers = self.scraper.session_pool.headers_for(url)
+        headers['Accept-Encoding'] = 'gzip, deflate'
+        http_cache = self.scraper.http_cache
+        if http_cache:
+            headers.update(http_cache.request_headers(url))
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        limiter = self.scraper.rate_limiter
+        max_throttles = self.scraper.settings.get('throttle_max_requeues', 5)
+        attempt = throttles = 0
+
+        while True:
+            async with limiter.limit_async(host):
+                async with self.session.get(url, headers=headers, timeout=client_timeout,
+                                            allow_redirects=True) as response:
+                    page = FetchResult(
+                        url=url,
+                        final_url=str(response.url),
+                        status_code=response.status,
+                        content=await response.read(),
+                        headers=dict(response.headers)
+                    )
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+            if page.status_code in THROTTLE_STATUSES:
+                # Slow the whole host down; the next limit_async waits on the event loop
+                limiter.throttle(host, retry_after)
+                throttles += 1
+                if throttles <= max_throttles:
+                    continue
+                return page
+
+            if page.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                # Back off outside the host slot so other requests can use it
+                backoff = BACKOFF_FACTOR * (2 ** attempt)
+                deadline = current_deadline()
+                if deadline and backoff > deadline.remaining():
+                    raise BudgetExceeded(f"no time left to retry {url}")
+                await asyncio.sleep(backoff)
+                attempt += 1
+                continue
+
+            limiter.record_success(host)
+            return http_cache.complete(page) if http_cache else page
+
+    async def get_page(self, url: str, timeout: int) -> FetchResult:
+        """Return url from the scraper's page cache, fetching it only on a miss"""
+        page = self.scraper.page_cache.get(url)
+        if page is None:
+            ledger = self.scraper.failure_ledger
+            ledger.check(url)
+            timeout, clamped = budget_timeout(timeout)
+            try:
+                page = await self.fetch_page(url, timeout)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                if clamped and isinstance(e, asyncio.TimeoutError):
+                    raise BudgetExceeded(f"time budget ran out fetching {url}") from e
+                ledger.record_exception(url, e)
+                raise
+            ledger.record_response(page)
+            page = self.scraper.page_cache.put(page)
+        return page
+
+    async def parse(self, func, *args):
+        """Run a synchronous parse/extract helper off the event loop, in the caller's context"""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self.parse_executor, context.run, func, *args)
+
+    async def io(self, func, *args):
+        """Run a synchronous helper that does blocking network I/O on the I/O pool, in the caller's context"""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self.io_executor, context.run, func, *args)
+
+    async def probe_career_url(self, url: str):
+        """Async counterpart of MultiplatformJobScraper.probe_career_url"""
+        page = await self.get_page(url, timeout=8)
+        if await self.parse(self.scraper.page_has_job_listings, page):
+            return page.final_url
+        return None
+
+    async def discover_career_urls(self, base_url: str, company_name: str) -> List[str]:
+        """Async counterpart of MultiplatformJobScraper.discover_career_urls"""
+        discovered_urls = []
+
+        try:
+            logger.debug(f"Discovering career URLs for {company_name} from {base_url}")
+
+            # Skip obviously invalid URLs
+            if not base_url or base_url == 'nan' or 'nan' in base_url:
+                logger.debug(f"Skipping invalid URL for {company_name}: {base_url}")
+                return []
+
+            try:
+                page = await self.get_page(base_url, timeout=10)
+                discovered_urls.extend(await self.parse(self.scraper.discover_from_page, page, base_url))
+            except (asyncio.TimeoutError, aiohttp.ClientError, CooldownActive) as e:
+                logger.debug(f"Connection issue with {base_url}: {e}")
+                return []
+
+            if len(discovered_urls) == 0:
+                # Race every fallback path; the host's rate limit still applies to each probe
+                hit = await race_probe_async(self.scraper.fallback_career_urls(base_url), self.probe_career_url,
+                                             reraise=(BudgetExceeded,))
+                if hit:
+                    discovered_urls.append(hit[1])
+                    logger.debug(f"Found jobs at: {hit[1]}")
+
+        except BudgetExceeded:
+            raise
+        except Exception as e:
+            logger.debug(f"Error discovering URLs for {company_name}: {e}")
+
+        return list(dict.fromkeys(discovered_urls))[:2]
+
+    async def ats_jobs(self, url: str, company, listed=None):
+        """MultiplatformJobScraper.ats_jobs on the I/O pool.
+
+        A throttled API host is waited out on the event loop and retried, like
+        a throttled page fetch, up to throttle_max_requeues times and never past
+        the company's deadline; after that the page is scraped instead.
+        """
+        if not self.scraper.ats_adapters:
+            return None
+        max_throttles = self.scraper.settings.get('throttle_max_requeues', 5)
+        for throttles in itertools.count(1):
+            try:
+                return await self.io(self.scraper.ats_jobs, url, company, listed)
+            except HostThrottled as e:
+                if throttles > max_throttles:
+                    logger.warning(f"  ATS API for {url} still throttled after {max_throttles} retries, "
+                                   f"scraping the page instead: {e}")
+                    return None
+                wait = max(0.0, e.retry_at - time.monotonic())
+                deadline = current_deadline()
+                if deadline and wait > deadline.remaining():
+                    raise BudgetExceeded(f"{e.host} throttled past the deadline")
+                await asyncio.sleep(wait)
+
+    async def extract_jobs_from_page(self, url: str, company, listed_boards=None) -> List:
+        """Async counterpart of MultiplatformJobScraper.extract_jobs_from_page"""
+        try:
+            jobs = await self.ats_jobs(url, company, listed_boards)
+            if jobs is not None:
+                return jobs
+            logger.debug(f"Extracting jobs from: {url}")
+            page = await self.get_page(url, timeout=15)
+            return await self.parse(self.scraper.extract_jobs_from_response, page, company)
+        except CooldownActive as e:
+            logger.debug(f"Skipping {url}: {e}")
+            return []
+        except BudgetExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error extracting jobs from {url}: {e}")
+            return []
+
+    async def scrape_company(self, company) -> List:
+        """Async counterpart of MultiplatformJobScraper.scrape_company"""
+        if self.scraper.skip_cooling_company(company):
+            return []
+
+        if self.scraper.scan_deadline.expired(self.scraper.settings.get('scan_deadline_margin_seconds', 30)):
+            self.scraper.not_started_companies.append(company.name)
+            return []
+
+        logger.info(f"📊 Scanning {company.name} ({company.size})...")
+
+        # Tasks started below copy this context, so every fetch shares the company's budget
+        budget = Deadline(self.scraper.settings.get('company_budget_seconds', 90),
+                          parent=self.scraper.scan_deadline)
+        with deadline_scope(budget):
+            try:
+                # Careers URL on a hosted ATS: one API request replaces discovery and scraping
+                ats_jobs = await self.ats_jobs(company.careers_url, company)
+                if ats_jobs is not None:
+                    return self.scraper.finalize_company_jobs(company, ats_jobs)
+
+                career_urls = await self.discover_career_urls(company.careers_url, company.name)
+                discovered = bool(career_urls)
+
+                if not career_urls:
+                    logger.warning(f"No career URLs found for {company.name}")
+                    career_urls = [company.careers_url]  # Fallback
+
+                logger.debug(f"Found {len(career_urls)} career page(s) to check")
+
+                listed_boards = {}
+                pages = await asyncio.gather(
+                    *(self.extract_jobs_from_page(url, company, listed_boards) for url in career_urls),
+                    return_exceptions=True
+                )
+                all_jobs = [job for jobs in pages if not isinstance(jobs, BaseException) for job in jobs]
+                if any(isinstance(jobs, BudgetExceeded) for jobs in pages):
+                    return self.scraper.record_timed_out(company, all_jobs)
+
+                return self.scraper.finalize_company_jobs(company, all_jobs, discovered)
+
+            except BudgetExceeded:
+                return self.scraper.record_timed_out(company, [])
+            except Exception as e:
+                logger.error(f"Error scraping {company.name}: {e}")
+                self.scraper.record_company_outcome(company, [], 'failed')
+                return []
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Compare HTML parser backends on stored career pages.
+
+Pages come from the files given on the command line, or by default from the
+scraper's HTTP cache (.cache/http), which holds every career page fetched by
+recent scans. For each backend this reports parse time and peak memory, and
+for backends that build a BeautifulSoup tree, whether the scraper extracts
+exactly the same jobs as with html.parser.
+
+    python benchmark_parsers.py
+    python benchmark_parsers.py saved_pages/*.html --repeat 10
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict
+
+from http_pool import FetchResult
+from multiplatform_job_scraper import Company, MultiplatformJobScraper
+from parser_backends import BACKENDS
+
+REFERENCE_BACKEND = 'html.parser'
+
+
+def load_pages(paths, cache_dir):
+    """(url, content) pairs from the given files, or from the HTTP cache"""
+    pages = []
+    if paths:
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append((f"file://{os.path.abspath(path)}", f.read()))
+        return pages
+
+    for meta_path in sorted(glob.glob(os.path.join(cache_dir, '*.json'))):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if not meta.get('size'):
+                continue  # Alias of a redirect target, same body as its owner
+            with open(os.path.join(cache_dir, f"{meta['body_key']}.body"), 'rb') as f:
+                pages.append((meta['url'], f.read()))
+        except (OSError, json.JSONDecodeError, KeyError):
+            continue
+    return pages
+
+
+def time_parse(backend, content, repeat):
+    """Median seconds to parse content"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        backend.parse(content)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def peak_memory(backend, content):
+    """Peak Python allocations while parsing content; libxml2's own C heap is not traced"""
+    tracemalloc.start()
+    tree = backend.parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return peak
+
+
+def extract(scraper, backend, url, content):
+    """Jobs the scraper extracts from content when parsing with backend"""
+    scraper.parser_backend = backend
+    scraper.page_cache.clear()
+    page = FetchResult(url=url, final_url=url, status_code=200, content=content, headers={})
+    company = Company(name='Benchmark', size='Unknown', careers_url=url)
+    return [asdict(job) for job in scraper.extract_jobs_from_response(page, company)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on stored career pages")
+    parser.add_argument('pages', nargs='*', help="HTML files (default: bodies in the HTTP cache)")
+    parser.add_argument('--cache-dir', default='.cache/http', help="HTTP cache directory to read pages from")
+    parser.add_argument('--repeat', type=int, default=5, help="Parses per page and backend")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    pages = load_pages(args.pages, args.cache_dir)
+    if not pages:
+        print("No pages to benchmark. Run a scan first or pass HTML files.")
+        return
+
+    scraper = MultiplatformJobScraper()
+    scraper.http_cache = None  # Always extract, never reuse cached results
+    backends = [backend for backend in BACKENDS.values() if backend.available()]
+    reference = {url: extract(scraper, BACKENDS[REFERENCE_BACKEND], url, content) for url, content in pages}
+
+    total_bytes = sum(len(content) for _, content in pages)
+    print(f"📊 {len(pages)} pages, {total_bytes / 1024:.0f} KB\n")
+    print(f"{'Backend':<14}{'Parse total':>13}{'Per page':>11}{'Peak memory':>14}  Jobs vs {REFERENCE_BACKEND}")
+
+    results = []
+    for backend in backends:
+        seconds = sum(time_parse(backend, content, args.repeat) for _, content in pages)
+        memory = max(peak_memory(backend, content) for _, content in pages)
+        if backend.produces_soup:
+            differing = [url for url, content in pages if extract(scraper, backend, url, content) != reference[url]]
+            identical = not differing
+            verdict = "identical" if identical else f"differ on {len(differing)} pages"
+        else:
+            identical = False
+            verdict = "n/a (no BeautifulSoup tree)"
+        results.append((backend, seconds, identical))
+        print(f"{backend.name:<14}{seconds * 1000:>11.1f}ms{seconds / len(pages) * 1000:>9.2f}ms"
+              f"{memory / (1024 * 1024):>12.1f}MB  {verdict}")
+
+    usable = [(seconds, backend.name) for backend, seconds, identical in results if identical]
+    if usable:
+        print(f"\n✅ Fastest backend with identical jobs: {min(usable)[1]}")
+
+
+if __name__ == "__main__":
+    main()
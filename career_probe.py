@@ -0,0 +1,89 @@
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+
+def race_probe(candidates: Iterable[str], probe: Callable[[str], Any], max_workers: int = 8,
+               reraise: Tuple[Type[BaseException], ...] = ()) -> Optional[Tuple[str, Any]]:
+    """Probe candidate URLs concurrently and return (candidate, result) for the best hit.
+
+    probe returns a truthy result for a hit. Candidates are in priority order and
+    the answer is the one a sequential walk would give: the earliest candidate
+    that hits. It is returned as soon as every candidate ahead of it has
+    finished; probes that have not started are then cancelled and the rest are
+    ignored, so the worst case is roughly the slowest single probe instead of
+    the sum of every timeout. Exceptions of a type listed in reraise are raised
+    again when no candidate hits.
+    """
+    candidates = list(dict.fromkeys(candidates))
+    if not candidates:
+        return None
+
+    errors: List[BaseException] = []
+    hits: Dict[int, Tuple[str, Any]] = {}
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(candidates)))
+    # Each probe runs in a copy of the caller's context, so it sees the same scan budget
+    pending = {executor.submit(contextvars.copy_context().run, probe, candidate): index
+               for index, candidate in enumerate(candidates)}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    result = future.result()
+                except reraise as e:
+                    errors.append(e)
+                    continue
+                except Exception:
+                    continue
+                if result:
+                    hits[index] = (candidates[index], result)
+            if hits and min(hits) < min(pending.values(), default=len(candidates)):
+                break  # Nothing still running outranks the best hit
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if hits:
+        return hits[min(hits)]
+    if errors:
+        raise errors[0]
+    return None
+
+
+async def race_probe_async(candidates: Iterable[str], probe: Callable[[str], Awaitable[Any]],
+                           reraise: Tuple[Type[BaseException], ...] = ()) -> Optional[Tuple[str, Any]]:
+    """Event-loop counterpart of race_probe; probes outranked by a hit are cancelled outright"""
+    candidates = list(dict.fromkeys(candidates))
+    if not candidates:
+        return None
+
+    errors: List[BaseException] = []
+    hits: Dict[int, Tuple[str, Any]] = {}
+    pending = {asyncio.ensure_future(probe(candidate)): index for index, candidate in enumerate(candidates)}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                try:
+                    result = task.result()
+                except reraise as e:
+                    errors.append(e)
+                    continue
+                except Exception:
+                    continue
+                if result:
+                    hits[index] = (candidates[index], result)
+            if hits and min(hits) < min(pending.values(), default=len(candidates)):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if hits:
+        return hits[min(hits)]
+    if errors:
+        raise errors[0]
+    return None
@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Set
+
+logger = logging.getLogger(__name__)
+
+
+class ScanJournal:
+    """Append-only JSON-lines journal of finished companies for one scan.
+
+    Every company outcome is written and flushed as soon as it is known, so a
+    scan that crashes or is killed can be resumed with only the companies that
+    are not in the journal yet. Lines torn by a crash are ignored on load.
+    A marker line notes when the run saved company stats, so a resumed scan
+    only replays the outcomes written after it.
+    """
+
+    def __init__(self, directory: str, scan_id: str):
+        self.scan_id = scan_id
+        self.path = os.path.join(directory, f"scan-{scan_id}.jsonl")
+        self._lock = threading.Lock()
+        self._file = None
+        self.recorded: Set[str] = set()  # Companies written by this run
+
+    def load(self) -> Dict[str, Dict]:
+        """Finished companies recorded for this scan ID, keyed by company name"""
+        finished = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Last line of a killed scan
+                    if entry.get('scan_id') != self.scan_id:
+                        continue
+                    if entry.get('stats_saved'):
+                        for earlier in finished.values():
+                            earlier['stats_saved'] = True
+                    else:
+                        finished[entry['company']] = entry
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Scan journal {self.path} unreadable: {e}")
+        return finished
+
+    def open(self, resume: bool = False):
+        """Start writing; a fresh scan discards any journal left under the same ID"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        if resume:
+            self._drop_torn_line()
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+
+    def _drop_torn_line(self):
+        """Cut a killed scan's half-written last line, so new records start on a line of their own"""
+        try:
+            with open(self.path, 'rb+') as f:
+                content = f.read()
+                end = content.rfind(b'\n') + 1
+                if end < len(content):
+                    f.truncate(end)
+        except FileNotFoundError:
+            pass
+
+    def record(self, company: str, status: str, jobs: List[Dict], seconds: float = None):
+        """Append one company's outcome and flush it to disk"""
+        if self._file is None:
+            return
+        line = json.dumps({
+            'scan_id': self.scan_id,
+            'company': company,
+            'status': status,
+            'seconds': round(seconds, 3) if seconds is not None else None,
+            'finished_at': time.time(),
+            'jobs': jobs
+        })
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.recorded.add(company)
+
+    def mark_stats_saved(self):
+        """Note that company stats now include every outcome journaled so far"""
+        if self._file is None:
+            return
+        line = json.dumps({'scan_id': self.scan_id, 'stats_saved': True, 'finished_at': time.time()})
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self, completed: bool = False):
+        """Stop writing; a completed scan no longer needs its journal"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if completed:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
@@ -1,6 +1,6 @@
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+from parser_backends import make_soup
 import json
 import time
 import re
@@ -40,7 +40,7 @@ class CompanyResearchScraper:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 companies = []
                 
                 # Look for company listings
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CompanyStats:
+    """Persisted per-company scan history used to order the scan queue.
+
+    Each company keeps its hit rate (scans that found target jobs), when its
+    job list last changed, a moving average of how long it takes to scan and
+    how often the scan failed. schedule() puts the companies that yield the
+    most per second first, so a time-boxed scan lands its best results early,
+    and defers companies that have come back empty many scans in a row until
+    they are due for another sample.
+    """
+
+    def __init__(self, path: str = "results/company_stats.json", defer_after_empty: int = 8,
+                 sample_every_days: float = 7, recent_change_days: float = 14,
+                 latency_smoothing: float = 0.3, default_seconds: float = 10.0):
+        self.path = path
+        self.defer_after_empty = defer_after_empty
+        self.sample_every_seconds = sample_every_days * 86400
+        self.recent_change_seconds = recent_change_days * 86400
+        self.latency_smoothing = latency_smoothing
+        self.default_seconds = default_seconds
+        self.scan_started = time.time()
+        self.companies: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load company stats from disk"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.companies = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Company stats {self.path} unreadable, starting fresh: {e}")
+            return
+        logger.info(f"Company stats: history for {len(self.companies)} companies")
+
+    def save(self):
+        """Write company stats back to disk"""
+        with self._lock:
+            data = dict(self.companies)
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Error saving company stats: {e}")
+
+    def record(self, name: str, job_urls: List[str], seconds: Optional[float], failed: bool = False):
+        """Fold one scan of a company into its history"""
+        now = time.time()
+        signature = hashlib.sha1('\n'.join(sorted(job_urls)).encode('utf-8')).hexdigest()
+        with self._lock:
+            entry = self.companies.setdefault(name, {
+                'scans': 0, 'hits': 0, 'failures': 0, 'empty_streak': 0,
+                'avg_seconds': None, 'jobs': 0, 'signature': None, 'last_change': None,
+                'last_scanned': None
+            })
+            entry['scans'] += 1
+            entry['last_scanned'] = now
+            if failed:
+                entry['failures'] += 1
+            if job_urls:
+                entry['hits'] += 1
+                entry['empty_streak'] = 0
+            elif not failed:
+                entry['empty_streak'] += 1
+            if entry['signature'] is not None and signature != entry['signature']:
+                entry['last_change'] = now
+            entry['signature'] = signature
+            entry['jobs'] = len(job_urls)
+            if seconds is not None:
+                previous = entry['avg_seconds']
+                entry['avg_seconds'] = seconds if previous is None else (
+                    previous + self.latency_smoothing * (seconds - previous))
+
+    def delta(self) -> Dict[str, Dict]:
+        """Companies scanned by this process, for merging a shard's stats into the shared ones"""
+        with self._lock:
+            return {name: entry for name, entry in self.companies.items()
+                    if (entry['last_scanned'] or 0) >= self.scan_started}
+
+    def merge_delta(self, delta: Dict[str, Dict]):
+        """Apply the entries another process recorded with delta()"""
+        with self._lock:
+            self.companies.update(delta)
+
+    def priority(self, name: str) -> float:
+        """Expected target-job yield per second of scanning; unseen companies get the priors"""
+        entry = self.companies.get(name)
+        if entry is None:
+            return 0.5 / self.default_seconds
+        scans = entry['scans']
+        hit_rate = (entry['hits'] + 1) / (scans + 2)
+        reliability = (scans - entry['failures'] + 1) / (scans + 2)
+        if entry['last_change'] and time.time() - entry['last_change'] < self.recent_change_seconds:
+            hit_rate = min(1.0, hit_rate * 1.5)  # Boards that changed lately are worth an early look
+        seconds = entry['avg_seconds'] or self.default_seconds
+        return hit_rate * reliability / max(seconds, 1.0)
+
+    def deferred(self, name: str) -> bool:
+        """Chronically empty companies sit out scans until they are due for a sample"""
+        entry = self.companies.get(name)
+        if entry is None or entry['empty_streak'] < self.defer_after_empty:
+            return False
+        return time.time() - (entry['last_scanned'] or 0) < self.sample_every_seconds
+
+    def schedule(self, companies: List) -> Tuple[List, List]:
+        """Split companies into (scan order, deferred), best expected yield first"""
+        deferred = [company for company in companies if self.deferred(company.name)]
+        skipped = {id(company) for company in deferred}
+        queue = [company for company in companies if id(company) not in skipped]
+        queue.sort(key=lambda company: self.priority(company.name), reverse=True)
+        return queue, deferred
@@ -1,6 +1,6 @@
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+from parser_backends import make_soup
 import json
 import time
 import re
@@ -51,7 +51,7 @@ class AbsenceSoftDebugScraper:
                 print(f"❌ HTTP Error: {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             page_text = soup.get_text()
             
             print(f"Page length: {len(page_text)} characters")
@@ -0,0 +1,58 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# A tier returns the page's jobs when it can account for the page, None to hand it to the next tier
+Tier = Callable[..., Optional[List]]
+
+
+@dataclass
+class TierStats:
+    pages: int = 0        # Pages the tier was tried on
+    resolved: int = 0     # Pages it settled, ending the cascade
+    jobs: int = 0         # Jobs it returned
+    seconds: float = 0.0  # Time spent in the tier, resolved or not
+
+
+class ExtractionCascade:
+    """Extraction strategies tried in order, cheapest first.
+
+    The first tier that can account for a page settles it, so the heavy
+    generic DOM search only runs on pages nothing cheaper understood.
+    Per-tier counts and timings are kept for the end-of-scan log; tiers run
+    on worker threads, so updates take a lock.
+    """
+
+    def __init__(self, tiers: Sequence[Tuple[str, Tier]]):
+        self.tiers = list(tiers)
+        self.stats: Dict[str, TierStats] = {name: TierStats() for name, _ in self.tiers}
+        self._lock = threading.Lock()
+
+    def run(self, *args) -> Tuple[Optional[str], List]:
+        """(name of the tier that settled the page, its jobs); (None, []) if none did"""
+        for name, tier in self.tiers:
+            start = time.perf_counter()
+            jobs = tier(*args)
+            self._record(name, time.perf_counter() - start, jobs)
+            if jobs is not None:
+                return name, jobs
+        return None, []
+
+    def _record(self, name: str, seconds: float, jobs: Optional[List]):
+        with self._lock:
+            stats = self.stats[name]
+            stats.pages += 1
+            stats.seconds += seconds
+            if jobs is not None:
+                stats.resolved += 1
+                stats.jobs += len(jobs)
+
+    def summary(self) -> List[str]:
+        """One line per tier that ran, for the scan log"""
+        with self._lock:
+            return [
+                f"{name}: resolved {stats.resolved}/{stats.pages} pages, {stats.jobs} jobs, "
+                f"{stats.seconds * 1000:.0f}ms"
+                for name, stats in self.stats.items() if stats.pages
+            ]
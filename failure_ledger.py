@@ -0,0 +1,243 @@
+import csv
+import json
+import logging
+import os
+import socket
+import ssl
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import requests
+
+from http_pool import FetchResult, SessionPool
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean the whole host is refusing us, not just one page
+HOST_FAILURE_STATUSES = {999}
+# Transient throttling is handled by backoff, not by the ledger
+IGNORED_STATUSES = {429}
+# Failures that a plain 200 does not clear: the page loads but never has jobs
+SOFT_FAILURE_KINDS = {'no_jobs_found'}
+
+
+def _error_chain(error: BaseException):
+    """error and the exceptions it wraps, through requests, urllib3 and aiohttp wrappers"""
+    seen = set()
+    pending = [error]
+    while pending:
+        current = pending.pop()
+        if not isinstance(current, BaseException) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        pending.extend([current.__cause__, current.__context__, getattr(current, 'reason', None),
+                        getattr(current, 'os_error', None), *current.args])
+
+
+def host_unreachable(error: BaseException) -> bool:
+    """Whether a fetch failed because the host itself cannot be reached.
+
+    DNS failures, refused connections and TLS errors hold for every URL on a
+    host. Timeouts and dropped connections are left to the one URL, since a
+    shared ATS host answering one board slowly says nothing about the rest.
+    """
+    return any(isinstance(e, (socket.gaierror, ConnectionRefusedError, ssl.SSLError,
+                              requests.exceptions.SSLError))
+               for e in _error_chain(error))
+
+
+class CooldownActive(Exception):
+    """Raised instead of fetching a URL or host that is still cooling down"""
+
+
+class FailureLedger:
+    """Persisted per-URL and per-host failure ledger with exponential cool-down.
+
+    Every consecutive failure doubles how long the URL (or its whole host) is
+    skipped, starting at cooldown_hours and capped at max_cooldown_hours. A key
+    collects at most one strike per scan, hosts only cool down after
+    host_failure_threshold strikes, entries older than ttl_days are forgotten,
+    and a success resets them.
+    """
+
+    def __init__(self, path: str = "results/failure_ledger.json", cooldown_hours: float = 20,
+                 max_cooldown_hours: float = 336, ttl_days: float = 30,
+                 host_failure_threshold: int = 2):
+        self.path = path
+        self.cooldown_seconds = cooldown_hours * 3600
+        self.max_cooldown_seconds = max_cooldown_hours * 3600
+        self.ttl_seconds = ttl_days * 86400
+        self.host_failure_threshold = host_failure_threshold
+        self.scan_started = time.time()
+        self.urls: Dict[str, Dict] = {}
+        self.hosts: Dict[str, Dict] = {}
+        self.skipped = 0
+        self.cleared_urls = set()
+        self.cleared_hosts = set()
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the ledger from disk, dropping entries past their TTL"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failure ledger {self.path} unreadable, starting fresh: {e}")
+            return
+
+        cutoff = time.time() - self.ttl_seconds
+        self.urls = {k: v for k, v in data.get('urls', {}).items() if v.get('last_failure', 0) >= cutoff}
+        self.hosts = {k: v for k, v in data.get('hosts', {}).items() if v.get('last_failure', 0) >= cutoff}
+        logger.info(f"Failure ledger: {len(self.urls)} URLs and {len(self.hosts)} hosts on record")
+
+    def save(self):
+        """Write the ledger back to disk"""
+        with self._lock:
+            data = {'urls': self.urls, 'hosts': self.hosts}
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Error saving failure ledger: {e}")
+
+    def _cooling_entry(self, url: str) -> Optional[Dict]:
+        now = time.time()
+        for entry in (self.urls.get(url), self.hosts.get(SessionPool.host_key(url))):
+            if entry and entry['next_retry'] > now:
+                return entry
+        return None
+
+    def check(self, url: str):
+        """Raise CooldownActive when url or its host is still cooling down"""
+        with self._lock:
+            entry = self._cooling_entry(url)
+            if entry is not None:
+                self.skipped += 1
+        if entry is not None:
+            retry_at = datetime.fromtimestamp(entry['next_retry']).strftime('%Y-%m-%d %H:%M')
+            raise CooldownActive(f"{entry['kind']} x{entry['failures']}, retry after {retry_at}")
+
+    def record_failure(self, url: str, kind: str, host_level: bool = False):
+        """Count a failure for url (or its host) and push its next retry further out"""
+        key = SessionPool.host_key(url) if host_level else url
+        table = self.hosts if host_level else self.urls
+        now = time.time()
+        with self._lock:
+            entry = table.get(key)
+            if entry and entry['last_failure'] >= self.scan_started:
+                return  # Already has its strike for this scan
+            failures = (entry['failures'] if entry else 0) + 1
+
+            # Shared hosts must fail repeatedly before every URL on them is skipped
+            strikes = failures - (self.host_failure_threshold - 1 if host_level else 0)
+            next_retry = 0.0
+            if strikes > 0:
+                next_retry = now + min(self.cooldown_seconds * (2 ** (strikes - 1)), self.max_cooldown_seconds)
+
+            table[key] = {
+                'kind': kind,
+                'failures': failures,
+                'last_failure': now,
+                'next_retry': next_retry
+            }
+
+    def failed_this_scan(self, url: str) -> bool:
+        """Whether url or its host has already failed during the current scan"""
+        with self._lock:
+            for entry in (self.urls.get(url), self.hosts.get(SessionPool.host_key(url))):
+                if entry and entry['last_failure'] >= self.scan_started:
+                    return True
+        return False
+
+    def record_success(self, url: str, clear_soft: bool = False):
+        """Forget hard failures for url and its host, and soft ones when asked to"""
+        host = SessionPool.host_key(url)
+        with self._lock:
+            entry = self.urls.get(url)
+            if entry and (clear_soft or entry['kind'] not in SOFT_FAILURE_KINDS):
+                del self.urls[url]
+                self.cleared_urls.add(url)
+            if self.hosts.pop(host, None) is not None:
+                self.cleared_hosts.add(host)
+
+    def delta(self) -> Dict:
+        """Entries changed during this scan, for merging a shard's ledger into the shared one"""
+        with self._lock:
+            return {
+                'urls': {k: v for k, v in self.urls.items() if v['last_failure'] >= self.scan_started},
+                'hosts': {k: v for k, v in self.hosts.items() if v['last_failure'] >= self.scan_started},
+                'cleared_urls': sorted(self.cleared_urls),
+                'cleared_hosts': sorted(self.cleared_hosts)
+            }
+
+    def merge_delta(self, delta: Dict):
+        """Apply the changes another process recorded with delta()"""
+        with self._lock:
+            for url in delta.get('cleared_urls', []):
+                self.urls.pop(url, None)
+            for host in delta.get('cleared_hosts', []):
+                self.hosts.pop(host, None)
+            self.urls.update(delta.get('urls', {}))
+            self.hosts.update(delta.get('hosts', {}))
+
+    def record_response(self, page: FetchResult):
+        """Classify a completed fetch as a success or a failure"""
+        if page.status_code in (200, 304):
+            self.record_success(page.url)
+            if page.final_url != page.url:
+                self.record_success(page.final_url)
+        elif page.status_code in IGNORED_STATUSES:
+            return
+        else:
+            self.record_failure(page.url, f"http_{page.status_code}",
+                                host_level=page.status_code in HOST_FAILURE_STATUSES)
+
+    def record_exception(self, url: str, error: Exception):
+        """DNS, refused connection and SSL failures count against the whole host, anything else against url"""
+        if 'too many 429 error responses' in str(error):
+            return  # Exhausted retries on throttling, handled by backoff
+        self.record_failure(url, type(error).__name__, host_level=host_unreachable(error))
+
+    def write_report(self, filename: str, companies: List) -> int:
+        """List URLs and hosts that keep failing, for the company CSV cleanup scripts"""
+        by_url = {company.careers_url: company.name for company in companies}
+        by_host = {SessionPool.host_key(company.careers_url): company.name for company in companies}
+
+        rows = []
+        with self._lock:
+            for url, entry in self.urls.items():
+                rows.append([by_url.get(url, by_host.get(SessionPool.host_key(url), '')), 'url', url, entry])
+            for host, entry in self.hosts.items():
+                rows.append([by_host.get(host, ''), 'host', host, entry])
+
+        rows.sort(key=lambda row: row[3]['failures'], reverse=True)
+        try:
+            with open(filename, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(['Company', 'Scope', 'Target', 'Failure', 'Failures', 'Last Failure', 'Next Retry'])
+                for company, scope, target, entry in rows:
+                    writer.writerow([
+                        company,
+                        scope,
+                        target,
+                        entry['kind'],
+                        entry['failures'],
+                        datetime.fromtimestamp(entry['last_failure']).strftime('%Y-%m-%d %H:%M'),
+                        datetime.fromtimestamp(entry['next_retry']).strftime('%Y-%m-%d %H:%M')
+                        if entry['next_retry'] else ''
+                    ])
+            logger.info(f"✅ Failing career URLs report saved to {filename}")
+        except Exception as e:
+            logger.error(f"Error saving failing URLs report: {e}")
+        return len(rows)
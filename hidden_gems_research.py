@@ -6,6 +6,9 @@ import time
 import re
 from datetime import datetime
 import os
+from urllib.parse import urlparse
+from career_probe import race_probe
+from rate_limiter import HostRateLimiter
 
 class HiddenGemsResearcher:
     def __init__(self):
@@ -13,6 +16,8 @@ class HiddenGemsResearcher:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        # Per-host politeness for concurrent careers page probes
+        self.probe_limiter = HostRateLimiter(requests_per_second=2.0, burst=2, max_concurrent_per_host=2)
     
     def research_startup_databases(self):
         """Research smaller startups and growing companies"""
@@ -392,17 +397,17 @@ class HiddenGemsResearcher:
             f"https://{company_slug}.co/careers"
         ]
         
-        for url in potential_urls:
-            try:
+        def probe(url):
+            with self.probe_limiter.limit(urlparse(url).netloc):
                 response = self.session.get(url, timeout=5)
-                if response.status_code == 200:
-                    content = response.text.lower()
-                    if any(word in content for word in ['job', 'career', 'position', 'hiring', 'openings']):
-                        return url
-            except:
-                continue
-        
-        return None
+            if response.status_code == 200:
+                content = response.text.lower()
+                return any(word in content for word in ['job', 'career', 'position', 'hiring', 'openings'])
+            return False
+        
+        # Race the candidates instead of paying every timeout in turn, keeping the first in list order that hits
+        hit = race_probe(potential_urls, probe, max_workers=8)
+        return hit[0] if hit else None
     
     def run_hidden_gems_research(self):
         """Run comprehensive hidden gems research"""
@@ -0,0 +1,164 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from http_pool import FetchResult
+
+logger = logging.getLogger(__name__)
+
+
+class HttpDiskCache:
+    """Persistent response cache with ETag / Last-Modified revalidation.
+
+    Each cached URL has a body file and a small JSON metadata file holding its
+    validators; a redirect's final URL gets an alias entry sharing that body.
+    Repeat fetches send If-None-Match / If-Modified-Since; on a 304 the stored
+    body is returned instead, together with the extraction result saved for it
+    when the keyword set is unchanged. Least recently used entries are pruned
+    once the cache grows past max_bytes.
+    """
+
+    def __init__(self, directory: str = ".cache/http", max_bytes: int = 200 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.revalidated = 0
+        self.stored = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _meta_path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{self._key(url)}.json")
+
+    def _body_path(self, meta: Dict) -> str:
+        return os.path.join(self.directory, f"{meta['body_key']}.body")
+
+    def _write(self, path: str, data: bytes):
+        """Write atomically so a killed scan never leaves a torn entry"""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _load_meta(self, url: str) -> Optional[Dict]:
+        meta_path = self._meta_path(url)
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+        # The body may have been evicted, or belong to an alias whose owner was
+        if not os.path.exists(self._body_path(meta)):
+            return None
+        return meta
+
+    def _save_meta(self, url: str, meta: Dict):
+        self._write(self._meta_path(url), json.dumps(meta).encode('utf-8'))
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for url, empty when nothing is cached"""
+        meta = self._load_meta(url)
+        if not meta:
+            return {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def complete(self, page: FetchResult) -> FetchResult:
+        """Swap a 304 for the cached body, or store a fresh 200 with validators"""
+        if page.status_code == 304:
+            meta = self._load_meta(page.url)
+            if meta is None:
+                return page
+            with open(self._body_path(meta), 'rb') as f:
+                content = f.read()
+            meta['accessed_at'] = time.time()
+            self._save_meta(page.url, meta)
+            with self._lock:
+                self.revalidated += 1
+            return replace(page, final_url=meta['final_url'], status_code=200,
+                           content=content, not_modified=True)
+
+        if page.status_code == 200:
+            headers = {name.lower(): value for name, value in page.headers.items()}
+            etag = headers.get('etag')
+            last_modified = headers.get('last-modified')
+            if etag or last_modified:
+                meta = {
+                    'url': page.url,
+                    'final_url': page.final_url,
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'body_key': self._key(page.url),
+                    'size': len(page.content),
+                    'accessed_at': time.time()
+                }
+                self._write(self._body_path(meta), page.content)
+                self._save_meta(page.url, meta)
+                if page.final_url != page.url:
+                    # Extraction looks pages up by their final URL; share the same body
+                    self._save_meta(page.final_url, dict(meta, url=page.final_url, size=0))
+                with self._lock:
+                    self.stored += 1
+        return page
+
+    def load_extraction(self, url: str, fingerprint: str) -> Optional[List[Dict]]:
+        """Jobs extracted from the cached body of url under the same keyword set"""
+        meta = self._load_meta(url)
+        if not meta or meta.get('fingerprint') != fingerprint:
+            return None
+        return meta.get('jobs')
+
+    def store_extraction(self, url: str, fingerprint: str, jobs: List[Dict]):
+        """Remember the jobs extracted from the cached body of url"""
+        meta = self._load_meta(url)
+        if meta is None:
+            return
+        meta['fingerprint'] = fingerprint
+        meta['jobs'] = jobs
+        self._save_meta(url, meta)
+
+    def prune(self):
+        """Evict least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                meta = {}
+            size = meta.get('size', 0)
+            total += size
+            entries.append((meta.get('accessed_at', 0), size, meta_path))
+
+        evicted = 0
+        for _, size, meta_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in (meta_path, meta_path[:-len('.json')] + '.body'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # Alias entries have no body of their own
+            total -= size
+            evicted += 1
+
+        if evicted:
+            logger.info(f"HTTP cache: evicted {evicted} entries to stay under {self.max_bytes // (1024 * 1024)} MB")
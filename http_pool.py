@@ -0,0 +1,164 @@
+import contextvars
+import random
+import ssl
+import threading
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+
+_single_attempt: contextvars.ContextVar = contextvars.ContextVar('single_attempt', default=False)
+# What requests itself uses when an adapter has no retries: fail on the first error
+NO_RETRIES = Retry(0, read=False)
+
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+}
+
+
+@dataclass
+class FetchResult:
+    url: str
+    final_url: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    not_modified: bool = False  # Body came from the disk cache after a 304
+
+
+@contextmanager
+def single_attempt(enabled: bool = True):
+    """Send the requests made in this thread or task once, without the pool's retries"""
+    token = _single_attempt.set(enabled)
+    try:
+        yield
+    finally:
+        _single_attempt.reset(token)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that hands one shared SSL context to every connection pool.
+
+    Requests sent inside single_attempt() skip the retry strategy, so a fetch
+    given only what is left of a time budget cannot retry past it.
+    """
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    @property
+    def max_retries(self) -> Retry:
+        return NO_RETRIES if _single_attempt.get() else self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, retries: Retry):
+        self._max_retries = retries
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.ssl_context is not None:
+            kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
+class SessionPool:
+    """Long-lived sessions for a whole scan, one per host, sharing a pooled adapter.
+
+    Every session mounts the same adapter, so keep-alive connections opened for a
+    host are reused by later pages on that host instead of paying a new TCP and
+    TLS handshake. Each host keeps the user agent it was first given.
+    """
+
+    def __init__(self, user_agents: List[str], pool_connections: int = 100,
+                 pool_maxsize: int = 10, verify: bool = False):
+        self.user_agents = user_agents
+        self.verify = verify
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+        if not verify:
+            # Disable SSL warnings for problematic sites
+            warnings.filterwarnings('ignore', category=InsecureRequestWarning)
+
+        # Reduced retries to avoid long timeouts, only retry GET requests.
+        # 429/503 are not retried here: the rate limiter backs off per host instead.
+        retry_strategy = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 504],
+            respect_retry_after_header=False,
+            allowed_methods=["GET"]
+        )
+
+        self.adapter = PooledHTTPAdapter(
+            ssl_context=self._build_ssl_context(),
+            pool_connections=pool_connections,  # Number of hosts kept warm
+            pool_maxsize=pool_maxsize,  # Keep-alive connections per host
+            max_retries=retry_strategy
+        )
+
+    def _build_ssl_context(self) -> ssl.SSLContext:
+        """Build the SSL context shared by every pooled connection"""
+        context = ssl.create_default_context()
+        if not self.verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return context
+
+    @staticmethod
+    def host_key(url: Optional[str]) -> str:
+        """Normalise a URL to the host its session is keyed on"""
+        if not url:
+            return ''
+        try:
+            return urlparse(url).netloc.lower()
+        except Exception:
+            return ''
+
+    def get(self, url: Optional[str] = None) -> requests.Session:
+        """Return the pooled session for the host of url, creating it on first use"""
+        host = self.host_key(url)
+        session = self._sessions.get(host)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._new_session()
+                self._sessions[host] = session
+        return session
+
+    def headers_for(self, url: Optional[str] = None) -> Dict[str, str]:
+        """Headers (including the per-host user agent) used for requests to url"""
+        return dict(self.get(url).headers)
+
+    def _new_session(self) -> requests.Session:
+        """Create a session with a random user agent mounted on the shared adapter"""
+        session = requests.Session()
+        session.verify = self.verify
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+        session.headers.update(DEFAULT_HEADERS)
+        session.headers['User-Agent'] = random.choice(self.user_agents)
+        return session
+
+    def close(self):
+        """Close every pooled connection"""
+        with self._lock:
+            self._sessions.clear()
+        self.adapter.close()
@@ -1,6 +1,6 @@
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+from parser_backends import make_soup
 import json
 import time
 import re
@@ -37,7 +37,7 @@ def scrape_job_page(url, keywords):
         response = requests.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content)
         page_text = soup.get_text().lower()
         
         # Find job listings (common selectors)
@@ -0,0 +1,89 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+def dedupe_keywords(keywords: Iterable[str]) -> List[str]:
+    """Drop blank keywords and case variants, keeping the first spelling of each"""
+    seen = set()
+    unique = []
+    for keyword in keywords:
+        key = keyword.strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(keyword.strip())
+    return unique
+
+
+class KeywordMatcher:
+    """Case-insensitive multi-keyword matcher built as an Aho-Corasick automaton.
+
+    All keywords are found in one pass over the text, so matching costs
+    O(len(text)) however many keywords the config lists, instead of one regex
+    search per keyword. Failure links are folded into a full transition table
+    up front, which keeps the scan loop to a single dict lookup per character.
+    Positions refer to the lower-cased text.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = dedupe_keywords(keywords)
+        transitions: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword.lower():
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(transitions)
+                    transitions[state][char] = next_state
+                    transitions.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Breadth-first: a state's failure target is always resolved before the state itself
+        fail = [0] * len(transitions)
+        self._delta: List[Dict[str, int]] = [dict(transitions[0])] + [None] * (len(transitions) - 1)
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            delta = dict(self._delta[fail[state]])
+            delta.update(transitions[state])
+            self._delta[state] = delta
+            for char, next_state in transitions[state].items():
+                fail[next_state] = self._delta[fail[state]].get(char, 0)
+                queue.append(next_state)
+        self._outputs = [tuple(output) for output in outputs]
+        self._lengths = [len(keyword.lower()) for keyword in self.keywords]
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (start, keyword) for every keyword occurrence, overlaps included"""
+        delta, outputs, lengths = self._delta, self._outputs, self._lengths
+        state = 0
+        for position, char in enumerate(text.lower()):
+            state = delta[state].get(char, 0)
+            for index in outputs[state]:
+                yield position - lengths[index] + 1, self.keywords[index]
+
+    def search(self, text: str) -> bool:
+        """Whether any keyword occurs in text; stops at the first hit"""
+        if not text:
+            return False
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for char in text.lower():
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                return True
+        return False
+
+    def matches(self, text: str) -> Dict[str, List[int]]:
+        """Every keyword found in text with the start positions of its occurrences"""
+        found: Dict[str, List[int]] = {}
+        for start, keyword in self.finditer(text):
+            found.setdefault(keyword, []).append(start)
+        return found
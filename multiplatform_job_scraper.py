@@ -1,27 +1,67 @@
 import requests
 from bs4 import BeautifulSoup
-import time
-import random
+import soupsieve
 from urllib.parse import urljoin, urlparse
 import csv
 import pandas as pd
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Set
+from dataclasses import dataclass, asdict
+from typing import List, Optional, Dict, Set, Tuple
 import re
 import json
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-import ssl
-import warnings
-from urllib3.exceptions import InsecureRequestWarning
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from collections import Counter, deque
+import heapq
+import itertools
+import time
 import os
+import argparse
+import glob
+import threading
+from datetime import datetime
+from http_pool import FetchResult, SessionPool, single_attempt
+from rate_limiter import THROTTLE_STATUSES, HostRateLimiter, HostThrottled, parse_retry_after
+from page_cache import PageCache
+from http_cache import HttpDiskCache
+from failure_ledger import CooldownActive, FailureLedger
+from career_probe import race_probe
+from company_stats import CompanyStats
+from scan_budget import BudgetExceeded, Deadline, budget_timeout, current_deadline, deadline_scope
+from sharding import parse_shard, select_shard
+from checkpoint import ScanJournal
+from keyword_matcher import KeywordMatcher, dedupe_keywords
+from parser_backends import DEFAULT_BACKEND, get_backend
+from page_prefilter import PagePrefilter
+from page_features import PageFeatures, build_page_features
+from text_cache import TextCache
+from selector_plans import BoardSelectors, FieldSelectors
+from structured_jobs import (Posting, has_microdata, has_structured_data, postings_from_hydration,
+                             postings_from_json_ld, postings_from_microdata, script_blocks)
+from extraction_cascade import ExtractionCascade
+from ats_adapters import build_adapters
+from async_scan import AsyncScanEngine
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Bump when extraction output changes so cached extraction results are not reused
+EXTRACTION_VERSION = 5
+
+# Page structure that suggests a job listing
+JOB_CLASS_PATTERN = re.compile(r'job|position|opening|career|role', re.I)
+JOB_DATA_QA_PATTERN = re.compile(r'job|opening', re.I)
+JOB_DATA_TESTID_PATTERN = re.compile(r'job|position', re.I)
+JOB_ACTION_PATTERN = re.compile(r'apply|view job|see details', re.I)
+POSTING_CLASS_PATTERN = re.compile(r'posting', re.I)
+
+# Hrefs that point at a posting rather than at site navigation
+# Hrefs that name one posting: an id or slug under a jobs path, or a job id parameter
+JOB_POSTING_HREF_PATTERN = re.compile(
+    r'/(?:jobs?|positions?|postings?|openings?|vacanc(?:y|ies)|requisitions?)/[^/?#\s]+'
+    r'|[?&](?:gh_jid|jobid|job_id|jid|reqid|req_id|requisitionid)=\w+', re.I)
+
 @dataclass
 class JobListing:
     title: str
@@ -31,6 +71,8 @@ class JobListing:
     description: str = ""
     source: str = "careers"
     date_found: str = ""
+    date_posted: str = ""
+    team: str = ""
 
 @dataclass
 class Company:
@@ -45,6 +87,31 @@ class MultiplatformJobScraper:
         self.setup_session()
         self.existing_jobs = set()
         
+        # Scan-level deadline and per-company outcomes, reset by run_scan
+        self.scan_deadline = Deadline()
+        self.timed_out_companies: List[str] = []
+        self.not_started_companies: List[str] = []
+        
+        # Per-company history that decides the scan order
+        self.company_stats = CompanyStats(
+            path=self.settings.get('company_stats_file', 'results/company_stats.json'),
+            defer_after_empty=self.settings.get('schedule_defer_after_empty_scans', 8),
+            sample_every_days=self.settings.get('schedule_sample_every_days', 7)
+        )
+        
+        # Outcomes of finished companies, flushed as they complete so a scan can resume
+        self.journal: Optional[ScanJournal] = None
+        
+        # Counters shared by worker threads
+        self._stats_lock = threading.Lock()
+        self.prefilter_skipped = 0
+        
+        # HTML parser behind every BeautifulSoup tree the extractors walk
+        self.parser_backend = get_backend(self.settings.get('parser_backend', DEFAULT_BACKEND))
+        
+        # Pages fetched during this scan, shared between discovery and extraction
+        self.page_cache = PageCache(max_entries=self.settings.get('page_cache_size', 128))
+        
         # Enhanced career page patterns
         self.career_paths = [
             '/careers/', '/jobs/', '/careers/jobs/'  # Limited set to avoid timeouts
@@ -104,6 +171,43 @@ class MultiplatformJobScraper:
                 ]
             }
         }
+        
+        # Selector strings compiled once, so extraction never parses a selector per container
+        self.board_selectors = {
+            board: BoardSelectors.compile(selectors)
+            for board, selectors in self.job_selectors.items() if board != 'generic'
+        }
+        # All generic container selectors as one compiled selector, matched per tag during the DOM walk
+        self.generic_container_selector = soupsieve.compile(', '.join(self.job_selectors['generic']['container']))
+        # Generic title and location selectors, ranked and matched in one walk of each job element
+        self.generic_field_selectors = FieldSelectors(self.job_selectors['generic']['title'],
+                                                      self.job_selectors['generic']['location'])
+        
+        # Extraction strategies, cheapest first; the first one that understands a page settles it
+        self.extraction_cascade = ExtractionCascade([
+            ('structured', self.extract_structured_data),
+            ('prefilter', self.extract_nothing_if_prefiltered),
+            ('board', self.extract_known_board),
+            ('links', self.extract_from_job_links),
+            ('generic', self.extract_generic)
+        ])
+        
+        # Hosted job boards with a structured feed, by board type, read directly instead of scraping their HTML
+        self.ats_adapters = {}
+        if self.settings.get('ats_adapters_enabled', True):
+            self.ats_adapters = build_adapters(self, self.settings, self.job_keywords)
+        
+        # Words that make a link worth following from a careers page
+        self.job_link_keywords = [
+            'job', 'career', 'opening', 'position', 'opportunity', 'role',
+            'hiring', 'join', 'work', 'employment', 'vacancy', 'apply'
+        ]
+        
+        # Raw-bytes check that skips parsing pages without any keyword or link worth following
+        self.page_prefilter = None
+        if self.settings.get('prefilter_enabled', True):
+            self.page_prefilter = PagePrefilter(self.job_keywords,
+                                                self.job_link_keywords + list(self.job_board_patterns))
 
     def load_config(self, config_file: str):
         """Load configuration from JSON file with better error handling"""
@@ -111,12 +215,14 @@ class MultiplatformJobScraper:
             with open(config_file, 'r') as f:
                 config = json.load(f)
             
-            # Use ALL keywords from the JSON file
-            self.job_keywords = config.get('keywords', [])
+            # Use ALL keywords from the JSON file; matching is case-insensitive, so case variants are dropped
+            keywords = config.get('keywords', [])
+            self.job_keywords = dedupe_keywords(keywords)
             
-            # Make keywords case-insensitive regex patterns
-            self.job_patterns = [re.compile(re.escape(keyword), re.IGNORECASE) for keyword in self.job_keywords]
-            logger.info(f"✅ Loaded {len(self.job_keywords)} keywords from {config_file}")
+            # One automaton matches every keyword in a single pass over the text
+            self.keyword_matcher = KeywordMatcher(self.job_keywords)
+            logger.info(f"✅ Loaded {len(self.job_keywords)} keywords from {config_file} "
+                        f"({len(keywords) - len(self.job_keywords)} case duplicates dropped)")
             
             # Load settings if available
             self.settings = config.get('settings', {})
@@ -128,11 +234,17 @@ class MultiplatformJobScraper:
                 'product manager', 'project manager', 'program manager', 'business analyst',
                 'strategy manager', 'product owner', 'technical project manager'
             ]
-            self.job_patterns = [re.compile(re.escape(keyword), re.IGNORECASE) for keyword in self.job_keywords]
+            self.keyword_matcher = KeywordMatcher(self.job_keywords)
             self.settings = {}
 
+    @property
+    def extraction_fingerprint(self) -> str:
+        """Identifies the keyword set, parser and extractor that produced a cached extraction"""
+        payload = json.dumps([EXTRACTION_VERSION, self.parser_backend.name, sorted(self.job_keywords)])
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
     def setup_session(self):
-        """Set up requests session with retry strategy and rotating user agents"""
+        """Set up the pooled sessions with retry strategy and per-host user agents"""
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -140,40 +252,42 @@ class MultiplatformJobScraper:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0'
         ]
-
-    def get_session(self):
-        """Create a new session with random user agent and SSL/timeout fixes"""
-        session = requests.Session()
         
-        # Disable SSL warnings for problematic sites
-        warnings.filterwarnings('ignore', category=InsecureRequestWarning)
-        session.verify = False  # Disable SSL verification for problematic sites
+        # One pool of keep-alive connections for the whole scan, sessions keyed per host
+        self.session_pool = SessionPool(
+            self.user_agents,
+            pool_connections=self.settings.get('http_pool_connections', 100),
+            pool_maxsize=self.settings.get('http_pool_maxsize', 10)
+        )
+        
+        # Politeness is per host, so requests to different hosts never wait on each other
+        self.rate_limiter = HostRateLimiter(
+            requests_per_second=self.settings.get('rate_limit_requests_per_second', 1.0),
+            burst=self.settings.get('rate_limit_burst', 2),
+            max_concurrent_per_host=self.settings.get('rate_limit_max_concurrent_per_host', 2),
+            min_requests_per_second=self.settings.get('rate_limit_min_requests_per_second', 0.05)
+        )
         
-        # Enhanced retry strategy
-        retry_strategy = Retry(
-            total=2,  # Reduced retries to avoid long timeouts
-            backoff_factor=0.5,  # Faster backoff
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]  # Only retry GET requests
+        # Known-dead URLs and hosts are skipped until their cool-down expires
+        self.failure_ledger = FailureLedger(
+            path=self.settings.get('failure_ledger_file', 'results/failure_ledger.json'),
+            cooldown_hours=self.settings.get('failure_cooldown_hours', 20),
+            max_cooldown_hours=self.settings.get('failure_max_cooldown_hours', 336),
+            ttl_days=self.settings.get('failure_ttl_days', 30),
+            host_failure_threshold=self.settings.get('failure_host_threshold', 2)
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        session.headers.update({
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        })
-        return session
+        # Persistent cache so unchanged career pages come back as 304s on daily runs
+        self.http_cache = None
+        if self.settings.get('http_cache_enabled', True):
+            self.http_cache = HttpDiskCache(
+                directory=self.settings.get('http_cache_dir', '.cache/http'),
+                max_bytes=self.settings.get('http_cache_max_mb', 200) * 1024 * 1024
+            )
+
+    def get_session(self, url: Optional[str] = None):
+        """Return the long-lived pooled session for the host of url"""
+        return self.session_pool.get(url)
 
     def load_companies(self, csv_file: str) -> List[Company]:
         """Load companies from CSV file with NaN value handling"""
@@ -244,10 +358,158 @@ class MultiplatformJobScraper:
         self.existing_jobs = set()
         logger.info(f"Initialized job tracking")
 
+    def fetch_page(self, url: str, timeout: int) -> FetchResult:
+        """GET a page through the pooled session for its host, within the host's rate limit"""
+        session = self.get_session(url)
+        host = SessionPool.host_key(url)
+        headers = self.http_cache.request_headers(url) if self.http_cache else {}
+        
+        # A host that cannot serve us soon raises HostThrottled so the company is requeued
+        with self.rate_limiter.limit(host, max_wait=self.settings.get('throttle_max_wait_seconds', 5)):
+            response = session.get(url, timeout=timeout, allow_redirects=True, headers=headers)
+        
+        if response.status_code in THROTTLE_STATUSES:
+            retry_at = self.rate_limiter.throttle(host, parse_retry_after(response.headers.get('Retry-After')))
+            raise HostThrottled(host, retry_at)
+        self.rate_limiter.record_success(host)
+        
+        page = FetchResult(
+            url=url,
+            final_url=response.url,
+            status_code=response.status_code,
+            content=response.content,
+            headers=dict(response.headers)
+        )
+        return self.http_cache.complete(page) if self.http_cache else page
+
+    def get_page(self, url: str, timeout: int) -> FetchResult:
+        """Return url from this scan's page cache, fetching it only on a miss"""
+        page = self.page_cache.get(url)
+        if page is None:
+            self.failure_ledger.check(url)
+            # A fetch cut down to what is left of the budget gets one attempt, and timing out
+            # means the budget ran out rather than that the host failed
+            timeout, clamped = budget_timeout(timeout)
+            try:
+                with single_attempt(clamped):
+                    page = self.fetch_page(url, timeout)
+            except requests.exceptions.RequestException as e:
+                if clamped and isinstance(e, requests.exceptions.Timeout):
+                    raise BudgetExceeded(f"time budget ran out fetching {url}") from e
+                self.failure_ledger.record_exception(url, e)
+                raise
+            self.failure_ledger.record_response(page)
+            page = self.page_cache.put(page)
+        return page
+
+    def fetch_json(self, url: str, timeout: int = 15):
+        """GET a JSON API endpoint through the same politeness and caching as pages"""
+        page = self.get_page(url, timeout=timeout)
+        if page.status_code != 200:
+            raise ValueError(f"HTTP {page.status_code} from {url}")
+        return json.loads(page.content)
+
+    def post_json(self, url: str, payload, timeout: int = 15):
+        """POST a JSON query to an API endpoint, with the rate limit, failure ledger and deadline of page fetches"""
+        self.failure_ledger.check(url)
+        timeout, clamped = budget_timeout(timeout)
+        session = self.get_session(url)
+        host = SessionPool.host_key(url)
+        try:
+            with self.rate_limiter.limit(host, max_wait=self.settings.get('throttle_max_wait_seconds', 5)), \
+                    single_attempt(clamped):
+                response = session.post(url, json=payload, timeout=timeout, headers={'Accept': 'application/json'})
+        except requests.exceptions.RequestException as e:
+            if clamped and isinstance(e, requests.exceptions.Timeout):
+                raise BudgetExceeded(f"time budget ran out posting to {url}") from e
+            self.failure_ledger.record_exception(url, e)
+            raise
+        
+        if response.status_code in THROTTLE_STATUSES:
+            retry_at = self.rate_limiter.throttle(host, parse_retry_after(response.headers.get('Retry-After')))
+            raise HostThrottled(host, retry_at)
+        self.rate_limiter.record_success(host)
+        self.failure_ledger.record_response(FetchResult(
+            url=url, final_url=response.url, status_code=response.status_code,
+            content=b'', headers=dict(response.headers)
+        ))
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code} from {url}")
+        return response.json()
+
+    def parse_html(self, content: bytes) -> BeautifulSoup:
+        """Parse a fetched page into a BeautifulSoup tree"""
+        return self.parser_backend.parse(content)
+
+    def page_soup(self, page: FetchResult) -> BeautifulSoup:
+        """Parsed tree for a fetched page, reused from the page cache when possible"""
+        return self.page_cache.parsed(page, self.parse_html)
+
+    def page_features(self, page: FetchResult) -> PageFeatures:
+        """Features of a fetched page, gathered in one walk and reused from the page cache"""
+        return self.page_cache.features(page, lambda page: build_page_features(
+            self.page_soup(page), page.content, self.keyword_matcher, set(self.job_board_patterns.values())))
+
+    def discover_from_page(self, page: FetchResult, base_url: str) -> List[str]:
+        """Collect career URLs from an already-fetched base careers page"""
+        discovered_urls = []
+        if page.status_code == 200:
+            # Boards embedded from a hosted ATS are read through its API, so they come first
+            for adapter in self.ats_adapters.values():
+                discovered_urls.extend(adapter.find_boards(page.content))
+        if page.status_code == 200 and not self.prefiltered(page, follow_links=True):
+            features = self.page_features(page)
+            
+            # Check if current page has jobs
+            if self.has_job_listings(features):
+                discovered_urls.append(page.final_url)
+            
+            # Look for job-related links
+            job_links = self.find_job_links(features, base_url)
+            discovered_urls.extend(job_links[:3])  # Limit to first 3 to avoid timeouts
+        return discovered_urls
+
+    def page_has_job_listings(self, page: FetchResult) -> bool:
+        """Check whether an already-fetched fallback page lists jobs"""
+        if page.status_code != 200 or self.prefiltered(page):
+            return False
+        return self.has_job_listings(self.page_features(page))
+
+    def prefiltered(self, page: FetchResult, follow_links: bool = False) -> bool:
+        """True when the raw page already rules out target jobs (and links worth following)"""
+        if self.page_prefilter is None:
+            return False
+        check = self.page_prefilter.worth_parsing if follow_links else self.page_prefilter.may_match
+        if check(page.content):
+            return False
+        with self._stats_lock:
+            self.prefilter_skipped += 1
+        logger.debug(f"No keyword match in {page.url}, skipped parsing")
+        return True
+
+    def fallback_career_urls(self, base_url: str) -> List[str]:
+        """Common career path variations to try when the base URL yields nothing"""
+        try:
+            parsed_url = urlparse(base_url)
+            base_domain = f"https://{parsed_url.netloc}"
+        except Exception:
+            base_domain = base_url
+        
+        candidates = []
+        for path in self.career_paths:
+            try_url = base_domain + path
+            if try_url != base_url:
+                candidates.append(try_url)
+        return candidates
+
+    def probe_career_url(self, url: str) -> Optional[str]:
+        """Fetch a fallback career URL and return its final URL if it lists jobs"""
+        page = self.get_page(url, timeout=8)
+        return page.final_url if self.page_has_job_listings(page) else None
+
     def discover_career_urls(self, base_url: str, company_name: str) -> List[str]:
         """Discover actual career page URLs with enhanced detection and timeout handling"""
         discovered_urls = []
-        session = self.get_session()
         
         try:
             logger.debug(f"Discovering career URLs for {company_name} from {base_url}")
@@ -259,45 +521,39 @@ class MultiplatformJobScraper:
             
             # Try the base URL first with timeout protection
             try:
-                response = session.get(base_url, timeout=10, allow_redirects=True)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Check if current page has jobs
-                    if self.has_job_listings(soup):
-                        discovered_urls.append(response.url)
-                    
-                    # Look for job-related links
-                    job_links = self.find_job_links(soup, base_url)
-                    discovered_urls.extend(job_links[:3])  # Limit to first 3 to avoid timeouts
-                    
+                page = self.get_page(base_url, timeout=10)
+                discovered_urls.extend(self.discover_from_page(page, base_url))
             except (requests.exceptions.Timeout, requests.exceptions.SSLError, 
-                    requests.exceptions.ConnectionError) as e:
+                    requests.exceptions.ConnectionError, CooldownActive) as e:
                 logger.debug(f"Connection issue with {base_url}: {e}")
                 return []
             
             # Try common career path variations (limited to avoid timeouts)
             if len(discovered_urls) == 0:  # Only try if no URLs found yet
-                try:
-                    parsed_url = urlparse(base_url)
-                    base_domain = f"https://{parsed_url.netloc}"
-                except Exception:
-                    base_domain = base_url
-                
-                for path in self.career_paths:
-                    try_url = base_domain + path
-                    if try_url not in [base_url] + discovered_urls:
+                candidates = self.fallback_career_urls(base_url)
+                if self.settings.get('discovery_probe_mode', 'race') == 'race':
+                    # Fire every candidate at once and keep the earliest in the list that lists jobs
+                    hit = race_probe(candidates, self.probe_career_url,
+                                     max_workers=self.settings.get('discovery_probe_workers', 8),
+                                     reraise=(HostThrottled, BudgetExceeded))
+                    if hit:
+                        discovered_urls.append(hit[1])
+                        logger.debug(f"Found jobs at: {hit[1]}")
+                else:
+                    for try_url in candidates:
                         try:
-                            response = session.get(try_url, timeout=8, allow_redirects=True)
-                            if response.status_code == 200:
-                                soup = BeautifulSoup(response.content, 'html.parser')
-                                if self.has_job_listings(soup):
-                                    discovered_urls.append(response.url)
-                                    logger.debug(f"Found jobs at: {response.url}")
-                                    break  # Stop after finding first working URL
+                            found_url = self.probe_career_url(try_url)
+                            if found_url:
+                                discovered_urls.append(found_url)
+                                logger.debug(f"Found jobs at: {found_url}")
+                                break  # Stop after finding first working URL
+                        except (HostThrottled, BudgetExceeded):
+                            raise
                         except Exception:
                             continue
                             
+        except (HostThrottled, BudgetExceeded):
+            raise  # Requeue the company, or stop it with what it has so far
         except Exception as e:
             logger.debug(f"Error discovering URLs for {company_name}: {e}")
         
@@ -305,17 +561,13 @@ class MultiplatformJobScraper:
         unique_urls = list(dict.fromkeys(discovered_urls))[:2]  # Max 2 URLs to avoid timeouts
         return unique_urls
 
-    def find_job_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def find_job_links(self, features: PageFeatures, base_url: str) -> List[str]:
         """Find links that likely lead to job listings"""
         job_links = []
-        
-        job_link_keywords = [
-            'job', 'career', 'opening', 'position', 'opportunity', 'role',
-            'hiring', 'join', 'work', 'employment', 'vacancy', 'apply'
-        ]
+        job_link_keywords = self.job_link_keywords
         
         try:
-            for link in soup.find_all('a', href=True)[:20]:  # Limit to first 20 links
+            for link in features.links[:20]:  # Limit to first 20 links
                 href = link['href']
                 link_text = link.get_text().lower().strip()
                 
@@ -338,29 +590,24 @@ class MultiplatformJobScraper:
         
         return job_links
 
-    def has_job_listings(self, soup: BeautifulSoup) -> bool:
+    def has_job_listings(self, features: PageFeatures) -> bool:
         """Enhanced detection of job listings on page"""
         try:
             # Check for job-specific content
-            page_text = soup.get_text().lower()
             job_indicators = ['product manager', 'project manager', 'program manager', 'business analyst', 'strategy manager']
-            if any(indicator in page_text for indicator in job_indicators):
+            if any(indicator in features.text for indicator in job_indicators):
                 return True
                 
             # Check for common job listing structures
-            job_indicators = [
-                soup.find_all(class_=re.compile(r'job|position|opening|career|role', re.I)),
-                soup.find_all('div', {'data-qa': re.compile(r'job|opening', re.I)}),
-                soup.find_all('div', {'data-testid': re.compile(r'job|position', re.I)}),
-                soup.find_all(['button', 'a'], string=re.compile(r'apply|view job|see details', re.I))
-            ]
-            
-            return any(len(indicators) > 0 for indicators in job_indicators)
+            return (features.has_class(JOB_CLASS_PATTERN) or
+                    features.has_div_attribute('data-qa', JOB_DATA_QA_PATTERN) or
+                    features.has_div_attribute('data-testid', JOB_DATA_TESTID_PATTERN) or
+                    features.has_action(JOB_ACTION_PATTERN))
         except Exception as e:
             logger.debug(f"Error checking for job listings: {e}")
             return False
 
-    def detect_job_board_type(self, url: str, soup: BeautifulSoup) -> str:
+    def detect_job_board_type(self, url: str, features: PageFeatures) -> str:
         """Detect which type of job board this is"""
         try:
             # Check URL for known patterns
@@ -369,73 +616,230 @@ class MultiplatformJobScraper:
                     return board_type
             
             # Check page content for indicators
-            page_content = str(soup).lower()
-            if 'greenhouse' in page_content and soup.find(attrs={'data-qa': True}):
+            if 'greenhouse' in features.fingerprints and 'data-qa' in features.attribute_names:
                 return 'greenhouse'
-            elif 'bamboohr' in page_content:
+            elif 'bamboohr' in features.fingerprints:
                 return 'bamboohr'
-            elif soup.find(attrs={'data-automation-id': True}):
+            elif 'data-automation-id' in features.attribute_names:
                 return 'workday'
-            elif soup.find(class_=re.compile(r'posting', re.I)):
+            elif features.has_class(POSTING_CLASS_PATTERN):
                 return 'lever'
         except Exception as e:
             logger.debug(f"Error detecting job board type: {e}")
         
         return 'generic'
 
-    def extract_jobs_from_page(self, url: str, company: Company) -> List[JobListing]:
-        """Extract job listings from a page with smart detection"""
-        jobs = []
-        session = self.get_session()
+    def ats_jobs(self, url: str, company: Company,
+                 listed: Optional[Dict] = None) -> Optional[List[JobListing]]:
+        """Target jobs from the API of the ATS hosting url; None when no adapter can read it.
         
-        try:
-            logger.debug(f"Extracting jobs from: {url}")
-            response = session.get(url, timeout=15, allow_redirects=True)
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch {url}: {response.status_code}")
-                return jobs
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Detect job board type
-            board_type = self.detect_job_board_type(url, soup)
-            logger.debug(f"Detected job board type: {board_type}")
-            
-            # Use appropriate extraction method
-            if board_type in self.job_selectors and board_type != 'generic':
-                jobs = self.extract_with_selectors(soup, company, url, board_type)
-            else:
-                jobs = self.extract_with_generic_method(soup, company, url)
+        listed maps the boards already read for this company to their URL, so
+        several links to one board cost a single listing.
+        """
+        for adapter in self.ats_adapters.values():
+            key = adapter.board_key(url)
+            if key is None:
+                continue
+            if listed is not None and listed.setdefault((adapter.name, key), url) != url:
+                return []
+            try:
+                postings = adapter.list_jobs(company, url)
+            except (HostThrottled, BudgetExceeded):
+                raise
+            except Exception as e:
+                logger.warning(f"  {adapter.name} API failed for {url}, scraping the page instead: {e}")
+                return None
+            if postings is None:
+                continue
             
-            # Filter for target roles
+            jobs = [self.listing_from_posting(posting, company, url, source=f"{adapter.name}_api")
+                    for posting in postings]
             target_jobs = [job for job in jobs if self.is_target_job_role(job.title)]
-            
-            if target_jobs:
-                logger.info(f"  ✅ Found {len(target_jobs)} target jobs")
-            
+            logger.info(f"  ✅ {adapter.name} API: {len(target_jobs)} target jobs of {len(jobs)} open")
             return target_jobs
-                
+        return None
+
+    def extract_jobs_from_page(self, url: str, company: Company) -> List[JobListing]:
+        """Extract job listings from a page with smart detection"""
+        try:
+            logger.debug(f"Extracting jobs from: {url}")
+            page = self.get_page(url, timeout=15)
+            return self.extract_jobs_from_response(page, company)
+        except CooldownActive as e:
+            logger.debug(f"Skipping {url}: {e}")
+            return []
+        except (HostThrottled, BudgetExceeded):
+            raise
         except Exception as e:
             logger.error(f"Error extracting jobs from {url}: {e}")
-            return jobs
+            return []
+
+    def extract_jobs_from_response(self, page: FetchResult, company: Company) -> List[JobListing]:
+        """Extract target job listings from an already-fetched page"""
+        url = page.url
+        if page.status_code != 200:
+            logger.warning(f"Failed to fetch {url}: {page.status_code}")
+            return []
+            
+        # Unchanged page: reuse what was extracted from it last time
+        if page.not_modified and self.http_cache:
+            cached_jobs = self.http_cache.load_extraction(url, self.extraction_fingerprint)
+            if cached_jobs is not None:
+                target_jobs = [JobListing(**job) for job in cached_jobs]
+                if target_jobs:
+                    logger.info(f"  ✅ Found {len(target_jobs)} target jobs (unchanged since last scan)")
+                return target_jobs
+        
+        tier, jobs = self.extraction_cascade.run(page, company)
+        logger.debug(f"Extracted {len(jobs)} jobs from {url} with the {tier} tier")
+        
+        # Filter for target roles
+        target_jobs = [job for job in jobs if self.is_target_job_role(job.title)]
+        
+        if target_jobs:
+            logger.info(f"  ✅ Found {len(target_jobs)} target jobs")
+        
+        if self.http_cache:
+            self.http_cache.store_extraction(url, self.extraction_fingerprint,
+                                             [asdict(job) for job in target_jobs])
+        
+        return target_jobs
+
+    def extract_structured_data(self, page: FetchResult, company: Company) -> Optional[List[JobListing]]:
+        """Cascade tier 1: schema.org JobPosting (JSON-LD, microdata) and job records in embedded app state"""
+        if not has_structured_data(page.content):
+            return None
+        if self.page_prefilter and not self.page_prefilter.mentions_keyword(page.content):
+            return None
+        
+        job_postings, hydration = [], []
+        try:
+            # Script blocks are cut straight out of the raw page; only microdata needs the DOM
+            for kind, text in script_blocks(page.content):
+                if kind == 'application/ld+json':
+                    job_postings.extend(postings_from_json_ld(text))
+                else:
+                    hydration.extend(postings_from_hydration(text))
+            if has_microdata(page.content):
+                job_postings.extend(postings_from_microdata(self.page_soup(page)))
+        except Exception as e:
+            logger.debug(f"Error reading structured data from {page.url}: {e}")
+            return None
+        
+        # JobPosting markup is authoritative; app state only counts once it holds a target job
+        if not job_postings and not any(self.is_target_job_role(posting.title) for posting in hydration):
+            return None
+        return [self.listing_from_posting(posting, company, page.url) for posting in job_postings + hydration]
+
+    def listing_from_posting(self, posting: Posting, company: Company, page_url: str,
+                             source: str = "careers_structured") -> JobListing:
+        """JobListing for a posting read from structured data"""
+        return JobListing(
+            title=posting.title,
+            company=company.name,
+            url=urljoin(page_url, posting.url) if posting.url else page_url,
+            location=posting.location,
+            description=posting.description[:300],
+            source=source,
+            date_posted=posting.date_posted,
+            team=posting.team
+        )
+
+    def extract_nothing_if_prefiltered(self, page: FetchResult, company: Company) -> Optional[List[JobListing]]:
+        """Cascade gate: no keyword anywhere in the page text means no tier below can match"""
+        return [] if self.prefiltered(page) else None
 
-    def extract_with_selectors(self, soup: BeautifulSoup, company: Company, url: str, board_type: str) -> List[JobListing]:
+    def extract_known_board(self, page: FetchResult, company: Company) -> Optional[List[JobListing]]:
+        """Cascade tier 2: selectors of a detected job board"""
+        features = self.page_features(page)
+        board_type = self.detect_job_board_type(page.url, features)
+        logger.debug(f"Detected job board type: {board_type}")
+        if board_type not in self.board_selectors:
+            return None
+        jobs = self.extract_with_selectors(self.page_soup(page), company, page.url, board_type, features.texts)
+        return jobs or None
+
+    def extract_from_job_links(self, page: FetchResult, company: Company) -> Optional[List[JobListing]]:
+        """Cascade tier 3: links to postings whose text is a target job title.
+        
+        Only hrefs that name a single posting count, so a navigation link such
+        as "Product Management" to a team page leaves the page to the generic
+        tier.
+        """
+        features = self.page_features(page)
+        texts = features.texts
+        found = []
+        for link in features.links:
+            try:
+                title = texts.stripped(link)
+                href = link['href'].strip()
+                if (not JOB_POSTING_HREF_PATTERN.search(href) or not self.is_plausible_title(title)
+                        or not self.is_target_job_role(title)):
+                    continue
+                # The link's list item or row, when it holds no other posting, carries location and summary
+                container = link.parent
+                for _ in range(3):
+                    if container is None or container.name in ['li', 'tr', 'article', 'div']:
+                        break
+                    container = container.parent
+                else:
+                    container = None
+                found.append((link, title, urljoin(page.url, href), container))
+            except Exception as e:
+                logger.debug(f"Error checking job link: {e}")
+                continue
+        if not found:
+            return None
+        
+        shared = Counter(id(container) for _, _, _, container in found if container is not None)
+        jobs, seen_urls = [], set()
+        for link, title, job_url, container in found:
+            if job_url in seen_urls:
+                continue
+            seen_urls.add(job_url)
+            if container is None or shared[id(container)] > 1:
+                container = link
+            location = ""
+            try:
+                loc_elem = self.generic_field_selectors.find_location(
+                    container, lambda tag: len(texts.stripped(tag)) < 200)
+                if loc_elem:
+                    location = texts.stripped(loc_elem)
+            except Exception as e:
+                logger.debug(f"Error extracting location for {job_url}: {e}")
+            jobs.append(JobListing(
+                title=title,
+                company=company.name,
+                url=job_url,
+                location=location,
+                description=texts.stripped(container)[:300],
+                source="careers_links"
+            ))
+        return jobs
+
+    def extract_generic(self, page: FetchResult, company: Company) -> List[JobListing]:
+        """Cascade tier 4: full generic DOM search, which always settles the page"""
+        return self.extract_with_generic_method(self.page_features(page), company, page.url)
+
+    def extract_with_selectors(self, soup: BeautifulSoup, company: Company, url: str, board_type: str,
+                               texts: Optional[TextCache] = None) -> List[JobListing]:
         """Extract jobs using board-specific selectors"""
         jobs = []
-        selectors = self.job_selectors[board_type]
+        texts = texts or TextCache()
+        selectors = self.board_selectors[board_type]
         
         try:
             # Find job containers
-            containers = soup.select(selectors['container'])
+            containers = selectors.container.select(soup)
             
             for container in containers:
                 try:
                     # Extract title
-                    title_elem = container.select_one(selectors['title'])
+                    title_elem = selectors.title.select_one(container)
                     if not title_elem:
                         continue
                         
-                    title = title_elem.get_text().strip()
+                    title = texts.stripped(title_elem)
                     if not title:
                         continue
                     
@@ -450,17 +854,17 @@ class MultiplatformJobScraper:
                     
                     # Extract location
                     location = ""
-                    if 'location' in selectors:
-                        loc_elem = container.select_one(selectors['location'])
+                    if selectors.location:
+                        loc_elem = selectors.location.select_one(container)
                         if loc_elem:
-                            location = loc_elem.get_text().strip()
+                            location = texts.stripped(loc_elem)
                     
                     jobs.append(JobListing(
                         title=title,
                         company=company.name,
                         url=job_url,
                         location=location,
-                        description=container.get_text().strip()[:300],
+                        description=texts.stripped(container)[:300],
                         source=f"careers_{board_type}"
                     ))
                 except Exception as e:
@@ -472,50 +876,49 @@ class MultiplatformJobScraper:
         
         return jobs
 
-    def extract_with_generic_method(self, soup: BeautifulSoup, company: Company, url: str) -> List[JobListing]:
+    def extract_with_generic_method(self, features: PageFeatures, company: Company, url: str) -> List[JobListing]:
         """Generic extraction method for unknown job boards"""
         jobs = []
         
         try:
-            # Try multiple strategies
-            job_elements = []
+            # Both strategies read the page features instead of walking the tree again. Candidates
+            # are keyed by identity, so a container reached through several keywords or selectors
+            # is extracted once, and element text comes from the page's text cache.
+            keyword_containers = {}
+            selector_containers = {}
+            texts = features.texts
             
-            # Strategy 1: Find elements containing job keywords
-            for pattern in self.job_patterns:
+            # Strategy 1: climb from each keyword hit to its job container
+            for node in features.keyword_strings:
                 try:
-                    elements = soup.find_all(string=pattern)
-                    for element in elements:
-                        # Find the job container
-                        container = element.parent
-                        for _ in range(5):  # Look up to 5 levels up
-                            if container and container.name in ['div', 'li', 'section', 'article', 'tr']:
-                                if len(container.get_text().strip()) > 50:  # Reasonable content length
-                                    job_elements.append(container)
-                                    break
-                            container = container.parent if container else None
+                    container = node.parent
+                    for _ in range(5):  # Look up to 5 levels up
+                        if container and container.name in ['div', 'li', 'section', 'article', 'tr']:
+                            if len(texts.stripped(container)) > 50:  # Reasonable content length
+                                keyword_containers.setdefault(id(container), container)
+                                break
+                        container = container.parent if container else None
                 except Exception as e:
-                    logger.debug(f"Error with pattern {pattern}: {e}")
+                    logger.debug(f"Error checking keyword match: {e}")
                     continue
             
-            # Strategy 2: Look for common job container patterns
-            for selector in self.job_selectors['generic']['container']:
+            # Strategy 2: common job container patterns that mention a keyword
+            for node in features.tags:
                 try:
-                    containers = soup.select(selector)
-                    for container in containers:
-                        try:
-                            if any(pattern.search(container.get_text()) for pattern in self.job_patterns):
-                                job_elements.append(container)
-                        except Exception as e:
-                            logger.debug(f"Error checking container text: {e}")
-                            continue
+                    if self.generic_container_selector.match(node) and self.keyword_matcher.search(texts.text(node)):
+                        selector_containers[id(node)] = node
                 except Exception as e:
-                    logger.debug(f"Error with selector {selector}: {e}")
+                    logger.debug(f"Error checking container: {e}")
                     continue
             
+            # Keyword hits first, then selector matches, each in document order
+            job_elements = list(keyword_containers.values())
+            job_elements.extend(element for key, element in selector_containers.items() if key not in keyword_containers)
+            
             # Extract job details from found elements
             for element in job_elements:
                 try:
-                    job = self.extract_job_from_element(element, company, url)
+                    job = self.extract_job_from_element(element, company, url, texts)
                     if job:
                         jobs.append(job)
                 except Exception as e:
@@ -527,34 +930,29 @@ class MultiplatformJobScraper:
         
         return jobs
 
-    def extract_job_from_element(self, element, company: Company, base_url: str) -> Optional[JobListing]:
+    def extract_job_from_element(self, element, company: Company, base_url: str,
+                                 texts: Optional[TextCache] = None) -> Optional[JobListing]:
         """Extract job details from a single element with improved title extraction"""
         try:
-            # Find title using multiple strategies with better filtering
-            title = ""
-            for selector in self.job_selectors['generic']['title']:
-                try:
-                    title_elem = element.select_one(selector)
-                    if title_elem:
-                        potential_title = title_elem.get_text().strip()
-                        # Better title validation
-                        if (len(potential_title) > 5 and 
-                            len(potential_title) < 100 and  # Not too long
-                            not self.is_description_text(potential_title)):  # Not description text
-                            title = potential_title
-                            break
-                except Exception as e:
-                    logger.debug(f"Error with title selector {selector}: {e}")
-                    continue
+            texts = texts or TextCache()
+            
+            # Find title and location with the ranked generic selectors, in one walk of the element
+            title_elem, loc_elem = None, None
+            try:
+                title_elem, loc_elem = self.generic_field_selectors.find(
+                    element,
+                    title_ok=lambda tag: self.is_plausible_title(texts.stripped(tag)),
+                    location_ok=lambda tag: len(texts.stripped(tag)) < 200  # Reasonable location length
+                )
+            except Exception as e:
+                logger.debug(f"Error matching title and location selectors: {e}")
+            title = texts.stripped(title_elem) if title_elem else ""
             
             if not title:
                 # Fallback: use the first reasonable line of text
                 try:
-                    text_lines = [line.strip() for line in element.get_text().split('\n') if line.strip()]
-                    for line in text_lines[:3]:  # Check first 3 lines only
-                        if (len(line) > 5 and 
-                            len(line) < 100 and 
-                            not self.is_description_text(line)):
+                    for line in texts.lines(element)[:3]:  # Check first 3 lines only
+                        if self.is_plausible_title(line):
                             title = line
                             break
                 except Exception as e:
@@ -576,25 +974,14 @@ class MultiplatformJobScraper:
             except Exception as e:
                 logger.debug(f"Error extracting job URL: {e}")
             
-            # Find location
-            location = ""
-            for selector in self.job_selectors['generic']['location']:
-                try:
-                    loc_elem = element.select_one(selector)
-                    if loc_elem:
-                        location = loc_elem.get_text().strip()
-                        if len(location) < 200:  # Reasonable location length
-                            break
-                except Exception as e:
-                    logger.debug(f"Error with location selector {selector}: {e}")
-                    continue
+            location = texts.stripped(loc_elem) if loc_elem else ""
             
             return JobListing(
                 title=title,
                 company=company.name,
                 url=job_url,
                 location=location,
-                description=element.get_text().strip()[:300] if element else "",
+                description=texts.stripped(element)[:300] if element else "",
                 source="careers"
             )
             
@@ -602,6 +989,10 @@ class MultiplatformJobScraper:
             logger.debug(f"Error extracting job details: {e}")
             return None
 
+    def is_plausible_title(self, text: str) -> bool:
+        """Reasonable length for a job title and not description text"""
+        return 5 < len(text) < 100 and not self.is_description_text(text)
+
     def is_description_text(self, text: str) -> bool:
         """Check if text looks like description/marketing copy rather than a job title"""
         text_lower = text.lower()
@@ -635,7 +1026,7 @@ class MultiplatformJobScraper:
     def is_target_job_role(self, title: str) -> bool:
         """Check if job title matches any of our target keywords"""
         try:
-            return any(pattern.search(title) for pattern in self.job_patterns)
+            return self.keyword_matcher.search(title)
         except Exception as e:
             logger.debug(f"Error checking job role: {e}")
             return False
@@ -659,66 +1050,133 @@ class MultiplatformJobScraper:
 
     def scrape_company(self, company: Company) -> List[JobListing]:
         """Scrape all jobs for a single company with improved logic"""
+        if self.skip_cooling_company(company):
+            return []
+        
+        if self.scan_deadline.expired(self.settings.get('scan_deadline_margin_seconds', 30)):
+            self.not_started_companies.append(company.name)
+            return []
+        
         logger.info(f"📊 Scanning {company.name} ({company.size})...")
         all_jobs = []
         
-        try:
-            # Step 1: Try company career pages first
-            career_urls = self.discover_career_urls(company.careers_url, company.name)
-            
-            if not career_urls:
-                logger.warning(f"No career URLs found for {company.name}")
-                career_urls = [company.careers_url]  # Fallback
-            
-            logger.debug(f"Found {len(career_urls)} career page(s) to check")
-            
-            # Scrape career pages
-            for url in career_urls:
-                try:
-                    jobs = self.extract_jobs_from_page(url, company)
-                    all_jobs.extend(jobs)
-                    
-                    # Respectful delay
-                    time.sleep(random.uniform(1, 2))
-                    
-                except Exception as e:
-                    logger.error(f"Error with {url}: {e}")
-            
-            # Remove duplicates from company site
-            unique_jobs = self.remove_duplicates(all_jobs)
-            
-            # Step 2: Only use job boards if NO jobs found on company site
-            if len(unique_jobs) == 0:
-                logger.info(f"  No jobs found on {company.name} career site, checking job boards...")
+        # Discovery, fetches and extraction all share one budget, capped by the scan deadline
+        budget = Deadline(self.settings.get('company_budget_seconds', 90), parent=self.scan_deadline)
+        with deadline_scope(budget):
+            try:
+                # Careers URL on a hosted ATS: one API request replaces discovery and scraping
+                ats_jobs = self.ats_jobs(company.careers_url, company)
+                if ats_jobs is not None:
+                    return self.finalize_company_jobs(company, ats_jobs)
+                listed_boards = {}
                 
-                # Try Indeed first
-                try:
-                    indeed_jobs = self.scrape_indeed(company)
-                    if indeed_jobs:
-                        logger.info(f"  ✅ Found {len(indeed_jobs)} jobs on Indeed")
-                        unique_jobs.extend(indeed_jobs)
-                    else:
-                        logger.info(f"  No jobs found on Indeed")
-                except Exception as e:
-                    logger.error(f"Error scraping Indeed for {company.name}: {e}")
-            
-            else:
-                logger.info(f"  ✅ Found {len(unique_jobs)} jobs on company site, skipping job boards")
-            
-            # Final deduplication
-            final_jobs = self.remove_duplicates(unique_jobs)
-            
-            total_jobs = len(final_jobs)
-            if total_jobs > 0:
-                logger.info(f"  ✅ Total: {total_jobs} target jobs")
-            else:
-                logger.info("  No target jobs found")
-            
-            return final_jobs
+                # Step 1: Try company career pages first
+                career_urls = self.discover_career_urls(company.careers_url, company.name)
+                discovered = bool(career_urls)
+                
+                if not career_urls:
+                    logger.warning(f"No career URLs found for {company.name}")
+                    career_urls = [company.careers_url]  # Fallback
+                
+                logger.debug(f"Found {len(career_urls)} career page(s) to check")
+                
+                # Scrape career pages
+                for url in career_urls:
+                    try:
+                        budget.check()
+                        jobs = self.ats_jobs(url, company, listed_boards)
+                        if jobs is None:
+                            jobs = self.extract_jobs_from_page(url, company)
+                        all_jobs.extend(jobs)
+                    except (HostThrottled, BudgetExceeded):
+                        raise
+                    except Exception as e:
+                        logger.error(f"Error with {url}: {e}")
+                
+                return self.finalize_company_jobs(company, all_jobs, discovered)
+                
+            except HostThrottled:
+                raise  # run_scan puts the company back in the queue
+            except BudgetExceeded:
+                return self.record_timed_out(company, all_jobs)
+            except Exception as e:
+                logger.error(f"Error scraping {company.name}: {e}")
+                self.record_company_outcome(company, [], 'failed')
+                return []
+
+    def record_timed_out(self, company: Company, partial_jobs: List[JobListing]) -> List[JobListing]:
+        """Cancel a company that used up its budget, keeping whatever it found"""
+        jobs = self.remove_duplicates(partial_jobs)
+        self.timed_out_companies.append(company.name)
+        logger.warning(f"⏱️  {company.name} timed out, keeping {len(jobs)} partial jobs")
+        self.record_company_outcome(company, jobs, 'timed_out')
+        return jobs
+
+    def record_company_outcome(self, company: Company, jobs: List[JobListing], status: str):
+        """Journal a finished company and feed it into the scheduler's history"""
+        budget = current_deadline()
+        seconds = budget.elapsed() if budget else None
+        if self.journal:
+            self.journal.record(company.name, status, [asdict(job) for job in jobs], seconds)
+        self.company_stats.record(company.name, [job.url for job in jobs], seconds,
+                                  failed=status in ('failed', 'timed_out'))
+
+    def skip_cooling_company(self, company: Company) -> bool:
+        """Skip a company whose careers URL or host is still cooling down in the failure ledger"""
+        try:
+            self.failure_ledger.check(company.careers_url)
+            return False
+        except CooldownActive as e:
+            logger.info(f"⏭️  Skipping {company.name}: known failing ({e})")
+            if self.journal:
+                self.journal.record(company.name, 'skipped', [])
+            return True
+
+    def finalize_company_jobs(self, company: Company, all_jobs: List[JobListing],
+                              discovered: bool = True) -> List[JobListing]:
+        """Deduplicate career-site jobs and fall back to job boards when there are none"""
+        # Remove duplicates from company site
+        unique_jobs = self.remove_duplicates(all_jobs)
+        
+        # Step 2: Only use job boards if NO jobs found on company site
+        if len(unique_jobs) == 0:
+            logger.info(f"  No jobs found on {company.name} career site, checking job boards...")
             
-        except Exception as e:
-            logger.error(f"Error scraping {company.name}: {e}")
-            return []
+            # Try Indeed first
+            try:
+                indeed_jobs = self.scrape_indeed(company)
+                if indeed_jobs:
+                    logger.info(f"  ✅ Found {len(indeed_jobs)} jobs on Indeed")
+                    unique_jobs.extend(indeed_jobs)
+                else:
+                    logger.info(f"  No jobs found on Indeed")
+            except Exception as e:
+                logger.error(f"Error scraping Indeed for {company.name}: {e}")
+        
+        else:
+            logger.info(f"  ✅ Found {len(unique_jobs)} jobs on company site, skipping job boards")
+        
+        # Final deduplication
+        final_jobs = self.remove_duplicates(unique_jobs)
+        
+        total_jobs = len(final_jobs)
+        if total_jobs > 0:
+            logger.info(f"  ✅ Total: {total_jobs} target jobs")
+            self.failure_ledger.record_success(company.careers_url, clear_soft=True)
+        else:
+            logger.info("  No target jobs found")
+            if not discovered:
+                # Loads but never leads anywhere: probe it less and less often
+                self.failure_ledger.record_failure(company.careers_url, 'no_jobs_found')
+        
+        if final_jobs:
+            status = 'found'
+        elif self.failure_ledger.failed_this_scan(company.careers_url):
+            status = 'failed'
+        else:
+            status = 'empty'
+        self.record_company_outcome(company, final_jobs, status)
+        return final_jobs
 
     def remove_duplicates(self, jobs: List[JobListing]) -> List[JobListing]:
         """Remove duplicate jobs based on title and company"""
@@ -738,7 +1196,7 @@ class MultiplatformJobScraper:
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
-                writer.writerow(['Company', 'Title', 'Location', 'URL', 'Source', 'Description'])
+                writer.writerow(['Company', 'Title', 'Location', 'URL', 'Source', 'Description', 'Date Posted', 'Team'])
                 
                 for job in jobs:
                     writer.writerow([
@@ -747,7 +1205,9 @@ class MultiplatformJobScraper:
                         job.location,
                         job.url,
                         job.source,
-                        job.description[:200]
+                        job.description[:200],
+                        job.date_posted,
+                        job.team
                     ])
             
             logger.info(f"✅ Jobs saved to {filename}")
@@ -755,10 +1215,81 @@ class MultiplatformJobScraper:
         except Exception as e:
             logger.error(f"Error saving results: {e}")
 
-    def run_scan(self, companies_file: str = "companies_final_ready.csv", max_workers: int = 3):
-        """Run the complete scan with optional threading"""
+    def scan_companies(self, companies: List[Company], max_workers: int) -> List[JobListing]:
+        """Scan companies on a worker pool, requeueing any whose host throttled us"""
+        all_jobs = []
+        ready = deque(companies)
+        waiting = []  # Heap of (retry_at, order, company) for throttled companies
+        order = itertools.count()
+        requeues: Dict[int, int] = {}
+        max_requeues = self.settings.get('throttle_max_requeues', 5)
+        deadline_margin = self.settings.get('scan_deadline_margin_seconds', 30)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            while ready or waiting or running:
+                now = time.monotonic()
+                while waiting and waiting[0][0] <= now:
+                    ready.append(heapq.heappop(waiting)[2])
+                
+                # Near the deadline, stop starting companies and let the running ones wind down
+                if (ready or waiting) and self.scan_deadline.expired(deadline_margin):
+                    remaining = list(ready) + [item[2] for item in waiting]
+                    logger.warning(f"⏱️  Scan deadline near, not starting {len(remaining)} remaining companies")
+                    self.not_started_companies.extend(company.name for company in remaining)
+                    ready.clear()
+                    waiting.clear()
+                
+                while ready and len(running) < max_workers:
+                    company = ready.popleft()
+                    running[executor.submit(self.scrape_company, company)] = company
+                
+                # Wake up for the next finished company or the next throttled one coming due
+                timeout = max(0.0, waiting[0][0] - now) if waiting else None
+                if not running:
+                    if waiting:
+                        time.sleep(timeout)
+                    continue
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    company = running.pop(future)
+                    try:
+                        jobs = future.result()
+                        all_jobs.extend(jobs)
+                    except HostThrottled as e:
+                        attempts = requeues.get(id(company), 0) + 1
+                        requeues[id(company)] = attempts
+                        if attempts > max_requeues:
+                            logger.warning(f"Giving up on {company.name} after {max_requeues} throttled attempts: {e}")
+                        else:
+                            logger.info(f"⏸️  {company.name} throttled, requeued ({e})")
+                            heapq.heappush(waiting, (e.retry_at, next(order), company))
+                    except Exception as e:
+                        logger.error(f"Error processing {company.name}: {e}")
+        
+        return all_jobs
+
+    def run_scan(self, companies_file: str = "companies_final_ready.csv", max_workers: int = 3,
+                 use_async: bool = False, deadline_minutes: Optional[float] = None,
+                 shard: Optional[Tuple[int, int]] = None, resume: bool = False,
+                 scan_id: Optional[str] = None):
+        """Run the complete scan with optional threading, or on an asyncio event loop.
+
+        With shard=(index, count) only that shard's companies are scanned and the
+        results go to a shard file for merge_shard_results() instead. With resume,
+        companies already finished under the same scan_id (by default today's
+        date and the shard) are taken from the checkpoint journal, not rescanned.
+        """
         logger.info("🚀 Starting multi-platform job scan...")
         
+        # Wall-clock limit for the whole scan; companies still queued near it are not started
+        if deadline_minutes is None:
+            deadline_minutes = self.settings.get('scan_deadline_minutes')
+        self.scan_deadline = Deadline(deadline_minutes * 60 if deadline_minutes else None)
+        self.timed_out_companies = []
+        self.not_started_companies = []
+        
         # Load companies and existing jobs
         companies = self.load_companies(companies_file)
         self.load_existing_jobs()
@@ -767,39 +1298,105 @@ class MultiplatformJobScraper:
             logger.error("No companies loaded. Exiting.")
             return
         
+        if shard:
+            all_companies = companies
+            companies = select_shard(all_companies, *shard)
+            logger.info(f"🧩 Shard {shard[0]}/{shard[1]}: {len(companies)} of {len(all_companies)} companies")
+        
+        # Every finished company is journaled at once, so a killed scan can pick up where it stopped
+        if scan_id is None:
+            scan_id = datetime.now().strftime('%Y-%m-%d')
+            if shard:
+                scan_id += f"-shard-{shard[0]}-of-{shard[1]}"
+        self.journal = ScanJournal(self.settings.get('checkpoint_dir', '.cache/checkpoints'), scan_id)
+        finished = self.journal.load() if resume else {}
+        resumed_jobs = []
+        if finished:
+            for entry in finished.values():
+                jobs = [JobListing(**job) for job in entry['jobs']]
+                resumed_jobs.extend(jobs)
+                # Outcomes journaled after the interrupted run last saved stats are not in them yet
+                if entry['status'] != 'skipped' and not entry.get('stats_saved'):
+                    self.company_stats.record(entry['company'], [job.url for job in jobs], entry['seconds'],
+                                              failed=entry['status'] in ('failed', 'timed_out'))
+            companies = [company for company in companies if company.name not in finished]
+            logger.info(f"♻️  Resuming scan {scan_id}: {len(finished)} companies already done, "
+                        f"{len(resumed_jobs)} jobs restored")
+        self.journal.open(resume=resume)
+        
+        # Most productive companies first; chronically empty ones wait for their next sample
+        queue, deferred = self.company_stats.schedule(companies)
+        if deferred:
+            logger.info(f"⏭️  Deferring {len(deferred)} companies with no target jobs in recent scans")
+        
         logger.info(f"Keywords: {', '.join(self.job_keywords[:10])}...")
         if len(self.job_keywords) > 10:
             logger.info(f"... and {len(self.job_keywords) - 10} more keywords")
         
-        all_jobs = []
+        all_jobs = list(resumed_jobs)
         
-        if max_workers > 1:
-            # Multi-threaded scanning
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_company = {
-                    executor.submit(self.scrape_company, company): company 
-                    for company in companies
-                }
-                
-                for future in as_completed(future_to_company):
-                    company = future_to_company[future]
-                    try:
-                        jobs = future.result()
-                        all_jobs.extend(jobs)
-                    except Exception as e:
-                        logger.error(f"Error processing {company.name}: {e}")
+        if use_async:
+            # Async scanning: many requests in flight, parsing off the event loop
+            engine = AsyncScanEngine(
+                self,
+                max_in_flight=self.settings.get('async_max_in_flight', 200),
+                parse_workers=self.settings.get('async_parse_workers', 4),
+                max_companies=self.settings.get('async_max_companies', 50),
+                io_workers=self.settings.get('async_io_workers', 8)
+            )
+            all_jobs.extend(engine.run(queue))
         else:
-            # Single-threaded scanning
-            for company in companies:
-                jobs = self.scrape_company(company)
-                all_jobs.extend(jobs)
-                time.sleep(random.uniform(1, 2))  # Delay between companies
+            # Threaded scanning (max_workers=1 scans one company at a time)
+            all_jobs.extend(self.scan_companies(queue, max(1, max_workers)))
+        
+        if self.timed_out_companies:
+            logger.warning(f"⏱️  {len(self.timed_out_companies)} companies hit their time budget: "
+                           f"{', '.join(self.timed_out_companies[:10])}")
+        if self.not_started_companies:
+            logger.warning(f"⏱️  {len(self.not_started_companies)} companies not started before the scan deadline")
+        
+        # Release keep-alive connections and cached pages held for this scan
+        self.session_pool.close()
+        logger.info(f"Page cache: {self.page_cache.hits} hits, {self.page_cache.misses} misses")
+        if self.prefilter_skipped:
+            logger.info(f"Prefilter: skipped parsing {self.prefilter_skipped} pages with no possible match")
+        for line in self.extraction_cascade.summary():
+            logger.info(f"Extraction tier {line}")
+        self.page_cache.clear()
+        if self.http_cache:
+            logger.info(f"HTTP cache: {self.http_cache.revalidated} pages not modified, "
+                        f"{self.http_cache.stored} stored")
+            self.http_cache.prune()
+        
+        if self.rate_limiter.throttled:
+            logger.info(f"Rate limiter: backed off {self.rate_limiter.throttled} times on 429/503")
+        logger.info(f"Failure ledger: skipped {self.failure_ledger.skipped} known-failing requests")
+        
+        # The journal is only done with once every queued company has an outcome in it
+        unfinished = [company.name for company in queue if company.name not in self.journal.recorded]
+        if unfinished:
+            logger.info(f"♻️  Keeping scan journal {scan_id} for {len(unfinished)} unfinished companies "
+                        f"(rerun with --resume --scan-id {scan_id})")
         
         # Final results
+        companies_scanned = len(finished) + len(queue) - len(self.not_started_companies)
         logger.info("\n🎉 SCAN COMPLETE!")
-        logger.info(f"Companies scanned: {len(companies)}")
+        logger.info(f"Companies scanned: {companies_scanned}")
         logger.info(f"Total target jobs found: {len(all_jobs)}")
         
+        if shard:
+            # The merge step owns the shared ledger, stats and result files
+            self.save_shard_results(all_jobs, shard, companies_scanned)
+            self.journal.close(completed=not unfinished)
+            return all_jobs
+        
+        # Persist known failures and list them for the company CSV cleanup scripts
+        self.failure_ledger.save()
+        self.company_stats.save()
+        self.journal.mark_stats_saved()
+        self.failure_ledger.write_report(
+            self.settings.get('failure_report_file', 'results/failing_career_urls.csv'), companies)
+        
         if all_jobs:
             # Save results
             self.save_results(all_jobs)
@@ -813,17 +1410,121 @@ class MultiplatformJobScraper:
             for company, count in sorted(company_counts.items(), key=lambda x: x[1], reverse=True):
                 logger.info(f"  {company}: {count} jobs")
         
+        self.journal.close(completed=not unfinished)
+        return all_jobs
+
+    def shard_results_file(self, shard: Tuple[int, int]) -> str:
+        """Where shard (index, count) writes its partial results"""
+        directory = self.settings.get('shard_results_dir', 'results/shards')
+        return os.path.join(directory, f"shard-{shard[0]}-of-{shard[1]}.json")
+
+    def save_shard_results(self, jobs: List[JobListing], shard: Tuple[int, int], companies_scanned: int):
+        """Save one shard's jobs together with its ledger and stats changes"""
+        filename = self.shard_results_file(shard)
+        results = {
+            'shard': shard[0],
+            'shards': shard[1],
+            'scan_date': datetime.now().isoformat(),
+            'companies_scanned': companies_scanned,
+            'jobs': [asdict(job) for job in jobs],
+            'failure_ledger': self.failure_ledger.delta(),
+            'company_stats': self.company_stats.delta()
+        }
+        try:
+            os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            logger.info(f"✅ Shard results saved to {filename}")
+        except Exception as e:
+            logger.error(f"Error saving shard results: {e}")
+
+    def merge_shard_results(self, shard_files: List[str], companies_file: Optional[str] = None,
+                            summary_file: str = "results/latest_scan.json") -> List[JobListing]:
+        """Combine shard result files into target_jobs.csv and the scan summary"""
+        shards = []
+        for filename in shard_files:
+            try:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    shards.append(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Error reading shard results {filename}: {e}")
+        if not shards:
+            logger.error("No shard results to merge. Exiting.")
+            return []
+        
+        # Merge in shard order so the output does not depend on file or finish order
+        shards.sort(key=lambda data: data['shard'])
+        counts = {data['shards'] for data in shards}
+        if len(counts) > 1:
+            logger.warning(f"Shard files come from different shard counts: {sorted(counts)}")
+        missing = set(range(1, max(counts) + 1)) - {data['shard'] for data in shards}
+        if missing:
+            logger.warning(f"Missing results for shards: {', '.join(map(str, sorted(missing)))}")
+        
+        all_jobs = self.remove_duplicates([JobListing(**job) for data in shards for job in data['jobs']])
+        for data in shards:
+            self.failure_ledger.merge_delta(data.get('failure_ledger', {}))
+            self.company_stats.merge_delta(data.get('company_stats', {}))
+        self.failure_ledger.save()
+        self.company_stats.save()
+        if companies_file:
+            self.failure_ledger.write_report(
+                self.settings.get('failure_report_file', 'results/failing_career_urls.csv'),
+                self.load_companies(companies_file))
+        
+        companies_scanned = sum(data['companies_scanned'] for data in shards)
+        logger.info(f"🧩 Merged {len(shards)} shards: {companies_scanned} companies, {len(all_jobs)} unique jobs")
+        self.save_results(all_jobs)
+        try:
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'scan_date': datetime.now().isoformat(),
+                    'companies_scanned': companies_scanned,
+                    'shards': len(shards),
+                    'total_jobs': len(all_jobs),
+                    'jobs': [asdict(job) for job in all_jobs]
+                }, f, indent=2)
+            logger.info(f"✅ Scan summary saved to {summary_file}")
+        except Exception as e:
+            logger.error(f"Error saving scan summary: {e}")
+        
         return all_jobs
 
 # Main execution
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scan company career sites for target jobs")
+    parser.add_argument('--companies', default="companies_final_with_specialization.csv",
+                        help="CSV file of companies to scan")
+    parser.add_argument('--workers', type=int, default=3, help="Companies scanned at once")
+    parser.add_argument('--async', dest='use_async', action='store_true', help="Scan on an asyncio event loop")
+    parser.add_argument('--deadline-minutes', type=float, help="Stop starting companies after this long")
+    parser.add_argument('--shard', type=parse_shard, metavar='i/N',
+                        help="Only scan shard i of N (1-based) and write a shard results file")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip companies already finished by an interrupted run of the same scan")
+    parser.add_argument('--scan-id', help="Checkpoint journal to write or resume (default: today's date)")
+    parser.add_argument('--merge', nargs='*', metavar='FILE',
+                        help="Merge shard results files (default: every file in the shard results directory)")
+    args = parser.parse_args()
+    
     # Create and configure scraper
     scraper = MultiplatformJobScraper()
     
-    # Run the scan
-    jobs = scraper.run_scan(
-        companies_file="companies_final_with_specialization.csv",
-        max_workers=3  # Adjust based on your needs
-    )
-    
-    print(f"\nScan complete! Found {len(jobs)} total target jobs.")
+    if args.merge is not None:
+        shard_files = args.merge or sorted(glob.glob(
+            os.path.join(scraper.settings.get('shard_results_dir', 'results/shards'), 'shard-*.json')))
+        jobs = scraper.merge_shard_results(shard_files, companies_file=args.companies)
+        print(f"\nMerge complete! Found {len(jobs)} total target jobs.")
+    else:
+        # Run the scan
+        jobs = scraper.run_scan(
+            companies_file=args.companies,
+            max_workers=args.workers,
+            use_async=args.use_async,
+            deadline_minutes=args.deadline_minutes,
+            shard=args.shard,
+            resume=args.resume,
+            scan_id=args.scan_id
+        )
+        
+        print(f"\nScan complete! Found {len(jobs)} total target jobs.")
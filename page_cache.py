@@ -0,0 +1,93 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional
+
+from http_pool import FetchResult
+
+
+@dataclass
+class CachedPage:
+    page: FetchResult
+    soup: Any = None
+    features: Any = None
+
+
+class PageCache:
+    """Per-scan cache of fetched pages and their parsed documents.
+
+    Entries are keyed by the final URL after redirects, and every requested URL
+    that led there is kept as an alias, so discovery and extraction of the same
+    career page cost one download and one parse. The cache is a bounded LRU
+    because parsed trees are large.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedPage]" = OrderedDict()
+        self._aliases: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, url: str) -> str:
+        """Follow a recorded redirect alias to the final URL"""
+        return self._aliases.get(url, url)
+
+    def _entry(self, url: str) -> Optional[CachedPage]:
+        entry = self._entries.get(self.resolve(url))
+        if entry is not None:
+            self._entries.move_to_end(entry.page.final_url)
+        return entry
+
+    def get(self, url: str) -> Optional[FetchResult]:
+        """Return the cached page for url, as if url had just been requested"""
+        with self._lock:
+            entry = self._entry(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            page = entry.page
+        return page if page.url == url else replace(page, url=url)
+
+    def put(self, page: FetchResult) -> FetchResult:
+        """Store a fetched page under its final URL and alias the requested URL to it"""
+        with self._lock:
+            self._entries[page.final_url] = CachedPage(page)
+            self._entries.move_to_end(page.final_url)
+            if page.url != page.final_url:
+                self._aliases[page.url] = page.final_url
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return page
+
+    def parsed(self, page: FetchResult, parse: Callable[[bytes], Any]) -> Any:
+        """Return the parsed document for page, parsing it at most once while cached"""
+        with self._lock:
+            entry = self._entry(page.final_url)
+            if entry is not None and entry.soup is not None:
+                return entry.soup
+
+        soup = parse(page.content)
+        if entry is not None:
+            entry.soup = soup
+        return soup
+
+    def features(self, page: FetchResult, build: Callable[[FetchResult], Any]) -> Any:
+        """Return the page features for page, building them at most once while cached"""
+        with self._lock:
+            entry = self._entry(page.final_url)
+            if entry is not None and entry.features is not None:
+                return entry.features
+
+        features = build(page)
+        if entry is not None:
+            entry.features = features
+        return features
+
+    def clear(self):
+        """Drop every entry at the end of a scan"""
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Pattern, Set
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from text_cache import TextCache
+
+# Attribute values that the listing checks look at on <div>s
+DIV_ATTRIBUTES = ('data-qa', 'data-testid')
+
+
+@dataclass
+class PageFeatures:
+    """What detection, listing checks and extraction read from a page.
+
+    Built in one walk of the parsed tree instead of re-serializing the
+    document or running a separate find_all() for every question asked of it.
+    """
+
+    text: str = ''                   # soup.get_text(), lower-cased
+    fingerprints: Set[str] = field(default_factory=set)  # Board markers found in the raw page
+    class_names: Set[str] = field(default_factory=set)   # Each class token and each full class value
+    attribute_names: Set[str] = field(default_factory=set)
+    div_attributes: Dict[str, List[str]] = field(default_factory=dict)
+    action_strings: List[str] = field(default_factory=list)  # .string of every <a> and <button>
+    links: List[Tag] = field(default_factory=list)           # <a href=...> in document order
+    tags: List[Tag] = field(default_factory=list)            # Every tag in document order
+    keyword_strings: List[NavigableString] = field(default_factory=list)  # Text nodes with a keyword
+    texts: TextCache = field(default_factory=TextCache)      # Element text for extraction
+
+    def has_class(self, pattern: Pattern) -> bool:
+        """Same test as find(class_=pattern) without walking the tree"""
+        return any(pattern.search(name) for name in self.class_names)
+
+    def has_div_attribute(self, name: str, pattern: Pattern) -> bool:
+        """Same test as find('div', {name: pattern})"""
+        return any(pattern.search(value) for value in self.div_attributes.get(name, ()))
+
+    def has_action(self, pattern: Pattern) -> bool:
+        """Same test as find(['button', 'a'], string=pattern)"""
+        return any(pattern.search(string) for string in self.action_strings)
+
+
+def build_page_features(soup: BeautifulSoup, content: bytes, keyword_matcher,
+                        board_markers: Iterable[str]) -> PageFeatures:
+    """Collect PageFeatures for a parsed page in a single traversal"""
+    features = PageFeatures(div_attributes={name: [] for name in DIV_ATTRIBUTES})
+    text_types = soup.interesting_string_types
+    text_parts = []
+
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            features.tags.append(node)
+            features.attribute_names.update(node.attrs)
+            classes = node.get('class')
+            if classes:
+                if isinstance(classes, str):
+                    classes = [classes]
+                features.class_names.update(classes)
+                features.class_names.add(' '.join(classes))
+            if node.name == 'div':
+                for name in DIV_ATTRIBUTES:
+                    value = node.get(name)
+                    if value is not None:
+                        features.div_attributes[name].append(value)
+            elif node.name in ('a', 'button'):
+                string = node.string
+                if string is not None:
+                    features.action_strings.append(string)
+                if node.name == 'a' and node.has_attr('href'):
+                    features.links.append(node)
+        elif isinstance(node, NavigableString):
+            if type(node) in text_types:
+                text_parts.append(node)
+            if keyword_matcher.search(node):
+                features.keyword_strings.append(node)
+
+    features.text = ''.join(text_parts).lower()
+
+    # Board names can sit anywhere in the markup (script URLs, embeds), not just in the text
+    markup = content.lower() if b'\x00' not in content[:1024] else str(soup).lower().encode('utf-8')
+    features.fingerprints = {marker for marker in board_markers if marker.encode('utf-8') in markup}
+    return features
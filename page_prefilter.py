@@ -0,0 +1,66 @@
+import html
+import re
+from typing import Iterable
+
+# Markup that never reaches get_text(): comments, script/style/template bodies and tags.
+# Tags start like they do for the HTML tokenizer ("<" then a letter, "/", "!" or "?") and
+# a ">" inside a quoted attribute value does not end them. get_text() joins the strings
+# around a tag, so "Product <b>Manager</b>" still matches once the tag is gone.
+MARKUP_RE = re.compile(
+    rb'<!--.*?-->'
+    rb'|<(script|style|template)\b.*?</\1\s*>'
+    rb'|<[a-z/!?](?:[^>"\'=]|=\s*"[^"]*"|=\s*\'[^\']*\'|=)*>',
+    re.DOTALL
+)
+
+
+class PagePrefilter:
+    """Byte-level checks that let the scraper skip parsing pages that cannot help.
+
+    A page can only yield target jobs if a keyword occurs in its text, so the
+    raw response is scanned with markup removed and entities decoded, which
+    leaves a superset of the text get_text() would return.
+    Discovery also keeps pages with an iframe or a link whose href looks like
+    a careers page or job board. Anything the check cannot rule out, including
+    pages in non ASCII-compatible encodings, is parsed as before.
+    """
+
+    def __init__(self, keywords: Iterable[str], follow_markers: Iterable[str]):
+        keywords = [keyword.lower() for keyword in keywords]
+        # Byte-level lower() only folds ASCII, so other keywords cannot be ruled out this way
+        self.enabled = bool(keywords) and all(keyword.isascii() for keyword in keywords)
+        self.needles = [keyword.encode('ascii') for keyword in keywords] if self.enabled else []
+        self.text_needles = keywords
+        markers = b'|'.join(re.escape(marker.lower().encode('utf-8')) for marker in follow_markers)
+        self.follow_re = re.compile(rb'<iframe\b|href\s*=\s*["\']?[^"\'\s>]*(?:' + markers + rb')')
+
+    def _decodable(self, content: bytes) -> bool:
+        # UTF-16/32 pages put NUL bytes between ASCII characters
+        return b'\x00' not in content[:1024]
+
+    def may_match(self, content: bytes) -> bool:
+        """False only when no keyword can occur anywhere in the page's text"""
+        if not self.enabled or not content or not self._decodable(content):
+            return True
+        stripped = MARKUP_RE.sub(b'', content.lower())
+        if b'&' in stripped:
+            # Entities only ever decode to text, so unescaping can add matches but never hide one
+            text = html.unescape(stripped.decode('latin-1')).lower()
+            return any(needle in text for needle in self.text_needles)
+        return any(needle in stripped for needle in self.needles)
+
+    def mentions_keyword(self, content: bytes) -> bool:
+        """False only when no keyword occurs anywhere in the raw page, markup and scripts included"""
+        if not self.enabled or not content or not self._decodable(content):
+            return True
+        lowered = content.lower()
+        if any(needle in lowered for needle in self.needles):
+            return True
+        # A \u escape in embedded JSON can spell out part of a keyword
+        return b'\\u' in lowered
+
+    def worth_parsing(self, content: bytes) -> bool:
+        """Whether discovery could find jobs or a link to follow on this page"""
+        if self.may_match(content):
+            return True
+        return bool(self.follow_re.search(content.lower()))
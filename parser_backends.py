@@ -0,0 +1,117 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+except ImportError:  # Only needed for the lxml backends
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional fast path, see benchmark_parsers.py
+    LexborHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+# Fastest backend that extracts the same jobs as html.parser (see benchmark_parsers.py)
+DEFAULT_BACKEND = 'lxml'
+
+
+class ParserBackend(ABC):
+    """Turns fetched page bytes into a document tree.
+
+    Backends with produces_soup build a BeautifulSoup tree, which is what the
+    scraper's extractors walk, so any of them can be swapped in. The others
+    build their own native tree and are only usable where nothing needs the
+    BeautifulSoup API, such as the benchmark.
+    """
+
+    name = ''
+    produces_soup = True
+
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def parse(self, content: bytes) -> Any:
+        """Document tree for a page's bytes"""
+
+
+class SoupBackend(ParserBackend):
+    """BeautifulSoup with one of its tree builders (html.parser, lxml, html5lib)"""
+
+    def __init__(self, features: str):
+        self.name = features
+        self.features = features
+
+    def available(self) -> bool:
+        if self.features == 'lxml':
+            return lxml is not None
+        if self.features == 'html5lib':
+            try:
+                import html5lib  # noqa: F401
+            except ImportError:
+                return False
+        return True
+
+    def parse(self, content: bytes) -> BeautifulSoup:
+        return BeautifulSoup(content, self.features)
+
+
+class LxmlTreeBackend(ParserBackend):
+    """Raw lxml.html tree, without the BeautifulSoup layer on top"""
+
+    name = 'lxml-etree'
+    produces_soup = False
+
+    def available(self) -> bool:
+        return lxml is not None
+
+    def parse(self, content: bytes):
+        return lxml.html.document_fromstring(content) if content.strip() else None
+
+
+class LexborBackend(ParserBackend):
+    """selectolax's lexbor engine, the fastest HTML5 parser available to Python"""
+
+    name = 'lexbor'
+    produces_soup = False
+
+    def available(self) -> bool:
+        return LexborHTMLParser is not None
+
+    def parse(self, content: bytes):
+        return LexborHTMLParser(content)
+
+
+BACKENDS: Dict[str, ParserBackend] = {
+    backend.name: backend for backend in (
+        SoupBackend('html.parser'),
+        SoupBackend('lxml'),
+        SoupBackend('html5lib'),
+        LxmlTreeBackend(),
+        LexborBackend()
+    )
+}
+
+
+def get_backend(name: str = DEFAULT_BACKEND, require_soup: bool = True) -> ParserBackend:
+    """Backend called name, falling back to html.parser when it cannot be used"""
+    backend = BACKENDS.get(name)
+    if backend is None:
+        logger.warning(f"Unknown parser backend {name!r}, using html.parser")
+    elif not backend.available():
+        logger.warning(f"Parser backend {name!r} is not installed, using html.parser")
+    elif require_soup and not backend.produces_soup:
+        logger.warning(f"Parser backend {name!r} does not build a BeautifulSoup tree, using html.parser")
+    else:
+        return backend
+    return BACKENDS['html.parser']
+
+
+def make_soup(content) -> BeautifulSoup:
+    """Parse a page with the default backend, for scripts without a scraper config"""
+    return get_backend().parse(content)
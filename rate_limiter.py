@@ -0,0 +1,178 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from scan_budget import BudgetExceeded, current_deadline
+
+# Statuses that mean "slow down" rather than "this page is broken"
+THROTTLE_STATUSES = {429, 503}
+
+
+class HostThrottled(Exception):
+    """A host asked us to back off; the work should be requeued, not waited on"""
+
+    def __init__(self, host: str, retry_at: float):
+        self.host = host
+        self.retry_at = retry_at  # time.monotonic() deadline
+        super().__init__(f"{host} is throttling us for {max(0.0, retry_at - time.monotonic()):.0f}s")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Token bucket for a single host; reservations may run the bucket negative"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        if now < self.blocked_until:
+            # No tokens accrue while the host has told us to back off
+            self.updated = max(self.updated, now)
+            return
+        start = max(self.updated, self.blocked_until)
+        self.tokens = min(self.capacity, self.tokens + (now - start) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """How long a new request would have to wait, without taking a token"""
+        self._refill(now)
+        wait = max(0.0, self.blocked_until - now)
+        if self.tokens < 1:
+            wait += (1 - self.tokens) / self.rate
+        return wait
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long the caller must wait before using it"""
+        wait = self.delay(now)
+        self.tokens -= 1
+        return wait
+
+
+class HostRateLimiter:
+    """Per-host politeness shared by every worker in a scan.
+
+    Each host gets its own token bucket (requests per second plus burst) and its
+    own cap on concurrent connections, so requests to different hosts never
+    wait on each other. The rate adapts per host (AIMD): a 429/503 halves it
+    and blocks the host until Retry-After, and every success adds a little back
+    until the configured rate is reached again.
+    """
+
+    def __init__(self, requests_per_second: float = 1.0, burst: int = 2,
+                 max_concurrent_per_host: int = 2, min_requests_per_second: float = 0.05,
+                 decrease_factor: float = 0.5, increase_step: float = 0.05,
+                 default_backoff: float = 10.0, max_backoff: float = 300.0):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_concurrent_per_host = max_concurrent_per_host
+        self.min_requests_per_second = min_requests_per_second
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.default_backoff = default_backoff
+        self.max_backoff = max_backoff
+        self.throttled = 0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_slots: Dict[str, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.requests_per_second, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def reserve(self, host: str, max_wait: Optional[float] = None) -> float:
+        """Reserve the next request slot for host and return the delay until it opens.
+
+        With max_wait, a host that cannot be served in time raises HostThrottled
+        instead, so the caller can requeue the work rather than sleep on it. A
+        slot that opens after the current company's deadline raises
+        BudgetExceeded, however long Retry-After asked us to wait.
+        """
+        deadline = current_deadline()
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            wait = bucket.delay(now)
+            if max_wait is not None and wait > max_wait:
+                raise HostThrottled(host, now + wait)
+            if deadline is not None and wait > deadline.remaining():
+                raise BudgetExceeded(f"{host} cannot be served for {wait:.0f}s, past the deadline")
+            return bucket.reserve(now)
+
+    def throttle(self, host: str, retry_after: Optional[float] = None) -> float:
+        """Multiplicative decrease after a 429/503; returns when the host opens again"""
+        backoff = min(retry_after if retry_after is not None else self.default_backoff, self.max_backoff)
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.rate = max(self.min_requests_per_second, bucket.rate * self.decrease_factor)
+            bucket.tokens = min(bucket.tokens, 0.0)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + backoff)
+            self.throttled += 1
+            return bucket.blocked_until
+
+    def record_success(self, host: str):
+        """Additive increase back towards the configured rate"""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is not None and bucket.rate < self.requests_per_second:
+                bucket.rate = min(self.requests_per_second, bucket.rate + self.increase_step)
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_concurrent_per_host)
+                self._slots[host] = slot
+            return slot
+
+    def _async_slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._async_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_concurrent_per_host)
+            self._async_slots[host] = slot
+        return slot
+
+    @contextmanager
+    def limit(self, host: str, max_wait: Optional[float] = None):
+        """Block the calling thread until host has a free connection and a token"""
+        slot = self._slot(host)
+        with slot:
+            delay = self.reserve(host, max_wait)
+            if delay > 0:
+                time.sleep(delay)
+            yield
+
+    @asynccontextmanager
+    async def limit_async(self, host: str):
+        """Event-loop counterpart of limit(); waiting here never blocks a thread"""
+        async with self._async_slot(host):
+            delay = self.reserve(host)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
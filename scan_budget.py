@@ -0,0 +1,66 @@
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+_current_deadline: contextvars.ContextVar = contextvars.ContextVar('scan_deadline', default=None)
+
+
+class BudgetExceeded(Exception):
+    """Raised at the next cooperative check once a company's time budget is used up"""
+
+
+class Deadline:
+    """A monotonic deadline, optionally capped by a parent (e.g. the whole scan)"""
+
+    def __init__(self, seconds: Optional[float] = None, parent: Optional['Deadline'] = None):
+        self.started = time.monotonic()
+        self.expires_at = time.monotonic() + seconds if seconds else None
+        if parent is not None and parent.expires_at is not None:
+            if self.expires_at is None or parent.expires_at < self.expires_at:
+                self.expires_at = parent.expires_at
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return float('inf')
+        return self.expires_at - time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def expired(self, margin: float = 0.0) -> bool:
+        return self.remaining() <= margin
+
+    def check(self):
+        """Raise BudgetExceeded if the deadline has passed"""
+        if self.expired():
+            raise BudgetExceeded("time budget used up")
+
+    def clamp(self, timeout: float) -> float:
+        """Shrink a request timeout so it cannot outlive the deadline"""
+        self.check()
+        return min(timeout, self.remaining())
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline of the company being scanned in this thread or task, if any"""
+    return _current_deadline.get()
+
+
+def budget_timeout(timeout: float) -> Tuple[float, bool]:
+    """timeout clamped to the current deadline, and whether the deadline is what limits it"""
+    deadline = current_deadline()
+    if deadline is None:
+        return timeout, False
+    budget = deadline.clamp(timeout)  # Raises BudgetExceeded once the budget is gone
+    return budget, budget < timeout
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]):
+    """Make deadline visible to every fetch made while scanning one company"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import soupsieve
+from bs4 import Tag
+from soupsieve import SoupSieve
+
+
+@dataclass
+class BoardSelectors:
+    """One job board's container/title/location selectors, compiled once"""
+
+    container: SoupSieve
+    title: SoupSieve
+    location: Optional[SoupSieve] = None
+
+    @classmethod
+    def compile(cls, selectors: Dict[str, str]) -> 'BoardSelectors':
+        location = selectors.get('location')
+        return cls(
+            container=soupsieve.compile(selectors['container']),
+            title=soupsieve.compile(selectors['title']),
+            location=soupsieve.compile(location) if location else None
+        )
+
+
+class _OrderedGroup:
+    """Ordered selectors where the first acceptable match wins.
+
+    Mirrors trying select_one() for each selector in turn: only the first
+    match of a selector in document order is considered, and it is kept if
+    accept() says so. Matches are offered as the subtree is walked, so the
+    group knows it is settled as soon as every selector ranked above the
+    current winner has had its first match.
+    """
+
+    def __init__(self, selectors: Sequence[SoupSieve], accept: Callable[[Tag], bool]):
+        self.selectors = selectors
+        self.accept = accept
+        self.first: List[Optional[Tag]] = [None] * len(self.selectors)
+        self.best = len(self.selectors)  # Index of the accepted match, len() while there is none
+        self.pending = len(self.selectors)  # Selectors below best without a match yet
+
+    def offer(self, tag: Tag):
+        for index in range(self.best):
+            if self.first[index] is None and self.selectors[index].match(tag):
+                self.first[index] = tag
+                self.pending -= 1
+                if self.accept(tag):
+                    self.best = index
+                    self.pending = sum(1 for match in self.first[:index] if match is None)
+                    break
+
+    @property
+    def settled(self) -> bool:
+        return self.pending == 0
+
+    def winner(self) -> Optional[Tag]:
+        return self.first[self.best] if self.best < len(self.first) else None
+
+    def last_match(self) -> Optional[Tag]:
+        return next((match for match in reversed(self.first) if match is not None), None)
+
+
+class FieldSelectors:
+    """Generic title and location selectors, matched in one walk of an element.
+
+    Selector strings are compiled once, and a union of all of them rejects
+    most tags with a single match() call, so finding a title and a location
+    costs one traversal of the element instead of one select_one() scan per
+    selector.
+    """
+
+    def __init__(self, title_selectors: Sequence[str], location_selectors: Sequence[str]):
+        self.title_selectors = [soupsieve.compile(selector) for selector in title_selectors]
+        self.location_selectors = [soupsieve.compile(selector) for selector in location_selectors]
+        self.any_selector = soupsieve.compile(', '.join(list(title_selectors) + list(location_selectors)))
+
+    def find(self, element: Tag, title_ok: Callable[[Tag], bool],
+             location_ok: Callable[[Tag], bool]) -> Tuple[Optional[Tag], Optional[Tag]]:
+        """(title, location) elements inside element, ranked by selector order.
+
+        The title is the first selector match that title_ok accepts. The
+        location is the first match that location_ok accepts, or failing
+        that the match of the lowest ranked location selector that had one.
+        """
+        titles = _OrderedGroup(self.title_selectors, title_ok)
+        locations = _OrderedGroup(self.location_selectors, location_ok)
+        for node in element.descendants:
+            if not isinstance(node, Tag) or not self.any_selector.match(node):
+                continue
+            titles.offer(node)
+            locations.offer(node)
+            if titles.settled and locations.settled:
+                break
+        return titles.winner(), locations.winner() or locations.last_match()
+
+    def find_location(self, element: Tag, location_ok: Callable[[Tag], bool]) -> Optional[Tag]:
+        """Location element inside element, chosen as in find()"""
+        locations = _OrderedGroup(self.location_selectors, location_ok)
+        for node in element.descendants:
+            if not isinstance(node, Tag) or not self.any_selector.match(node):
+                continue
+            locations.offer(node)
+            if locations.settled:
+                break
+        return locations.winner() or locations.last_match()
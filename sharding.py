@@ -0,0 +1,26 @@
+import hashlib
+from typing import List, Tuple
+
+from http_pool import SessionPool
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse an "i/N" shard spec (1-based) into (index, count)"""
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got {spec!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {count}, got {spec!r}")
+    return index, count
+
+
+def shard_of(url: str, count: int) -> int:
+    """1-based shard that owns url; every URL on one host lands on the same shard"""
+    digest = hashlib.sha1(SessionPool.host_key(url).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count + 1
+
+
+def select_shard(companies: List, index: int, count: int) -> List:
+    """Companies belonging to shard index of count, in their original order"""
+    return [company for company in companies if shard_of(company.careers_url, count) == index]
@@ -0,0 +1,239 @@
+import html
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Tuple
+
+from bs4 import Tag
+
+# Keys that hold a posting's title and link in embedded app state (Next.js, Greenhouse, Lever, ...)
+HYDRATION_TITLE_KEYS = ('title', 'jobTitle', 'text', 'name')
+HYDRATION_URL_KEYS = ('absolute_url', 'hostedUrl', 'applyUrl', 'jobUrl', 'url', 'externalPath')
+HYDRATION_LOCATION_KEYS = ('location', 'locationName', 'locationsText', 'city')
+# What tells a posting apart from any other titled link (nav entries, products, articles):
+# a link only postings have, an ATS requisition id, or a place in a list of jobs
+HYDRATION_POSTING_URL_KEYS = ('absolute_url', 'hostedUrl', 'applyUrl', 'apply_url', 'jobUrl', 'externalPath')
+HYDRATION_ID_KEYS = ('jobId', 'job_id', 'jobPostingId', 'postingId', 'requisitionId', 'requisition_id',
+                     'reqId', 'jobReqId', 'internal_job_id')
+HYDRATION_LIST_KEYS = {'jobs', 'postings', 'jobpostings', 'joblist', 'openings', 'jobopenings', 'positions',
+                       'openpositions', 'vacancies', 'requisitions'}
+
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Structured data is read from the raw page: script blocks need no DOM, only microdata does
+STRUCTURED_DATA_RE = re.compile(rb'application/(?:ld\+)?json|schema\.org/JobPosting', re.I)
+SCRIPT_BLOCK_RE = re.compile(rb'<script\b([^>]*)>(.*?)</script\s*>', re.I | re.S)
+SCRIPT_TYPE_RE = re.compile(rb'\btype\s*=\s*["\']?\s*(application/(?:ld\+)?json)', re.I)
+MICRODATA_RE = re.compile(rb'itemtype\s*=\s*["\']?https?://schema\.org/JobPosting', re.I)
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+@dataclass
+class Posting:
+    """A job posting read from structured data rather than from the page layout"""
+
+    title: str
+    url: str = ""
+    location: str = ""
+    description: str = ""
+    date_posted: str = ""
+    team: str = ""
+
+
+def has_structured_data(content: bytes) -> bool:
+    """Whether the raw page embeds JSON or JobPosting microdata at all"""
+    return bool(STRUCTURED_DATA_RE.search(content))
+
+
+def has_microdata(content: bytes) -> bool:
+    return bool(MICRODATA_RE.search(content))
+
+
+def _decode(block: bytes) -> str:
+    try:
+        return block.decode('utf-8')
+    except UnicodeDecodeError:
+        return block.decode('cp1252', errors='replace')
+
+
+def script_blocks(content: bytes) -> Iterator[Tuple[str, str]]:
+    """(type, body) of every JSON script block in the raw page, without parsing the HTML"""
+    for match in SCRIPT_BLOCK_RE.finditer(content):
+        kind = SCRIPT_TYPE_RE.search(match.group(1))
+        if kind:
+            yield kind.group(1).decode('ascii').lower(), _decode(match.group(2))
+
+
+def _load(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def _walk(data: Any) -> Iterator[dict]:
+    """Every dict nested anywhere in decoded JSON"""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _plain(value: Any) -> str:
+    """Text of a JSON value that may hold escaped HTML"""
+    if not isinstance(value, str):
+        return ""
+    return ' '.join(TAG_RE.sub(' ', html.unescape(value)).split())
+
+
+def _date(value: Any) -> str:
+    """datePosted as YYYY-MM-DD when it is an ISO date or datetime, else as given"""
+    if not isinstance(value, str):
+        return ""
+    value = value.strip()
+    return value[:10] if ISO_DATE_RE.match(value) else value
+
+
+def _is_job_posting(node: dict) -> bool:
+    types = node.get('@type')
+    if isinstance(types, str):
+        types = [types]
+    return isinstance(types, list) and 'JobPosting' in types
+
+
+def _place(value: Any) -> str:
+    """Readable location from a schema.org jobLocation (Place, PostalAddress, or a list of them)"""
+    if isinstance(value, list):
+        return '; '.join(filter(None, (_place(item) for item in value)))
+    if isinstance(value, str):
+        return value.strip()
+    if not isinstance(value, dict):
+        return ""
+    address = value.get('address', value)
+    if isinstance(address, str):
+        return address.strip()
+    if not isinstance(address, dict):
+        return ""
+    parts = [address.get(key) for key in ('addressLocality', 'addressRegion', 'addressCountry')]
+    parts = [part.get('name', '') if isinstance(part, dict) else part for part in parts]
+    return ', '.join(part.strip() for part in parts if isinstance(part, str) and part.strip())
+
+
+def postings_from_json_ld(text: str) -> List[Posting]:
+    """JobPosting objects in one application/ld+json block, including @graph members"""
+    postings = []
+    for node in _walk(_load(text)):
+        if not _is_job_posting(node):
+            continue
+        title = _plain(node.get('title') or node.get('name'))
+        if not title:
+            continue
+        location = _place(node.get('jobLocation'))
+        if not location and node.get('jobLocationType') == 'TELECOMMUTE':
+            location = 'Remote'
+        postings.append(Posting(
+            title=title,
+            url=node.get('url') if isinstance(node.get('url'), str) else "",
+            location=location,
+            description=_plain(node.get('description')),
+            date_posted=_date(node.get('datePosted'))
+        ))
+    return postings
+
+
+def _microdata_value(element: Tag) -> Any:
+    """An itemprop's value: a nested item as a dict, else its attribute or text value"""
+    if element.has_attr('itemscope'):
+        return _microdata_item(element)
+    for attribute in ('content', 'datetime'):
+        if element.has_attr(attribute):
+            return element[attribute]
+    if element.name in ('a', 'link', 'area') and element.has_attr('href'):
+        return element['href']
+    return element.get_text(' ', strip=True)
+
+
+def _microdata_item(scope: Tag) -> dict:
+    """Properties of one itemscope, leaving those of nested items to them"""
+    item = {}
+    stack = list(reversed(scope.find_all(True, recursive=False)))
+    while stack:
+        element = stack.pop()
+        if element.has_attr('itemprop'):
+            value = _microdata_value(element)
+            for name in element['itemprop'].split():
+                item.setdefault(name, value)
+        if not element.has_attr('itemscope'):
+            stack.extend(reversed(element.find_all(True, recursive=False)))
+    return item
+
+
+def postings_from_microdata(soup: Tag) -> List[Posting]:
+    """Elements marked itemtype="https://schema.org/JobPosting" """
+    postings = []
+    for scope in soup.find_all(itemtype=re.compile(r'schema\.org/JobPosting', re.I)):
+        item = _microdata_item(scope)
+        title = _plain(item.get('title') or item.get('name'))
+        if not title:
+            continue
+        postings.append(Posting(
+            title=title,
+            url=item.get('url') if isinstance(item.get('url'), str) else "",
+            location=_place(item.get('jobLocation')),
+            description=_plain(item.get('description')),
+            date_posted=_date(item.get('datePosted'))
+        ))
+    return postings
+
+
+def _walk_records(data: Any) -> Iterator[Tuple[dict, bool]]:
+    """(dict, whether it is an item of a list held under a job-list key) for every dict in decoded JSON"""
+    stack = [(data, False)]
+    while stack:
+        node, in_job_list = stack.pop()
+        if isinstance(node, dict):
+            yield node, in_job_list
+            stack.extend(reversed([(value, isinstance(value, list) and key.lower() in HYDRATION_LIST_KEYS)
+                                   for key, value in node.items()]))
+        elif isinstance(node, list):
+            stack.extend(reversed([(item, in_job_list) for item in node]))
+
+
+def _looks_like_posting(node: dict, in_job_list: bool) -> bool:
+    return (in_job_list or any(node.get(key) for key in HYDRATION_POSTING_URL_KEYS)
+            or any(node.get(key) not in (None, '') for key in HYDRATION_ID_KEYS))
+
+
+def _first_string(node: dict, keys) -> Optional[str]:
+    for key in keys:
+        value = node.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
+
+def postings_from_hydration(text: str) -> List[Posting]:
+    """Job-shaped records in embedded application state (script type="application/json").
+
+    A record counts as a posting when it has both a title and a link, and
+    something marks it as a job rather than, say, a navigation entry: a
+    posting link key, an ATS requisition id, or membership of a job list.
+    This is how ATS front ends ship their job lists to the browser.
+    """
+    postings = []
+    for node, in_job_list in _walk_records(_load(text)):
+        title = _first_string(node, HYDRATION_TITLE_KEYS)
+        url = _first_string(node, HYDRATION_URL_KEYS)
+        if not title or not url or not _looks_like_posting(node, in_job_list):
+            continue
+        location = node.get('location')
+        if isinstance(location, dict):
+            location = location.get('name')
+        if not isinstance(location, str):
+            location = _first_string(node, HYDRATION_LOCATION_KEYS[1:])
+        postings.append(Posting(title=_plain(title), url=url, location=(location or "").strip()))
+    return postings
@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, NamedTuple, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from multiplatform_job_scraper import MultiplatformJobScraper
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def fixture_bytes(name: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def fixture_json(name: str):
+    return json.loads(fixture_bytes(name))
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    query: Dict[str, List[str]]
+    body: object
+
+
+class Reply(NamedTuple):
+    status: int = 200
+    body: Union[bytes, str, dict, list] = b''
+    content_type: str = 'application/json'
+    headers: Dict[str, str] = {}
+
+
+# A route answers with a Reply, or computes one from the request
+Route = Union[Reply, Callable[[Request], Reply]]
+
+
+class FixtureServer:
+    """Local HTTP server answering from recorded fixtures and logging every request"""
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], Route] = {}
+        self.requests: List[Request] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _answer(self, method: str, body):
+                parts = urlsplit(self.path)
+                request = Request(method, parts.path, parse_qs(parts.query), body)
+                server.requests.append(request)
+                route = server.routes.get((method, parts.path), Reply(404, b'not found', 'text/plain'))
+                reply = route(request) if callable(route) else route
+                content = reply.body
+                if isinstance(content, (dict, list)):
+                    content = json.dumps(content)
+                if isinstance(content, str):
+                    content = content.encode('utf-8')
+                self.send_response(reply.status)
+                self.send_header('Content-Type', reply.content_type)
+                self.send_header('Content-Length', str(len(content)))
+                for name, value in reply.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self):
+                self._answer('GET', None)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self._answer('POST', json.loads(self.rfile.read(length) or b'null'))
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def route(self, method: str, path: str, reply: Route):
+        self.routes[(method, path)] = reply
+
+    def paths(self, method: str = 'GET') -> List[str]:
+        return [request.path for request in self.requests if request.method == method]
+
+
+@pytest.fixture
+def fixture_server():
+    server = FixtureServer()
+    server.thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest.fixture
+def make_scraper(tmp_path, monkeypatch):
+    """Build a scraper from config_fixed.json with settings overridden, keeping its files in tmp_path"""
+    monkeypatch.chdir(tmp_path)
+
+    def make(**settings) -> MultiplatformJobScraper:
+        with open(os.path.join(REPO_DIR, 'config_fixed.json')) as f:
+            config = json.load(f)
+        config['settings'].update({
+            'http_cache_enabled': False,
+            'rate_limit_requests_per_second': 100,
+            'rate_limit_burst': 100,
+            'rate_limit_max_concurrent_per_host': 10,
+            **settings
+        })
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps(config))
+        return MultiplatformJobScraper(str(path))
+
+    return make
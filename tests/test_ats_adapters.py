@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+
+import ats_adapters
+from ats_adapters import ADAPTERS, ATSAdapter, build_adapters, register_adapter
+from multiplatform_job_scraper import Company
+
+
+class StubAdapter(ATSAdapter):
+    name = 'stub'
+
+    def board_key(self, url):
+        return 'acme' if url.startswith('https://stub.example/') else None
+
+    def list_postings(self, url):
+        return [url]
+
+
+def test_adapters_must_implement_board_key_and_list_postings():
+    class Incomplete(ATSAdapter):
+        name = 'incomplete'
+
+        def board_key(self, url):
+            return None
+
+    with pytest.raises(TypeError):
+        ATSAdapter(client=None)
+    with pytest.raises(TypeError):
+        Incomplete(client=None)
+
+
+def test_every_adapter_is_registered_under_its_board_type(make_scraper):
+    scraper = make_scraper()
+    board_types = set(scraper.job_board_patterns.values())
+    assert list(ADAPTERS) == ['greenhouse', 'lever', 'workday', 'smartrecruiters', 'bamboohr', 'jobvite', 'icims']
+    assert set(ADAPTERS) <= board_types
+    assert all(cls.name == name for name, cls in ADAPTERS.items())
+
+
+def test_build_adapters_follows_the_setting(caplog):
+    with caplog.at_level(logging.WARNING):
+        adapters = build_adapters(client=None, settings={'ats_adapters': ['icims', 'taleo', 'lever']}, keywords=[])
+    assert list(adapters) == ['icims', 'lever']
+    assert 'Unknown ATS adapter in settings: taleo' in caplog.text
+
+
+def test_build_adapters_defaults_to_every_registered_adapter():
+    adapters = build_adapters(client=None, settings={}, keywords=['product manager'])
+    assert list(adapters) == list(ADAPTERS)
+    assert adapters['workday'].terms == ['product manager']
+
+
+def test_registered_adapters_are_built(monkeypatch):
+    monkeypatch.setattr(ats_adapters, 'ADAPTERS', dict(ADAPTERS))
+    register_adapter(StubAdapter)
+    adapters = build_adapters(client='client', settings={'ats_adapters': ['stub']}, keywords=[])
+    assert isinstance(adapters['stub'], StubAdapter)
+    assert adapters['stub'].client == 'client'
+
+
+def test_list_jobs_reads_the_company_careers_url_unless_given_one():
+    adapter = StubAdapter(client=None)
+    hosted = Company('Acme', 'Small', 'https://stub.example/acme')
+    elsewhere = Company('Acme', 'Small', 'https://acme.com/careers')
+
+    assert adapter.list_jobs(hosted) == ['https://stub.example/acme']
+    assert adapter.list_jobs(elsewhere) is None
+    assert adapter.list_jobs(elsewhere, 'https://stub.example/other') == ['https://stub.example/other']
+
+
+def test_ats_adapters_can_be_disabled(make_scraper):
+    assert make_scraper(ats_adapters_enabled=False).ats_adapters == {}
@@ -0,0 +1,64 @@
+import pytest
+
+from ats_adapters import BambooHRAdapter
+from multiplatform_job_scraper import Company
+from conftest import Reply, fixture_bytes
+
+
+@pytest.fixture
+def scraper(make_scraper, fixture_server):
+    fixture_server.route('GET', '/careers/list', Reply(body=fixture_bytes('ats/bamboohr_careers_list.json')))
+    return make_scraper(bamboohr_api_base=fixture_server.base_url)
+
+
+@pytest.mark.parametrize('url, key', [
+    ('https://acme.bamboohr.com/careers', 'acme'),
+    ('https://Acme.bamboohr.com/careers/112', 'acme'),
+    ('https://acme.bamboohr.com/jobs/embed2.php', 'acme'),
+    ('https://www.bamboohr.com/careers', None),
+    ('https://api.bamboohr.com/api/gateway.php/acme', None),
+    ('https://bamboohr.com/', None),
+    ('https://acme.com/careers', None),
+])
+def test_board_key(url, key):
+    assert BambooHRAdapter(client=None).board_key(url) == key
+
+
+def test_find_boards_in_the_embed_widget():
+    content = (b'<div id="BambooHR" data-domain="acme.bamboohr.com" data-version="1.0.0"></div>'
+               b'<script src="https://acme.bamboohr.com/js/embed.js"></script>'
+               b'<iframe src="https://acme.bamboohr.com/careers/embed"></iframe>'
+               b'<a href="https://www.bamboohr.com/careers/">Powered by BambooHR</a>')
+    assert BambooHRAdapter(client=None).find_boards(content) == ['https://acme.bamboohr.com/careers']
+
+
+def test_list_postings_maps_the_careers_list(scraper, fixture_server):
+    postings = scraper.ats_adapters['bamboohr'].list_postings('https://acme.bamboohr.com/careers')
+
+    assert [(p.title, p.url, p.location, p.team) for p in postings] == [
+        ('Senior Product Manager', 'https://acme.bamboohr.com/careers/112', 'Denver, Colorado', 'Product'),
+        ('Technical Program Manager', 'https://acme.bamboohr.com/careers/118', 'Remote', 'Engineering'),
+        ('Project Manager', 'https://acme.bamboohr.com/careers/121', 'Toronto', ''),
+        ('Line Cook', 'https://acme.bamboohr.com/careers/125', 'Boulder, Colorado', 'Kitchen'),
+    ]
+    assert fixture_server.paths() == ['/careers/list']
+
+
+def test_ats_jobs_keeps_target_roles(scraper):
+    company = Company('Acme', 'Small', 'https://acme.bamboohr.com/careers')
+
+    jobs = scraper.ats_jobs(company.careers_url, company)
+
+    assert [(job.title, job.source) for job in jobs] == [
+        ('Senior Product Manager', 'bamboohr_api'),
+        ('Technical Program Manager', 'bamboohr_api'),
+        ('Project Manager', 'bamboohr_api'),
+    ]
+
+
+def test_ats_jobs_falls_back_when_the_list_is_not_json(make_scraper, fixture_server):
+    fixture_server.route('GET', '/careers/list', Reply(200, b'<html>Sign in</html>', 'text/html'))
+    scraper = make_scraper(bamboohr_api_base=fixture_server.base_url)
+    company = Company('Acme', 'Small', 'https://acme.bamboohr.com/careers')
+
+    assert scraper.ats_jobs(company.careers_url, company) is None
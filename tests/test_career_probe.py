@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import pytest
+
+from career_probe import race_probe, race_probe_async
+
+CANDIDATES = ['https://acme.com/careers', 'https://acme.io/careers', 'https://careers.acme.com']
+
+
+def timed_probe(delays: dict, hits: set, raises: dict = None):
+    """A probe that answers each candidate after its delay, hitting for those in hits"""
+    def probe(candidate):
+        time.sleep(delays.get(candidate, 0))
+        if candidate in (raises or {}):
+            raise raises[candidate]
+        return candidate in hits and candidate.upper()
+    return probe
+
+
+def async_probe(delays: dict, hits: set):
+    async def probe(candidate):
+        await asyncio.sleep(delays.get(candidate, 0))
+        return candidate in hits and candidate.upper()
+    return probe
+
+
+def test_a_slower_higher_priority_hit_beats_a_faster_one():
+    probe = timed_probe({CANDIDATES[0]: 0.3}, hits={CANDIDATES[0], CANDIDATES[2]})
+
+    assert race_probe(CANDIDATES, probe) == (CANDIDATES[0], CANDIDATES[0].upper())
+
+
+def test_a_hit_is_returned_once_everything_ahead_of_it_has_missed():
+    probe = timed_probe({CANDIDATES[0]: 0.1, CANDIDATES[2]: 2.0}, hits={CANDIDATES[1], CANDIDATES[2]})
+    started = time.monotonic()
+
+    assert race_probe(CANDIDATES, probe) == (CANDIDATES[1], CANDIDATES[1].upper())
+    assert time.monotonic() - started < 1.0
+
+
+def test_errors_are_raised_only_when_nothing_hits():
+    probe = timed_probe({}, hits={CANDIDATES[2]}, raises={CANDIDATES[0]: TimeoutError('slow')})
+    assert race_probe(CANDIDATES, probe, reraise=(TimeoutError,)) == (CANDIDATES[2], CANDIDATES[2].upper())
+
+    probe = timed_probe({}, hits=set(), raises={CANDIDATES[0]: TimeoutError('slow')})
+    with pytest.raises(TimeoutError):
+        race_probe(CANDIDATES, probe, reraise=(TimeoutError,))
+    assert race_probe(CANDIDATES, timed_probe({}, hits=set())) is None
+
+
+def test_async_race_keeps_priority_order():
+    probe = async_probe({CANDIDATES[0]: 0.3, CANDIDATES[1]: 0.2}, hits={CANDIDATES[1], CANDIDATES[2]})
+    started = time.monotonic()
+
+    assert asyncio.run(race_probe_async(CANDIDATES, probe)) == (CANDIDATES[1], CANDIDATES[1].upper())
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,112 @@
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from failure_ledger import CooldownActive, FailureLedger
+from http_pool import SessionPool
+from conftest import Reply
+
+
+def fetch_error(url: str, timeout: float = 0.3) -> requests.exceptions.RequestException:
+    session = SessionPool(['test-agent']).get(url)
+    with pytest.raises(requests.exceptions.RequestException) as raised:
+        session.get(url, timeout=timeout)
+    return raised.value
+
+
+@pytest.fixture
+def refused_port():
+    """A port that refuses connections: bound, so nothing else can take it, but never listening"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        yield sock.getsockname()[1]
+
+
+@pytest.fixture
+def plaintext_port():
+    """A port that answers a TLS handshake in plain HTTP and holds the connection open, so the handshake fails"""
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    stop = threading.Event()
+
+    def answer(conn):
+        with conn:
+            conn.recv(4096)
+            conn.sendall(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n')
+            stop.wait(1)
+
+    def serve():
+        while not stop.is_set():
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=answer, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield listener.getsockname()[1]
+    stop.set()
+    listener.close()
+
+
+def slow_reply(request):
+    time.sleep(1)
+    return Reply(body=b'<html></html>', content_type='text/html')
+
+
+def ledger_after_scans(tmp_path, url: str, error: Exception, scans: int = 2) -> FailureLedger:
+    """The ledger as a later scan sees it, after url failed with error in each of scans scans"""
+    path = str(tmp_path / 'failure_ledger.json')
+    for _ in range(scans):
+        ledger = FailureLedger(path, host_failure_threshold=2)
+        ledger.record_exception(url, error)
+        ledger.save()
+    return FailureLedger(path, host_failure_threshold=2)
+
+
+def test_slow_boards_on_a_shared_host_do_not_cool_the_host(tmp_path, fixture_server):
+    fixture_server.route('GET', '/slowco/', slow_reply)
+    url = fixture_server.url('/slowco/')
+
+    ledger = ledger_after_scans(tmp_path, url, fetch_error(url))
+
+    assert ledger.hosts == {}
+    with pytest.raises(CooldownActive):
+        ledger.check(url)
+    ledger.check(fixture_server.url('/otherco/'))
+
+
+@pytest.mark.parametrize('failure', ['refused', 'ssl'])
+def test_unreachable_hosts_cool_down_after_the_threshold(tmp_path, refused_port, plaintext_port, failure):
+    if failure == 'refused':
+        url = f'http://127.0.0.1:{refused_port}/careers/'
+    else:
+        url = f'https://127.0.0.1:{plaintext_port}/careers/'
+
+    ledger = ledger_after_scans(tmp_path, url, fetch_error(url, timeout=5))
+
+    assert list(ledger.hosts) == [SessionPool.host_key(url)]
+    with pytest.raises(CooldownActive):
+        ledger.check(url.replace('/careers/', '/jobs/'))
+
+
+def test_exhausted_server_error_retries_stay_with_the_url(tmp_path, fixture_server):
+    fixture_server.route('GET', '/broken/', Reply(502, b'Bad Gateway', 'text/html'))
+    url = fixture_server.url('/broken/')
+
+    ledger = ledger_after_scans(tmp_path, url, fetch_error(url, timeout=5))
+
+    assert ledger.hosts == {} and list(ledger.urls) == [url]
+
+
+def test_urls_that_merely_contain_429_are_recorded(tmp_path):
+    url = 'http://127.0.0.1:42955/jobs/4291/'
+    ledger = FailureLedger(str(tmp_path / 'failure_ledger.json'))
+
+    ledger.record_exception(url, requests.exceptions.ReadTimeout(f"Read timed out: {url}"))
+
+    assert list(ledger.urls) == [url]
@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+import requests
+
+from async_scan import AsyncScanEngine
+from scan_budget import BudgetExceeded, Deadline, deadline_scope
+from conftest import Reply
+
+PAGE = b'<html><body><h1>Careers</h1></body></html>'
+
+
+def slow(seconds: float):
+    def reply(request):
+        time.sleep(seconds)
+        return Reply(body=PAGE, content_type='text/html')
+    return reply
+
+
+@pytest.fixture
+def server(fixture_server):
+    fixture_server.route('GET', '/slow/', slow(1.5))
+    return fixture_server
+
+
+def test_a_fetch_cut_short_by_the_budget_is_not_a_host_failure(make_scraper, server):
+    scraper = make_scraper()
+    started = time.monotonic()
+
+    with deadline_scope(Deadline(0.3)), pytest.raises(BudgetExceeded):
+        scraper.get_page(server.url('/slow/'), timeout=10)
+
+    # One attempt bounded by the budget: the pool's read retries and backoff are skipped
+    assert time.monotonic() - started < 1.0
+    assert server.paths() == ['/slow/']
+    assert scraper.failure_ledger.urls == {} and scraper.failure_ledger.hosts == {}
+
+
+def test_a_fetch_timing_out_on_its_own_timeout_is_still_recorded(make_scraper, server):
+    scraper = make_scraper()
+
+    with deadline_scope(Deadline(30)), pytest.raises(requests.exceptions.RequestException):
+        scraper.get_page(server.url('/slow/'), timeout=0.3)
+
+    assert list(scraper.failure_ledger.urls) == [server.url('/slow/')] and scraper.failure_ledger.hosts == {}
+
+
+def test_async_fetch_cut_short_by_the_budget_is_not_a_host_failure(make_scraper, server):
+    scraper = make_scraper()
+    engine = AsyncScanEngine(scraper)
+
+    async def fetch():
+        async with aiohttp.ClientSession() as engine.session:
+            with deadline_scope(Deadline(0.3)):
+                await engine.get_page(server.url('/slow/'), timeout=10)
+
+    with pytest.raises(BudgetExceeded):
+        asyncio.run(fetch())
+    assert scraper.failure_ledger.urls == {} and scraper.failure_ledger.hosts == {}
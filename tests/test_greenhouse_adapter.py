@@ -0,0 +1,112 @@
+import re
+
+import pytest
+
+from ats_adapters import GreenhouseAdapter
+from multiplatform_job_scraper import Company
+from conftest import Reply, fixture_bytes, fixture_json
+
+
+@pytest.fixture
+def scraper(make_scraper, fixture_server):
+    return make_scraper(greenhouse_api_base=fixture_server.url('/v1/boards'))
+
+
+@pytest.mark.parametrize('url, token', [
+    ('https://boards.greenhouse.io/acme', 'acme'),
+    ('https://boards.greenhouse.io/acme/jobs/4012345', 'acme'),
+    ('https://job-boards.greenhouse.io/acme', 'acme'),
+    ('https://job-boards.eu.greenhouse.io/acme', 'acme'),
+    ('https://boards.greenhouse.io/embed/job_board?for=acme&b=https://acme.com', 'acme'),
+    ('https://boards-api.greenhouse.io/v1/boards/acme/jobs', 'acme'),
+    ('https://boards.greenhouse.io/', None),
+    ('https://boards.greenhouse.io/embed/job_board', None),
+    ('https://acme.com/careers', None),
+    ('https://notgreenhouse.io.example.com/acme', None),
+    ('https://www.greenhouse.io/privacy-policy', None),
+    ('https://support.greenhouse.io/hc/en-us', None),
+    ('https://greenhouse.io/careers', None),
+])
+def test_board_key(url, token):
+    assert GreenhouseAdapter(client=None).board_key(url) == token
+
+
+def test_find_boards_in_embed_scripts():
+    content = (b'<div id="grnhse_app"></div>'
+               b'<script src="https://boards.greenhouse.io/embed/job_board/js?for=acme"></script>'
+               b'<iframe src="https://job-boards.greenhouse.io/embed/job_board?for=acme-labs"></iframe>'
+               b'<script src="https://boards.greenhouse.io/embed/job_board/js?for=acme"></script>')
+    assert GreenhouseAdapter(client=None).find_boards(content) == [
+        'https://boards.greenhouse.io/acme', 'https://boards.greenhouse.io/acme-labs']
+
+
+def test_list_postings_maps_recorded_board(scraper, fixture_server):
+    fixture_server.route('GET', '/v1/boards/acme/jobs', Reply(body=fixture_bytes('ats/greenhouse_jobs.json')))
+
+    postings = scraper.ats_adapters['greenhouse'].list_postings('https://boards.greenhouse.io/acme')
+
+    assert [(p.title, p.url, p.location, p.date_posted) for p in postings] == [
+        ('Senior Product Manager', 'https://boards.greenhouse.io/acme/jobs/4012345', 'Denver, CO', '2026-09-18'),
+        ('Staff Software Engineer', 'https://boards.greenhouse.io/acme/jobs/4012346', 'Boulder, CO', '2026-10-01'),
+        ('Technical Program Manager', 'https://boards.greenhouse.io/acme/jobs/4012347', 'Remote - US', '2026-10-02'),
+    ]
+    assert fixture_server.paths() == ['/v1/boards/acme/jobs']
+
+
+def test_list_jobs_is_none_for_boards_it_does_not_host(scraper, fixture_server):
+    company = Company('Acme', 'Small', 'https://acme.com/careers')
+    assert scraper.ats_adapters['greenhouse'].list_jobs(company) is None
+    assert fixture_server.requests == []
+
+
+def test_ats_jobs_keeps_target_roles(scraper, fixture_server):
+    fixture_server.route('GET', '/v1/boards/acme/jobs', Reply(body=fixture_bytes('ats/greenhouse_jobs.json')))
+    company = Company('Acme', 'Small', 'https://boards.greenhouse.io/acme')
+
+    jobs = scraper.ats_jobs(company.careers_url, company)
+
+    assert [(job.title, job.source, job.company) for job in jobs] == [
+        ('Senior Product Manager', 'greenhouse_api', 'Acme'),
+        ('Technical Program Manager', 'greenhouse_api', 'Acme'),
+    ]
+
+
+def test_ats_jobs_reads_each_board_once(scraper, fixture_server):
+    fixture_server.route('GET', '/v1/boards/acme/jobs', Reply(body=fixture_json('ats/greenhouse_jobs.json')))
+    company = Company('Acme', 'Small', 'https://acme.com/careers')
+    listed = {}
+
+    first = scraper.ats_jobs('https://boards.greenhouse.io/acme', company, listed)
+    again = scraper.ats_jobs('https://boards.greenhouse.io/embed/job_board?for=acme', company, listed)
+
+    assert len(first) == 2
+    assert again == []
+    assert fixture_server.paths() == ['/v1/boards/acme/jobs']
+
+
+@pytest.mark.parametrize('reply', [
+    Reply(404, {'status': 404, 'error': 'Job not found'}),
+    Reply(200, b'<html>maintenance</html>', 'text/html'),
+])
+def test_ats_jobs_falls_back_when_the_api_fails(scraper, fixture_server, reply):
+    fixture_server.route('GET', '/v1/boards/acme/jobs', reply)
+    company = Company('Acme', 'Small', 'https://boards.greenhouse.io/acme')
+    assert scraper.ats_jobs(company.careers_url, company) is None
+
+
+def test_scrape_company_scrapes_the_board_html_when_the_api_fails(scraper, fixture_server):
+    # Stand the fixture server in for boards.greenhouse.io, so the HTML fallback is served locally too
+    adapter = scraper.ats_adapters['greenhouse']
+    adapter.HOST_RE = re.compile(r'^127\.0\.0\.1$')
+    fixture_server.route('GET', '/v1/boards/acme/jobs', Reply(500, b'upstream error', 'text/plain'))
+    fixture_server.route('GET', '/acme', Reply(body=fixture_bytes('ats/greenhouse_board.html'), content_type='text/html'))
+    company = Company('Acme', 'Small', fixture_server.url('/acme'))
+
+    jobs = scraper.scrape_company(company)
+
+    assert sorted((job.title, job.url) for job in jobs) == [
+        ('Senior Product Manager', fixture_server.url('/acme/jobs/4012345')),
+        ('Technical Program Manager', fixture_server.url('/acme/jobs/4012347')),
+    ]
+    assert all(not job.source.endswith('_api') for job in jobs)
+    assert '/v1/boards/acme/jobs' in fixture_server.paths()
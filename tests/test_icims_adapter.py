@@ -0,0 +1,97 @@
+import pytest
+
+from ats_adapters import ICIMSAdapter
+from multiplatform_job_scraper import Company
+from conftest import Reply, fixture_bytes
+
+
+def search_pages(*names: str):
+    """Serve recorded search result pages by their pr= index; past the last one iCIMS shows no rows"""
+    pages = [fixture_bytes(f'ats/{name}') for name in names]
+    empty = fixture_bytes('ats/icims_search_empty.html')
+
+    def search(request):
+        index = int(request.query['pr'][0])
+        return Reply(body=pages[index] if index < len(pages) else empty, content_type='text/html')
+    return search
+
+
+def page_indexes(server):
+    return [int(request.query['pr'][0]) for request in server.requests]
+
+
+@pytest.fixture
+def scraper(make_scraper, fixture_server):
+    fixture_server.route('GET', '/jobs/search', search_pages('icims_search_page0.html', 'icims_search_page1.html'))
+    return make_scraper(icims_api_base=fixture_server.base_url)
+
+
+@pytest.mark.parametrize('url, key', [
+    ('https://careers-acme.icims.com/jobs/intro', 'careers-acme.icims.com'),
+    ('https://careers-acme.icims.com/jobs/4012/senior-product-manager/job', 'careers-acme.icims.com'),
+    ('https://acme-careers.icims.com/jobs/search?ss=1', 'acme-careers.icims.com'),
+    ('https://www.icims.com/', None),
+    ('https://acme.com/careers', None),
+])
+def test_board_key(url, key):
+    assert ICIMSAdapter(client=None).board_key(url) == key
+
+
+def test_find_boards():
+    content = (b'<iframe src="https://careers-acme.icims.com/jobs/search?ss=1&in_iframe=1"></iframe>'
+               b'<a href="https://Careers-Acme.icims.com/jobs/intro">All jobs</a>')
+    assert ICIMSAdapter(client=None).find_boards(content) == ['https://careers-acme.icims.com/jobs']
+
+
+def test_list_postings_reads_every_page(scraper, fixture_server):
+    postings = scraper.ats_adapters['icims'].list_postings('https://careers-acme.icims.com/jobs/intro')
+
+    assert [(p.title, p.url, p.location) for p in postings] == [
+        ('Senior Product Manager', 'https://careers-acme.icims.com/jobs/4012/senior-product-manager/job',
+         'US-CO-Denver'),
+        ('Registered Nurse', 'https://careers-acme.icims.com/jobs/4013/registered-nurse/job', 'US-CO-Boulder'),
+        ('Technical Program Manager', 'https://careers-acme.icims.com/jobs/4020/technical-program-manager/job',
+         'US-CO-Boulder'),
+    ]
+    assert page_indexes(fixture_server) == [0, 1, 2]
+    assert fixture_server.requests[0].query == {'ss': ['1'], 'in_iframe': ['1'], 'pr': ['0']}
+
+
+def test_stops_when_a_page_repeats_the_last_one(make_scraper, fixture_server):
+    fixture_server.route('GET', '/jobs/search', search_pages(
+        'icims_search_page0.html', 'icims_search_page1.html', 'icims_search_page1.html', 'icims_search_page1.html'))
+    scraper = make_scraper(icims_api_base=fixture_server.base_url)
+
+    postings = scraper.ats_adapters['icims'].list_postings('https://careers-acme.icims.com/jobs')
+
+    assert len(postings) == 3
+    assert page_indexes(fixture_server) == [0, 1, 2]
+
+
+def test_pages_are_capped_by_ats_max_pages(make_scraper, fixture_server):
+    fixture_server.route('GET', '/jobs/search', search_pages('icims_search_page0.html', 'icims_search_page1.html'))
+    scraper = make_scraper(icims_api_base=fixture_server.base_url, ats_max_pages=1)
+
+    postings = scraper.ats_adapters['icims'].list_postings('https://careers-acme.icims.com/jobs')
+
+    assert [p.title for p in postings] == ['Senior Product Manager', 'Registered Nurse']
+    assert page_indexes(fixture_server) == [0]
+
+
+def test_ats_jobs_keeps_target_roles(scraper):
+    company = Company('Acme', 'Large', 'https://careers-acme.icims.com/jobs/intro')
+
+    jobs = scraper.ats_jobs(company.careers_url, company)
+
+    assert [(job.title, job.source, job.location) for job in jobs] == [
+        ('Senior Product Manager', 'icims_api', 'US-CO-Denver'),
+        ('Technical Program Manager', 'icims_api', 'US-CO-Boulder'),
+    ]
+
+
+def test_ats_jobs_falls_back_when_the_portal_is_down(make_scraper, fixture_server):
+    fixture_server.route('GET', '/jobs/search', Reply(404, b'Not Found', 'text/html'))
+    scraper = make_scraper(icims_api_base=fixture_server.base_url)
+    company = Company('Acme', 'Large', 'https://careers-acme.icims.com/jobs/intro')
+
+    assert scraper.ats_jobs(company.careers_url, company) is None
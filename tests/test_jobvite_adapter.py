@@ -0,0 +1,74 @@
+import pytest
+
+from ats_adapters import JobviteAdapter
+from multiplatform_job_scraper import Company
+from conftest import Reply, fixture_bytes
+
+
+@pytest.fixture
+def scraper(make_scraper, fixture_server):
+    fixture_server.route('GET', '/CompanyJobs/Xml.aspx',
+                         Reply(body=fixture_bytes('ats/jobvite_feed.xml'), content_type='text/xml'))
+    return make_scraper(jobvite_api_base=fixture_server.url('/CompanyJobs/Xml.aspx'))
+
+
+@pytest.mark.parametrize('url, key', [
+    ('https://jobs.jobvite.com/CompanyJobs/Careers.aspx?c=qZx9Vfw1', 'qZx9Vfw1'),
+    ('https://hire.jobvite.com/CompanyJobs/Careers.aspx?k=JobListing&c=qZx9Vfw1', 'qZx9Vfw1'),
+    ('https://app.jobvite.com/CompanyJobs/Xml.aspx?c=qZx9Vfw1', 'qZx9Vfw1'),
+    # Career sites addressed by slug carry no company code, so they are scraped instead
+    ('https://jobs.jobvite.com/acme/jobs', None),
+    ('https://acme.com/careers?c=qZx9Vfw1', None),
+])
+def test_board_key(url, key):
+    assert JobviteAdapter(client=None).board_key(url) == key
+
+
+def test_find_boards_in_embeds():
+    content = (b'<script src="https://jobs.jobvite.com/__assets__/scripts/careersite/public/iframe.js"></script>'
+               b'<iframe src="https://jobs.jobvite.com/CompanyJobs/Careers.aspx?k=JobListing&amp;c=qZx9Vfw1"></iframe>'
+               b'<a href="https://hire.jobvite.com/CompanyJobs/Careers.aspx?c=qZx9Vfw1&page=Jobs">Jobs</a>')
+    assert JobviteAdapter(client=None).find_boards(content) == [
+        'https://jobs.jobvite.com/CompanyJobs/Careers.aspx?c=qZx9Vfw1']
+
+
+def test_list_postings_maps_the_feed(scraper, fixture_server):
+    postings = scraper.ats_adapters['jobvite'].list_postings(
+        'https://jobs.jobvite.com/CompanyJobs/Careers.aspx?c=qZx9Vfw1')
+
+    assert [(p.title, p.url, p.location, p.date_posted, p.team) for p in postings] == [
+        ('Senior Product Manager', 'https://jobs.jobvite.com/acme/job/oZx3vfwA', 'Denver, CO', '2026-09-05', 'Product'),
+        ('Barista', 'https://jobs.jobvite.com/acme/job/oAb12cdE', 'Boulder, CO', '2026-09-06', 'Cafe'),
+        ('Technical Program Manager', 'https://jobs.jobvite.com/acme/job/oQw98erT/apply', 'Boulder, CO',
+         '2026-10-11', ''),
+    ]
+    assert postings[0].description == 'Own the roadmap for our platform. Work with engineering'
+    assert [(r.path, r.query) for r in fixture_server.requests] == [('/CompanyJobs/Xml.aspx', {'c': ['qZx9Vfw1']})]
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('9/5/2026', '2026-09-05'),
+    ('12/31/2025', '2025-12-31'),
+    ('2026-09-05', '2026-09-05'),
+    ('', ''),
+    (None, ''),
+])
+def test_posted_date(value, expected):
+    assert JobviteAdapter(client=None).posted_date(value) == expected
+
+
+def test_ats_jobs_keeps_target_roles(scraper):
+    company = Company('Acme', 'Small', 'https://jobs.jobvite.com/CompanyJobs/Careers.aspx?c=qZx9Vfw1')
+
+    jobs = scraper.ats_jobs(company.careers_url, company)
+
+    assert [(job.title, job.source) for job in jobs] == [
+        ('Senior Product Manager', 'jobvite_api'), ('Technical Program Manager', 'jobvite_api')]
+
+
+def test_ats_jobs_falls_back_on_a_broken_feed(make_scraper, fixture_server):
+    fixture_server.route('GET', '/CompanyJobs/Xml.aspx', Reply(200, b'<result><job><title>Cut o', 'text/xml'))
+    scraper = make_scraper(jobvite_api_base=fixture_server.url('/CompanyJobs/Xml.aspx'))
+    company = Company('Acme', 'Small', 'https://jobs.jobvite.com/CompanyJobs/Careers.aspx?c=qZx9Vfw1')
+
+    assert scraper.ats_jobs(company.careers_url, company) is None
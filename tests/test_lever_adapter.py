@@ -0,0 +1,88 @@
+import pytest
+
+from ats_adapters import LeverAdapter
+from multiplatform_job_scraper import Company
+from conftest import Reply, fixture_bytes
+
+
+@pytest.fixture
+def postings_route(fixture_server):
+    fixture_server.route('GET', '/v0/postings/better', Reply(body=fixture_bytes('ats/lever_postings.json')))
+    fixture_server.route('GET', '/eu/v0/postings/better', Reply(body=fixture_bytes('ats/lever_postings.json')))
+    return fixture_server
+
+
+@pytest.mark.parametrize('url, key', [
+    ('https://jobs.lever.co/better', ('better', False)),
+    ('https://jobs.lever.co/better/5a9b1f0e-2c1d-4e7a-9c55-0d1b7e6f3a21/apply', ('better', False)),
+    ('https://api.lever.co/v0/postings/better?mode=json', ('better', False)),
+    ('https://jobs.eu.lever.co/better', ('better', True)),
+    ('https://api.eu.lever.co/v0/postings/better', ('better', True)),
+    ('https://jobs.lever.co/', None),
+    ('https://api.lever.co/v0/postings', None),
+    ('https://www.lever.co/customers', None),
+    ('https://better.com/careers', None),
+])
+def test_board_key(url, key):
+    assert LeverAdapter(client=None).board_key(url) == key
+
+
+def test_find_boards_keeps_eu_sites_apart():
+    content = (b'<a href="https://jobs.lever.co/better">Jobs</a>'
+               b'<script src="https://api.lever.co/v0/postings/better?mode=json"></script>'
+               b'<a href="https://jobs.eu.lever.co/better">EU jobs</a>'
+               b'<link rel="icon" href="https://jobs.lever.co/favicon.ico">')
+    assert LeverAdapter(client=None).find_boards(content) == [
+        'https://jobs.lever.co/better', 'https://jobs.eu.lever.co/better']
+
+
+def test_list_postings_maps_recorded_site(make_scraper, postings_route):
+    scraper = make_scraper(lever_api_base=postings_route.url('/v0/postings'))
+
+    postings = scraper.ats_adapters['lever'].list_postings('https://jobs.lever.co/better')
+
+    assert [(p.title, p.location, p.team, p.date_posted) for p in postings] == [
+        ('Senior Product Manager, Mortgage', 'New York, NY', 'Product / Home Lending', '2025-10-01'),
+        ('Program Manager', 'Remote', 'Ops', '2025-09-27'),
+        ('Loan Officer', 'Charlotte, NC, Austin, TX', 'Sales', '2025-10-07'),
+    ]
+    assert postings[0].url == 'https://jobs.lever.co/better/5a9b1f0e-2c1d-4e7a-9c55-0d1b7e6f3a21'
+    assert postings[0].description == 'Better is hiring a Senior Product Manager to own our mortgage experience.'
+    assert [(r.path, r.query) for r in postings_route.requests] == [('/v0/postings/better', {'mode': ['json']})]
+
+
+def test_eu_sites_use_the_eu_api(make_scraper, postings_route):
+    scraper = make_scraper()
+    adapter = LeverAdapter(scraper, api_base=postings_route.url('/v0/postings'),
+                           eu_api_base=postings_route.url('/eu/v0/postings'))
+
+    postings = adapter.list_postings('https://jobs.eu.lever.co/better')
+
+    assert len(postings) == 3
+    assert postings_route.paths() == ['/eu/v0/postings/better']
+
+
+def test_lever_filters_become_query_parameters(make_scraper, postings_route):
+    scraper = make_scraper(lever_api_base=postings_route.url('/v0/postings'), lever_filters={
+        'team': 'Home Lending',
+        'location': ['New York, NY', 'Remote'],
+        'level': '',           # Empty filters are dropped
+        'salary': 'over 9000'  # Lever has no such filter
+    })
+
+    scraper.ats_adapters['lever'].list_postings('https://jobs.lever.co/better')
+
+    assert postings_route.requests[0].query == {
+        'mode': ['json'], 'team': ['Home Lending'], 'location': ['New York, NY', 'Remote']}
+
+
+def test_ats_jobs_tags_lever_listings(make_scraper, postings_route):
+    scraper = make_scraper(lever_api_base=postings_route.url('/v0/postings'))
+    company = Company('Better', 'Large', 'https://jobs.lever.co/better')
+
+    jobs = scraper.ats_jobs(company.careers_url, company)
+
+    assert [(job.title, job.source, job.team, job.date_posted) for job in jobs] == [
+        ('Senior Product Manager, Mortgage', 'lever_api', 'Product / Home Lending', '2025-10-01'),
+        ('Program Manager', 'lever_api', 'Ops', '2025-09-27'),
+    ]
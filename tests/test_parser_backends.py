@@ -0,0 +1,32 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from parser_backends import BACKENDS, ParserBackend, get_backend
+
+PAGE = b'<html><body><div class="job"><h3>Senior Product Manager</h3></div></body></html>'
+
+
+def test_backends_must_implement_parse():
+    class Unfinished(ParserBackend):
+        name = 'unfinished'
+
+    with pytest.raises(TypeError):
+        ParserBackend()
+    with pytest.raises(TypeError):
+        Unfinished()
+
+
+@pytest.mark.parametrize('name', [name for name, backend in BACKENDS.items() if backend.available()])
+def test_every_available_backend_parses_a_page(name):
+    tree = BACKENDS[name].parse(PAGE)
+
+    assert tree is not None
+    if BACKENDS[name].produces_soup:
+        assert tree.select_one('.job h3').get_text() == 'Senior Product Manager'
+
+
+def test_backends_without_a_soup_fall_back_to_html_parser():
+    assert get_backend('lxml-etree').name == 'html.parser'
+    assert get_backend('lxml-etree', require_soup=False).name in ('lxml-etree', 'html.parser')
+    assert get_backend('no-such-parser').name == 'html.parser'
+    assert isinstance(get_backend().parse(PAGE), BeautifulSoup)
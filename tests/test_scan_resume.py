@@ -0,0 +1,64 @@
+import json
+import os
+import time
+
+from conftest import Reply
+
+JOB_PAGE = (b'<html><body><div class="job"><h3>Senior Product Manager</h3>'
+            b'<span class="location">Denver, CO</span></div></body></html>')
+
+
+def slow(body: bytes, seconds: float):
+    def reply(request):
+        time.sleep(seconds)
+        return Reply(body=body, content_type='text/html')
+    return reply
+
+
+def company_stats(tmp_path):
+    with open(tmp_path / 'results' / 'company_stats.json') as f:
+        return json.load(f)
+
+
+def test_resume_after_a_deadline_cut_counts_each_scan_once(make_scraper, fixture_server, tmp_path):
+    fixture_server.route('GET', '/a/', slow(JOB_PAGE, 0.6))
+    fixture_server.route('GET', '/b/', Reply(body=JOB_PAGE, content_type='text/html'))
+    companies = tmp_path / 'companies.csv'
+    companies.write_text("Company,Company_Size,Careers URL\n"
+                         f"A,Small,{fixture_server.url('/a/')}\nB,Small,{fixture_server.url('/b/')}\n")
+    settings = dict(scan_deadline_margin_seconds=0.5, ats_adapters_enabled=False)
+    journal = tmp_path / '.cache' / 'checkpoints' / 'scan-cut.jsonl'
+
+    # A uses up the scan before B can start, so the journal is kept and stats are saved with A in them
+    scraper = make_scraper(**settings)
+    scraper.run_scan(str(companies), max_workers=1, deadline_minutes=1.0 / 60, scan_id='cut')
+    assert scraper.not_started_companies == ['B']
+    assert os.path.exists(journal)
+    assert company_stats(tmp_path)['A']['scans'] == 1
+
+    jobs = make_scraper(**settings).run_scan(str(companies), max_workers=1, resume=True, scan_id='cut')
+
+    assert sorted(job.company for job in jobs) == ['A', 'B']
+    stats = company_stats(tmp_path)
+    assert (stats['A']['scans'], stats['A']['hits']) == (1, 1)
+    assert (stats['B']['scans'], stats['B']['hits']) == (1, 1)
+    assert not os.path.exists(journal)
+
+
+def test_resume_after_a_kill_replays_unsaved_outcomes(make_scraper, fixture_server, tmp_path):
+    fixture_server.route('GET', '/b/', Reply(body=JOB_PAGE, content_type='text/html'))
+    companies = tmp_path / 'companies.csv'
+    companies.write_text("Company,Company_Size,Careers URL\n"
+                         f"A,Small,{fixture_server.url('/a/')}\nB,Small,{fixture_server.url('/b/')}\n")
+    # A killed run journaled A but never got to save stats
+    journal = tmp_path / '.cache' / 'checkpoints' / 'scan-killed.jsonl'
+    journal.parent.mkdir(parents=True)
+    journal.write_text(json.dumps({'scan_id': 'killed', 'company': 'A', 'status': 'empty', 'seconds': 0.2,
+                                   'finished_at': time.time(), 'jobs': []}) + '\n')
+
+    make_scraper(ats_adapters_enabled=False).run_scan(str(companies), max_workers=1, resume=True, scan_id='killed')
+
+    stats = company_stats(tmp_path)
+    assert (stats['A']['scans'], stats['A']['empty_streak']) == (1, 1)
+    assert stats['B']['scans'] == 1
+    assert fixture_server.paths() == ['/b/']
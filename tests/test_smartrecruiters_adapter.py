@@ -0,0 +1,109 @@
+import pytest
+
+from ats_adapters import SmartRecruitersAdapter
+from multiplatform_job_scraper import Company
+from conftest import Reply, fixture_json
+
+POSTINGS = '/v1/companies/AcmeCorp/postings'
+
+
+def posting_api(results: dict):
+    """Serve the recorded postings one limit/offset window at a time, as the Posting API does"""
+    def postings(request):
+        offset, limit = int(request.query['offset'][0]), int(request.query['limit'][0])
+        return Reply(body={**results, 'offset': offset, 'limit': limit,
+                           'content': results['content'][offset:offset + limit]})
+    return postings
+
+
+@pytest.fixture
+def api(fixture_server):
+    fixture_server.route('GET', POSTINGS, posting_api(fixture_json('ats/smartrecruiters_postings.json')))
+    return fixture_server
+
+
+@pytest.fixture
+def scraper(make_scraper, api):
+    return make_scraper(smartrecruiters_api_base=api.url('/v1/companies'))
+
+
+def offsets(server):
+    return [int(request.query['offset'][0]) for request in server.requests]
+
+
+@pytest.mark.parametrize('url, key', [
+    ('https://jobs.smartrecruiters.com/AcmeCorp', 'AcmeCorp'),
+    ('https://jobs.smartrecruiters.com/AcmeCorp/744000081234501-senior-product-manager', 'AcmeCorp'),
+    ('https://careers.smartrecruiters.com/AcmeCorp', 'AcmeCorp'),
+    ('https://api.smartrecruiters.com/v1/companies/AcmeCorp/postings', 'AcmeCorp'),
+    ('https://jobs.smartrecruiters.com/', None),
+    ('https://www.smartrecruiters.com/customers', None),
+    ('https://acme.com/careers', None),
+])
+def test_board_key(url, key):
+    assert SmartRecruitersAdapter(client=None).board_key(url) == key
+
+
+def test_find_boards():
+    content = (b'<a href="https://jobs.smartrecruiters.com/AcmeCorp">Open roles</a>'
+               b'<a href="https://careers.smartrecruiters.com/AcmeCorp/engineering">Engineering</a>')
+    assert SmartRecruitersAdapter(client=None).find_boards(content) == ['https://jobs.smartrecruiters.com/AcmeCorp']
+
+
+def test_list_postings_maps_recorded_postings(scraper, api):
+    postings = scraper.ats_adapters['smartrecruiters'].list_postings('https://jobs.smartrecruiters.com/AcmeCorp')
+
+    assert [(p.title, p.url, p.location, p.date_posted, p.team) for p in postings] == [
+        ('Senior Product Manager', 'https://jobs.smartrecruiters.com/AcmeCorp/744000081234501', 'Denver, CO, US',
+         '2026-09-30', 'Product'),
+        ('Warehouse Associate', 'https://jobs.smartrecruiters.com/AcmeCorp/744000081234502', 'Aurora, CO, US',
+         '2026-10-02', ''),
+        ('Technical Program Manager', 'https://jobs.smartrecruiters.com/AcmeCorp/744000081234503', 'US, Remote',
+         '2026-10-05', 'Engineering'),
+        ('Product Owner', 'https://jobs.smartrecruiters.com/AcmeCorp/744000081234504', 'Berlin, DE, Remote',
+         '2026-10-06', 'Product'),
+        ('Business Analyst', 'https://jobs.smartrecruiters.com/AcmeCorp/744000081234505', 'Boulder, CO, US',
+         '2026-10-07', ''),
+    ]
+    assert offsets(api) == [0]
+    assert api.requests[0].query['limit'] == ['100']
+
+
+def test_pages_until_every_posting_is_read(scraper, api, monkeypatch):
+    monkeypatch.setattr(SmartRecruitersAdapter, 'PAGE_SIZE', 2)
+
+    postings = scraper.ats_adapters['smartrecruiters'].list_postings('https://jobs.smartrecruiters.com/AcmeCorp')
+
+    assert len(postings) == 5
+    assert offsets(api) == [0, 2, 4]
+
+
+def test_pages_are_capped_by_ats_max_pages(make_scraper, api, monkeypatch):
+    monkeypatch.setattr(SmartRecruitersAdapter, 'PAGE_SIZE', 2)
+    scraper = make_scraper(smartrecruiters_api_base=api.url('/v1/companies'), ats_max_pages=2)
+
+    postings = scraper.ats_adapters['smartrecruiters'].list_postings('https://jobs.smartrecruiters.com/AcmeCorp')
+
+    assert len(postings) == 4
+    assert offsets(api) == [0, 2]
+
+
+def test_ats_jobs_keeps_target_roles(scraper):
+    company = Company('Acme', 'Large', 'https://jobs.smartrecruiters.com/AcmeCorp')
+
+    jobs = scraper.ats_jobs(company.careers_url, company)
+
+    assert [(job.title, job.source) for job in jobs] == [
+        ('Senior Product Manager', 'smartrecruiters_api'),
+        ('Technical Program Manager', 'smartrecruiters_api'),
+        ('Product Owner', 'smartrecruiters_api'),
+        ('Business Analyst', 'smartrecruiters_api'),
+    ]
+
+
+def test_ats_jobs_falls_back_when_the_company_is_unknown(make_scraper, fixture_server):
+    fixture_server.route('GET', POSTINGS, Reply(404, {'code': 'NOT_FOUND', 'message': 'Company not found'}))
+    scraper = make_scraper(smartrecruiters_api_base=fixture_server.url('/v1/companies'))
+    company = Company('Acme', 'Large', 'https://jobs.smartrecruiters.com/AcmeCorp')
+
+    assert scraper.ats_jobs(company.careers_url, company) is None
@@ -0,0 +1,189 @@
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ats_adapters import WorkdayAdapter
+from multiplatform_job_scraper import Company
+from scan_budget import Deadline, deadline_scope
+from conftest import Reply, fixture_bytes, fixture_json
+
+ENDPOINT = '/wday/cxs/acme/External/jobs'
+
+
+def days_ago(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def cxs_search(results: dict, delay: float = 0):
+    """Serve the recorded results the way the CXS API does: one limit/offset window, total on the first page"""
+    def search(request):
+        time.sleep(delay)
+        offset, limit = request.body['offset'], request.body['limit']
+        return Reply(body={**results, 'total': results['total'] if offset == 0 else 0,
+                           'jobPostings': results['jobPostings'][offset:offset + limit]})
+    return search
+
+
+@pytest.fixture
+def cxs(fixture_server, monkeypatch):
+    monkeypatch.setattr(WorkdayAdapter, 'PAGE_SIZE', 2)
+    fixture_server.route('POST', ENDPOINT, cxs_search(fixture_json('ats/workday_jobs.json')))
+    return fixture_server
+
+
+def make_adapter(make_scraper, server, **settings) -> WorkdayAdapter:
+    scraper = make_scraper(workday_api_base=server.base_url, **settings)
+    return scraper.ats_adapters['workday']
+
+
+def searches(server):
+    return [(r.body['searchText'], r.body['offset']) for r in server.requests if r.method == 'POST']
+
+
+@pytest.mark.parametrize('url, key', [
+    ('https://acme.wd5.myworkdayjobs.com/External', ('acme.wd5.myworkdayjobs.com', 'acme', 'External')),
+    ('https://acme.wd5.myworkdayjobs.com/en-US/External/job/Denver-CO/PM_JR101',
+     ('acme.wd5.myworkdayjobs.com', 'acme', 'External')),
+    ('https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/jobs', ('acme.wd5.myworkdayjobs.com', 'acme', 'External')),
+    ('https://wd5.myworkdaysite.com/recruiting/acme/External', ('wd5.myworkdaysite.com', 'acme', 'External')),
+    ('https://wd5.myworkdaysite.com/en-US/recruiting/acme/External/job/Denver-CO/PM_JR101',
+     ('wd5.myworkdaysite.com', 'acme', 'External')),
+    ('https://acme.wd5.myworkdayjobs.com/', None),
+    ('https://wd5.myworkdaysite.com/', None),
+    ('https://www.workday.com/en-us/careers.html', None),
+])
+def test_board_key(url, key):
+    assert WorkdayAdapter(client=None, terms=[]).board_key(url) == key
+
+
+def test_pages_are_capped_per_term(make_scraper, cxs):
+    adapter = make_adapter(make_scraper, cxs, workday_search_terms=['product manager', 'pmo'],
+                           workday_max_pages_per_term=2)
+
+    postings = adapter.list_postings('https://acme.wd5.myworkdayjobs.com/External')
+
+    # Five hits at two per page: the first two pages are read, the third is over the cap
+    assert sorted(searches(cxs)) == [('pmo', 0), ('pmo', 2), ('product manager', 0), ('product manager', 2)]
+    assert all(sorted(r.body) == ['appliedFacets', 'limit', 'offset', 'searchText'] and r.body['limit'] == 2
+               for r in cxs.requests)
+    assert len(postings) == 4
+
+
+def test_every_page_is_read_within_the_cap(make_scraper, cxs):
+    adapter = make_adapter(make_scraper, cxs, workday_search_terms=['product manager'], workday_max_pages_per_term=5)
+
+    postings = adapter.list_postings('https://acme.wd5.myworkdayjobs.com/External')
+
+    assert sorted(searches(cxs)) == [('product manager', 0), ('product manager', 2), ('product manager', 4)]
+    assert [p.title for p in postings] == [
+        'Senior Product Manager', 'Product Manager, Analytics', 'Principal Product Manager',
+        'Product Manager II', 'Associate Product Manager']
+
+
+def test_search_terms_are_capped(make_scraper, cxs):
+    adapter = make_adapter(make_scraper, cxs, workday_search_terms=['product manager', 'product owner', 'pmo'],
+                           workday_max_terms=2, workday_max_pages_per_term=1)
+
+    adapter.list_postings('https://acme.wd5.myworkdayjobs.com/External')
+
+    assert sorted(searches(cxs)) == [('product manager', 0), ('product owner', 0)]
+
+
+def test_default_caps_bound_the_requests_per_board(make_scraper, cxs):
+    adapter = make_adapter(make_scraper, cxs)
+
+    adapter.list_postings('https://acme.wd5.myworkdayjobs.com/External')
+
+    assert (len(adapter.terms), adapter.max_pages) == (6, 2)
+    assert len(searches(cxs)) <= 12
+
+
+def test_searching_stops_when_the_company_budget_is_nearly_used(make_scraper, fixture_server, monkeypatch):
+    monkeypatch.setattr(WorkdayAdapter, 'PAGE_SIZE', 2)
+    fixture_server.route('POST', ENDPOINT, cxs_search(fixture_json('ats/workday_jobs.json'), delay=0.4))
+    adapter = make_adapter(make_scraper, fixture_server, workday_search_terms=['product manager'],
+                           workday_max_pages_per_term=5, workday_max_concurrency=1,
+                           workday_budget_reserve_seconds=0.9)
+
+    # Each search takes 0.4s: the third would start with under 0.9s of the 1.5s budget left
+    with deadline_scope(Deadline(1.5)):
+        postings = adapter.list_postings('https://acme.wd5.myworkdayjobs.com/External')
+
+    assert searches(fixture_server) == [('product manager', 0), ('product manager', 2)]
+    assert len(postings) == 4
+
+
+def test_postings_found_by_several_terms_are_kept_once(make_scraper, cxs):
+    adapter = make_adapter(make_scraper, cxs, workday_search_terms=['product manager', 'senior product manager'],
+                           workday_max_pages_per_term=3)
+
+    postings = adapter.list_postings('https://acme.wd5.myworkdayjobs.com/External')
+
+    assert len(searches(cxs)) == 6
+    assert len(postings) == 5
+    assert len({p.url for p in postings}) == 5
+
+
+def test_posting_mapping(make_scraper, cxs):
+    adapter = make_adapter(make_scraper, cxs, workday_search_terms=['product manager'], workday_max_pages_per_term=3)
+
+    postings = adapter.list_postings('https://acme.wd5.myworkdayjobs.com/en-US/External')
+
+    assert [(p.url, p.location, p.date_posted) for p in postings] == [
+        ('https://acme.wd5.myworkdayjobs.com/External/job/Denver-CO/Senior-Product-Manager_JR101', 'Denver, CO',
+         days_ago(0)),
+        ('https://acme.wd5.myworkdayjobs.com/External/job/Boulder-CO/Product-Manager--Analytics_JR102', 'Boulder, CO',
+         days_ago(1)),
+        ('https://acme.wd5.myworkdayjobs.com/External/job/Remote-USA/Principal-Product-Manager_JR103', '2 Locations',
+         days_ago(3)),
+        ('https://acme.wd5.myworkdayjobs.com/External/job/Irvine-CA/Product-Manager-II_JR104', 'Irvine, CA', ''),
+        ('https://acme.wd5.myworkdayjobs.com/External/job/Denver-CO/Associate-Product-Manager_JR105', 'Denver, CO',
+         days_ago(12)),
+    ]
+
+
+def test_myworkdaysite_postings_keep_the_recruiting_path(make_scraper, cxs):
+    adapter = make_adapter(make_scraper, cxs, workday_search_terms=['product manager'], workday_max_pages_per_term=1)
+
+    postings = adapter.list_postings('https://wd5.myworkdaysite.com/en-US/recruiting/acme/External')
+
+    assert postings[0].url == ('https://wd5.myworkdaysite.com/recruiting/acme/External'
+                               '/job/Denver-CO/Senior-Product-Manager_JR101')
+
+
+@pytest.mark.parametrize('posted_on, expected', [
+    ('Posted Today', days_ago(0)),
+    ('Posted Yesterday', days_ago(1)),
+    ('Posted 1 Day Ago', days_ago(1)),
+    ('Posted 29 Days Ago', days_ago(29)),
+    ('Posted 30+ Days Ago', ''),
+    (None, ''),
+])
+def test_posted_date(posted_on, expected):
+    assert WorkdayAdapter(client=None, terms=[]).posted_date(posted_on) == expected
+
+
+def test_ats_jobs_falls_back_when_the_search_fails(make_scraper, fixture_server):
+    fixture_server.route('POST', ENDPOINT, Reply(500, {'errorCode': 'S22', 'message': 'Internal error'}))
+    scraper = make_scraper(workday_api_base=fixture_server.base_url, workday_search_terms=['product manager'])
+    company = Company('Acme', 'Large', 'https://acme.wd5.myworkdayjobs.com/External')
+
+    assert scraper.ats_jobs(company.careers_url, company) is None
+
+
+def test_scrape_company_scrapes_the_site_html_when_the_search_fails(make_scraper, fixture_server):
+    fixture_server.route('POST', ENDPOINT, Reply(500, {'errorCode': 'S22', 'message': 'Internal error'}))
+    fixture_server.route('GET', '/recruiting/acme/External',
+                         Reply(body=fixture_bytes('ats/workday_site.html'), content_type='text/html'))
+    scraper = make_scraper(workday_api_base=fixture_server.base_url, workday_search_terms=['product manager'])
+    # Stand the fixture server in for a myworkdaysite.com host, so the HTML fallback is served locally too
+    scraper.ats_adapters['workday'].HOST_RE = re.compile(r'^(?:(acme)\.)?127\.0\.0\.(1)$')
+    company = Company('Acme', 'Large', fixture_server.url('/recruiting/acme/External'))
+
+    jobs = scraper.scrape_company(company)
+
+    assert [(job.title, job.url) for job in jobs] == [
+        ('Senior Product Manager', fixture_server.url('/recruiting/acme/External/job/Denver-CO/Senior-Product-Manager_JR101'))]
+    assert ENDPOINT in fixture_server.paths('POST')
@@ -0,0 +1,91 @@
+from typing import Dict, List, Tuple
+
+from bs4 import CData, NavigableString, Tag
+
+# What get_text() collects when a tag does not say otherwise
+DEFAULT_STRING_TYPES = (NavigableString, CData)
+
+
+def _string_types(tag: Tag):
+    return getattr(tag, 'interesting_string_types', None) or DEFAULT_STRING_TYPES
+
+
+def _wanted(string: NavigableString, types) -> bool:
+    if isinstance(types, type):
+        return type(string) is types
+    return type(string) in types
+
+
+class TextCache:
+    """get_text() results for the elements of one parsed document.
+
+    Extraction asks for the text of the same nodes many times: every ancestor
+    while climbing to a job container, then again for titles, descriptions and
+    fallback lines. Each get_text() call walks the whole subtree, so nested
+    containers made this quadratic. Here an element's text is built from the
+    cached text of its children, so each text node is visited once however
+    many ancestors are asked for, with the same result as get_text().
+
+    Entries are keyed by node identity and hold a reference to the node, so a
+    cache must not outlive (or be shared across) documents.
+    """
+
+    def __init__(self):
+        self._texts: Dict[int, Tuple[Tag, str]] = {}
+        self._stripped: Dict[int, str] = {}
+        self._lines: Dict[int, List[str]] = {}
+
+    def text(self, element) -> str:
+        """element.get_text()"""
+        if not isinstance(element, Tag):
+            return element.get_text()
+        cached = self._texts.get(id(element))
+        if cached is not None:
+            return cached[1]
+
+        # Post-order without recursion, since malformed pages can nest very deeply
+        stack = [(element, False)]
+        while stack:
+            tag, children_done = stack.pop()
+            if id(tag) in self._texts:
+                continue
+            types = _string_types(tag)
+            if not children_done:
+                stack.append((tag, True))
+                stack.extend((child, False) for child in tag.children
+                             if isinstance(child, Tag) and _string_types(child) == types
+                             and id(child) not in self._texts)
+                continue
+
+            parts = []
+            for child in tag.children:
+                if isinstance(child, Tag):
+                    if _string_types(child) == types:
+                        parts.append(self._texts[id(child)][1])
+                    else:
+                        # <script>, <style> and friends keep other string types than their parent
+                        parts.append(child.get_text(types=types))
+                elif isinstance(child, NavigableString) and _wanted(child, types):
+                    parts.append(child)
+            self._texts[id(tag)] = (tag, ''.join(parts))
+        return self._texts[id(element)][1]
+
+    def stripped(self, element) -> str:
+        """element.get_text().strip()"""
+        if not isinstance(element, Tag):
+            return element.get_text().strip()
+        key = id(element)
+        text = self._stripped.get(key)
+        if text is None:
+            text = self._stripped[key] = self.text(element).strip()
+        return text
+
+    def lines(self, element) -> List[str]:
+        """Non-blank lines of the element's text, stripped"""
+        if not isinstance(element, Tag):
+            return [line.strip() for line in element.get_text().split('\n') if line.strip()]
+        key = id(element)
+        lines = self._lines.get(key)
+        if lines is None:
+            lines = self._lines[key] = [line.strip() for line in self.text(element).split('\n') if line.strip()]
+        return lines
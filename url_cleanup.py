@@ -3,6 +3,11 @@ import requests
 from urllib.parse import urlparse, urljoin
 import time
 import re
+from career_probe import race_probe
+from rate_limiter import HostRateLimiter
+
+# Rate limiting per host, shared by concurrent careers page probes
+probe_limiter = HostRateLimiter(requests_per_second=2.0, burst=2, max_concurrent_per_host=2)
 
 def clean_url(url):
     """Clean and normalize URL"""
@@ -56,20 +61,18 @@ def find_careers_page(company_name, base_url=None):
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
     
-    for base in potential_sites:
-        for pattern in careers_patterns:
-            try:
-                test_url = base + pattern
-                response = requests.head(test_url, headers=headers, timeout=5, allow_redirects=True)
-                
-                if response.status_code == 200:
-                    print(f"✅ Found: {company_name} -> {test_url}")
-                    return test_url
-                    
-                time.sleep(0.5)  # Rate limiting
-                
-            except Exception as e:
-                continue
+    def probe(test_url):
+        with probe_limiter.limit(urlparse(test_url).netloc):
+            response = requests.head(test_url, headers=headers, timeout=5, allow_redirects=True)
+        return response.status_code == 200
+    
+    # Race every candidate at once; the earliest one in the list that answers 200 wins
+    candidates = [base + pattern for base in potential_sites for pattern in careers_patterns]
+    hit = race_probe(candidates, probe, max_workers=8)
+    if hit:
+        test_url = hit[0]
+        print(f"✅ Found: {company_name} -> {test_url}")
+        return test_url
     
     print(f"❌ No careers page found for: {company_name}")
     return None